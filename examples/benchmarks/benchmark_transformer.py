@@ -0,0 +1,54 @@
+"""
+Throughput of the HandwritingSampleTransformer numeric kernels.
+
+Run from the repository root:
+    python examples/benchmarks/benchmark_transformer.py [size]
+"""
+import sys
+import time
+import numpy as np
+from handwriting_sample.transformer import HandwritingSampleTransformer as Transformer
+
+
+def measure(function, repeat=5):
+    """Returns the best time of the function call in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(size=10 ** 7):
+    """Prints the throughput of the transformer kernels on arrays of the given size"""
+
+    # Prepare the data (raw integer values as read from an SVC file)
+    rng = np.random.default_rng(0)
+    raw = rng.integers(0, Transformer.MAX_PRESSURE_VALUE, size=size)
+    timestamps = np.cumsum(rng.integers(7, 9, size=size)) + 354642400
+    tilts = rng.integers(-90, 91, size=(2, size))
+    buffer = np.empty(size, dtype=float)
+
+    kernels = {
+        "normalize_time_series": lambda: Transformer.normalize_time_series(raw, 1056),
+        "normalize_time_series (out=)": lambda: Transformer.normalize_time_series(raw, 1056, out=buffer),
+        "normalize_pressure": lambda: Transformer.normalize_pressure(raw),
+        "normalize_pressure (out=)": lambda: Transformer.normalize_pressure(raw, out=buffer),
+        "transform_time_to_seconds": lambda: Transformer.transform_time_to_seconds(timestamps),
+        "transform_time_to_seconds (out=)": lambda: Transformer.transform_time_to_seconds(timestamps, out=buffer),
+        "transform_angle": lambda: Transformer.transform_angle(raw, Transformer.MAX_TILT_VALUE, 90),
+        "transform_angle (out=)": lambda: Transformer.transform_angle(raw, Transformer.MAX_TILT_VALUE, 90, out=buffer),
+        "revert_axis": lambda: Transformer.revert_axis(raw, Transformer.MAX_PRESSURE_VALUE),
+        "revert_axis (out=)": lambda: Transformer.revert_axis(raw, Transformer.MAX_PRESSURE_VALUE, out=buffer),
+        "transform_tilt_xy_to_azimuth_and_tilt": lambda: Transformer.transform_tilt_xy_to_azimuth_and_tilt(*tilts),
+    }
+
+    print(f"Array size: {size:,} elements")
+    for name, kernel in kernels.items():
+        elapsed = measure(kernel)
+        print(f"{name:<40} {elapsed * 1e3:9.2f} ms {size / elapsed / 1e6:9.1f} M elements/s")
+
+
+if __name__ == "__main__":
+    main(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7)
@@ -0,0 +1,131 @@
+import numpy as np
+from examples.tests.common_test_data import *
+
+
+def _derivative_loop(values, time, pen_status):
+    derivative = np.zeros(len(values))
+    for i in range(len(values)):
+        previous = i - 1 if i > 0 and pen_status[i - 1] == pen_status[i] else i
+        following = i + 1 if i < len(values) - 1 and pen_status[i + 1] == pen_status[i] else i
+        if time[following] != time[previous]:
+            derivative[i] = (values[following] - values[previous]) / (time[following] - time[previous])
+    return derivative
+
+
+def test_kinematics():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    sample.transform_all_units()
+
+    kinematics = sample.kinematics
+    velocity_x = _derivative_loop(sample.x, sample.time, sample.pen_status)
+    velocity_y = _derivative_loop(sample.y, sample.time, sample.pen_status)
+
+    assert set(kinematics) == set(sample.analyzer.KINEMATICS)
+    assert np.allclose(kinematics["velocity_x"], velocity_x)
+    assert np.allclose(sample.velocity, np.hypot(velocity_x, velocity_y))
+    assert np.allclose(kinematics["acceleration_x"], _derivative_loop(velocity_x, sample.time, sample.pen_status))
+    assert np.isfinite(sample.jerk).all() and np.isfinite(sample.angular_velocity).all()
+
+
+def test_kinematics_with_zero_time_difference():
+    velocity = HandwritingSample.analyzer.compute_kinematics(
+        x=[0, 1, 2, 3, 5], y=[0, 0, 0, 0, 0], time=[0, 1, 1, 1, 2], pen_status=[1, 1, 1, 1, 0])["velocity_x"]
+
+    assert np.array_equal(velocity, [1, 2, 0, 0, 0])
+
+
+def test_kinematics_are_cached():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    velocity = sample.velocity
+    assert sample.velocity is velocity
+
+    sample.transform_axis_to_mm()
+    assert sample.velocity is not velocity
+    assert np.allclose(sample.velocity, velocity * 25.4 / 5080)
+
+
+def _oscillating_sample(frequency, duration=2000, period=5):
+    time = np.arange(0, duration, period)
+    x = 100 + np.arange(time.size) + 10 * np.sin(2 * np.pi * frequency * time / 1000)
+    pen_status = np.ones(time.size, dtype=int)
+    pen_status[time.size // 2:time.size // 2 + 10] = 0
+    zeros = np.zeros(time.size)
+    return HandwritingSample(x=x, y=np.full(time.size, 50.0), time=time, pen_status=pen_status,
+                             azimuth=zeros, tilt=zeros, pressure=pen_status * 100, validate=False)
+
+
+def test_spectral_analysis():
+    samples = [_oscillating_sample(8), _oscillating_sample(25), HandwritingSample.from_svc(svc_file_with_meta_data)]
+
+    result = HandwritingSample.analyze_spectrum(samples, band=(4, 12), return_spectra=True)
+    strokes, summary = result["strokes"], result["samples"]
+
+    # Two on-surface strokes of the synthetic samples (the in-air stroke is skipped)
+    assert list(strokes[strokes["sample"] == 0]["stroke"]) == [0, 2]
+    assert np.allclose(strokes[strokes["sample"] == 0]["peak_frequency"], 8, atol=1)
+    assert summary["relative_band_power"][0] > 0.9 > 0.1 > summary["relative_band_power"][1]
+    assert summary["strokes"][2] == (strokes["sample"] == 2).sum()
+    assert result["stroke_spectra"].shape == (len(strokes), result["frequencies"].size)
+
+    # The batch gives the same results as the samples analyzed separately
+    separate = HandwritingSample.analyze_spectrum(samples[2:], nfft=result["frequencies"].size * 2 - 2)
+    assert np.allclose(separate["strokes"]["band_power"], strokes[strokes["sample"] == 2]["band_power"])
+
+
+def test_spectral_analysis_with_time_in_seconds():
+    in_milliseconds = _oscillating_sample(8)
+    in_seconds = _oscillating_sample(8)
+    in_seconds.time = in_seconds.time / 1000
+
+    expected = HandwritingSample.analyze_spectrum([in_milliseconds], band=(4, 12))["strokes"]
+    strokes = HandwritingSample.analyze_spectrum([in_seconds], band=(4, 12))["strokes"]
+
+    assert np.allclose(strokes["peak_frequency"], expected["peak_frequency"])
+    assert np.allclose(strokes["band_power"], expected["band_power"])
+
+    # The bundled JSON sample stores time in seconds
+    summary = HandwritingSample.analyze_spectrum([HandwritingSample.from_json(json_file)], min_length=4)["samples"]
+    assert summary.loc[0, "strokes"] == 1 and 0 < summary.loc[0, "peak_frequency"] < 50
+
+
+def test_quality_report():
+    time = np.array([0, 5, 10, 10, 15, 40, 45, 44, 50], dtype=float)
+    size = len(time)
+    sample = HandwritingSample(x=np.arange(size), y=np.arange(size), time=time, pen_status=np.ones(size, dtype=int),
+                               azimuth=np.zeros(size), tilt=np.zeros(size),
+                               pressure=np.r_[np.ones(size - 1), 40000], validate=False)
+    clean = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    report = HandwritingSample.analyze_quality([sample, clean])
+    summary = report["samples"]
+
+    assert summary.loc[0, "sampling_rate"] == 200
+    assert summary.loc[0, "duplicate_timestamps"] == 1 and summary.loc[0, "backward_timestamps"] == 1
+    assert summary.loc[0, "out_of_range_pressure"] == 1 and summary.loc[0, "out_of_range"] == 1
+    assert summary.loc[0, "gaps"] == 1 and summary.loc[0, "flagged"]
+    gaps = report["gaps"][report["gaps"]["sample"] == 0]
+    assert gaps["index"].tolist() == [5] and np.isclose(gaps["duration"].iloc[0], 0.025)
+    assert summary.loc[1, "points"] == len(clean) and summary.loc[1, "sampling_rate"] > 0
+
+
+def test_quality_report_with_time_in_seconds():
+    sample = HandwritingSample.from_json(json_file)
+    in_milliseconds = HandwritingSample.from_json(json_file)
+    in_milliseconds.time = in_milliseconds.time * 1000
+
+    summary = HandwritingSample.analyze_quality([sample, in_milliseconds])["samples"]
+
+    assert 100 < summary.loc[0, "sampling_rate"] < 200
+    assert np.isclose(summary.loc[0, "duration"], sample.time[-1] - sample.time[0])
+    assert np.allclose(summary.loc[0, ["sampling_rate", "duration", "jitter"]].astype(float),
+                       summary.loc[1, ["sampling_rate", "duration", "jitter"]].astype(float))
+
+
+def test_quality_report_of_short_samples():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    summary = HandwritingSample.analyze_quality([sample[:1], sample[:0]])["samples"]
+
+    assert summary["points"].tolist() == [1, 0]
+    assert np.isnan(summary["sampling_rate"]).all() and not summary["flagged"].any()
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from examples.tests.common_test_data import *
+
+
+def test_sliding_windows_view():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    sample.transform_all_units()
+
+    windows = sample.sliding_windows(64, stride=16)
+    data = sample._data_array
+
+    assert windows.shape == ((len(sample) - 64) // 16 + 1, 64, len(sample.COLUMNS))
+    assert np.shares_memory(windows, data)
+    assert not windows.flags.writeable
+    assert np.array_equal(windows[3], data[48:112])
+
+    contiguous = sample.sliding_windows(64, stride=16, contiguous=True)
+    assert contiguous.flags.c_contiguous and not np.shares_memory(contiguous, data)
+    assert np.array_equal(contiguous, windows)
+
+
+def test_sliding_windows_padding():
+    sample = HandwritingSample.from_list([[1, 2, 3, 4, 5]] * 2 + [[0, 1, 2, 3, 4], [1, 1, 0, 0, 1]] + [[0] * 5] * 3,
+                                         validate=False)
+
+    assert sample.sliding_windows(3, stride=2, columns=["x"]).shape == (2, 3, 1)
+    assert np.array_equal(sample.sliding_windows(4, stride=2, columns=["x"], padding="zero")[:, :, 0],
+                          [[1, 2, 3, 4], [3, 4, 5, 0]])
+    assert np.array_equal(sample.sliding_windows(4, stride=2, columns=["x"], padding="edge")[:, :, 0],
+                          [[1, 2, 3, 4], [3, 4, 5, 5]])
+    assert sample.sliding_windows(8, columns=["x"]).shape == (0, 8, 1)
+
+    with pytest.raises(ValueError):
+        sample.sliding_windows(3, padding="wrap")
+
+
+def test_sliding_windows_masks():
+    sample = HandwritingSample.from_list([[1, 2, 3, 4, 5]] * 2 + [[0, 1, 2, 3, 4], [1, 1, 0, 0, 1]] + [[0] * 5] * 3,
+                                         validate=False)
+
+    _, masks = sample.sliding_windows(2, columns=["pen_status"], return_masks=True)
+
+    assert np.array_equal(masks["crosses_stroke"], [False, True, False, True])
+    assert np.array_equal(masks["crosses_pen_lift"], [False, True, False, False])
+
+    _, masks = sample.sliding_windows(2, stride=2, columns=["pen_status"], padding="zero", return_masks=True)
+
+    assert np.array_equal(masks["valid"], [[True, True], [True, True], [True, False]])
+
+
+def test_sliding_windows_batch():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_svc(svc_file)]
+
+    views, index = HandwritingSample.sliding_windows_batch(samples, 32, stride=32, columns=["x", "y"])
+    windows, index_contiguous, masks = HandwritingSample.sliding_windows_batch(
+        samples, 32, stride=32, columns=["x", "y"], dtype=np.float32, contiguous=True, return_masks=True)
+
+    assert len(views) == 2 and np.array_equal(index, index_contiguous)
+    assert windows.dtype == np.float32 and len(windows) == len(index) == len(masks["crosses_stroke"])
+    assert np.array_equal(windows[index == 1], views[1].astype(np.float32))
+
+
+def test_padded_batch():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_svc(svc_file)]
+    lengths = [len(sample) for sample in samples]
+
+    batch = HandwritingSample.to_padded_batch(samples, columns=["x", "y", "pressure"], dtype=np.float32, pad_value=-1)
+
+    assert batch["data"].shape == (2, max(lengths), 3) and batch["data"].dtype == np.float32
+    assert np.array_equal(batch["lengths"], lengths)
+    assert np.array_equal(batch["mask"].sum(axis=1), lengths)
+    for row, sample in enumerate(samples):
+        assert np.array_equal(batch["data"][row, :lengths[row], 2], np.asarray(sample.pressure, dtype=np.float32))
+        assert (batch["data"][row, lengths[row]:] == -1).all()
+
+    truncated = HandwritingSample.to_padded_batch(samples, max_length=100)
+    assert truncated["data"].shape == (2, 100, len(HandwritingSample.COLUMNS)) and truncated["mask"].all()
+
+
+def test_padded_batches_bucketing():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    samples = [sample[:length] for length in (50, 10, 40, 20, 30)]
+
+    batches = HandwritingSample.to_padded_batches(samples, 2, columns=["x"])
+
+    assert [batch["index"].tolist() for batch in batches] == [[1, 3], [4, 2], [0]]
+    assert [batch["data"].shape[1] for batch in batches] == [20, 40, 50]
+    assert np.array_equal(batches[1]["data"][0, :30, 0], samples[4].x)
+
+    batches = HandwritingSample.to_padded_batches(samples, 2, bucket=False)
+    assert [batch["index"].tolist() for batch in batches] == [[0, 1], [2, 3], [4]]
@@ -1,8 +1,12 @@
+import os
 import numpy as np
 import json
+import tarfile
+import zipfile
 from pprint import pprint
 from examples.tests.common_test_data import *
 from handwriting_sample.validator.exceptions import PenStatusException, NegativeValueException
+from handwriting_sample.writer.writers import JSONFileWriter
 
 
 def test_read_sample_svc():
@@ -34,7 +38,7 @@ def test_read_sample_json():
 def test_read_sample_pandas_with_different_column_order():
     # get _data in pd.Dataframe
     sample = HandwritingSample.from_json(json_file)
-    data_df = sample._data
+    data_df = sample.original_data_pandas_dataframe
 
     # Reorder _data (to check if ordering is working)
     data_df = data_df[[HandwritingSample.TILT, HandwritingSample.AZIMUTH,
@@ -44,11 +48,39 @@ def test_read_sample_pandas_with_different_column_order():
 
     # Read _data from DataFrame
     df_sample = HandwritingSample.from_pandas_dataframe(data_df)
-    print(df_sample._data)
+    print(df_sample.original_data_pandas_dataframe)
 
     assert df_sample
 
 
+def test_read_samples_from_zip_archive(tmp_path):
+    archive_path = tmp_path / "samples.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.write(svc_file_with_meta_data, arcname=os.path.basename(svc_file_with_meta_data))
+        archive.write(svc_file, arcname="nested/signal.svc")
+        archive.write(json_file, arcname="signal.json")
+
+    samples = HandwritingSample.from_archive(str(archive_path), n_jobs=2)
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    assert len(samples) == 3
+    assert np.array_equal(samples[0].x, sample.x)
+    assert samples[0].meta == sample.meta
+
+
+def test_read_samples_from_tar_archive(tmp_path):
+    archive_path = tmp_path / "samples.tar.gz"
+    with tarfile.open(archive_path, "w:gz") as archive:
+        archive.add(svc_file_with_meta_data, arcname=os.path.basename(svc_file_with_meta_data))
+        archive.add(json_file, arcname="signal.json")
+
+    samples = HandwritingSample.from_archive(str(archive_path))
+
+    assert len(samples) == 2
+    assert samples[0].meta["participant"]["id"] == "jack"
+    assert samples[1].meta == HandwritingSample.from_json(json_file).meta
+
+
 def test_from_array():
     array = np.array([[1, 1, 0, 1, 0],
                       [1, 2, 3, 4, 5],
@@ -199,6 +231,75 @@ def test_store_data_to_json():
     assert sample
 
 
+def test_store_data_to_json_streaming(tmp_path):
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    df = sample.data_pandas_dataframe
+    meta = {"task_id": 6}
+
+    path = str(tmp_path / "streamed.json")
+    JSONFileWriter.write_stream(path, {column: df[column].to_numpy() for column in df.columns}, meta=meta,
+                                chunk_size=7)
+
+    with open(path) as f:
+        assert f.read() == json.dumps({"meta_data": meta, "data": df.to_dict("list")})
+
+
+def test_store_data_keeps_file_permissions(tmp_path):
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    path = tmp_path / "sample.json"
+
+    sample.to_json(str(tmp_path), file_name="sample")
+    os.chmod(path, 0o640)
+    sample.to_json(str(tmp_path), file_name="sample")
+
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+def test_store_data_with_default_file_permissions(tmp_path):
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    umask = os.umask(0o027)
+    try:
+        sample.to_json(str(tmp_path), file_name="sample")
+    finally:
+        os.umask(umask)
+
+    assert os.stat(tmp_path / "sample.json").st_mode & 0o777 == 0o640
+
+
+def test_store_and_read_json_lines(tmp_path):
+    path = str(tmp_path / "samples.jsonl")
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    other = HandwritingSample.from_json(json_file)
+
+    sample.to_json_lines(path)
+    other.to_json_lines(path)
+
+    samples = list(HandwritingSample.from_json_lines(path))
+    assert len(samples) == 2
+    assert np.array_equal(samples[0].x, sample.x)
+    assert samples[1].meta["participant"]["id"] == "BD_1234"
+
+    filtered = list(HandwritingSample.from_json_lines(path, meta_filter=lambda meta: meta.get("task_id") == 7))
+    assert len(filtered) == 1
+    assert filtered[0].meta["participant"]["id"] == "BD_1234"
+
+
+def test_write_batch(tmp_path):
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data),
+               HandwritingSample.from_json(json_file),
+               HandwritingSample.from_svc(svc_file)]
+
+    report = HandwritingSample.write_batch(samples, str(tmp_path), file_format="svc", file_names=[None, "signal", None],
+                                           n_jobs=2)
+
+    assert [record["index"] for record in report] == [0, 1, 2]
+    assert report[0]["stored"] and os.path.exists(report[0]["path"])
+    assert report[1]["stored"] and os.path.exists(report[1]["path"])
+    assert not report[2]["stored"] and report[2]["error"]
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(record["path"]) for record in report[:2])
+
+
 def test_store_raw_data_to_svc():
     sample = HandwritingSample.from_svc(svc_file_with_meta_data)
 
@@ -262,6 +363,46 @@ def test_load_sample_with_transformation():
     assert sample
 
 
+def test_original_data_after_transformation():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    original = sample.original_data_pandas_dataframe.copy()
+
+    sample.transform_all_units()
+    sample.y = sample.transformer.revert_axis(sample.y, 200)
+    sample.transformer.rescale_axis(sample, 2)
+
+    assert [t["operation"] for t in sample.transformations] == [
+        "transform_axis", "transform_time_to_seconds", "transform_angle", "transform_angle",
+        "normalize_pressure", "rescale_axis"]
+    assert sample.original_data_pandas_dataframe.equals(original)
+    assert not np.array_equal(sample.x, original[HandwritingSample.AXIS_X])
+
+
+def test_original_data_of_non_integer_variables(tmp_path):
+    sample = HandwritingSample.from_json(json_file)
+    raw_data = sample.data_numpy_array
+
+    sample.transform_all_units()
+    sample.to_svc(str(tmp_path), file_name="original_data", store_original_data=True)
+
+    # The non-integer values are kept, so they are restored exactly
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+    with open(tmp_path / "original_data.svc") as svc:
+        assert svc.read().splitlines()[2].split()[:3] == ["52.83", "52.83", "0.007"]
+
+
+def test_original_data_of_untransformed_variables():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    original = sample.original_data_pandas_dataframe
+
+    assert original[HandwritingSample.PEN_STATUS].dtype == np.int64
+    assert (original.dtypes == np.int64).all()
+
+    original_pressure = sample._get_original_column(HandwritingSample.PRESSURE)
+    original_pressure[:] = 0
+    assert sample.pressure.any()
+
+
 def test_plot_on_surface():
     sample = HandwritingSample.from_svc(svc_file_with_meta_data)
     sample.transform_all_units()
@@ -359,3 +500,88 @@ def test_rescale_axis():
     sample.plot_on_surface(x_label='RESCALED')
 
     assert True
+
+
+def test_derived_data_are_cached():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    array, xy = sample._data_array, sample.xy
+    assert sample._data_array is array and sample.xy is xy
+    assert not array.flags.writeable
+
+    # The returned array and DataFrame can be modified without affecting the cache
+    data = sample.data_numpy_array
+    data[:, 0] = 0
+    assert np.array_equal(sample.data_numpy_array[:, 0], sample.x)
+
+    df = sample.data_pandas_dataframe
+    assert sample._data_frame is sample._data_frame
+    df["x"] = 0
+    df.loc[0, "y"] = -1
+    assert np.array_equal(sample.data_pandas_dataframe["x"], sample.x)
+    assert np.array_equal(sample.data_pandas_dataframe["y"], sample.y)
+
+    # Setting or transforming a variable invalidates the cache
+    sample.y = sample.transformer.revert_axis(sample.y, sample.y.max())
+    assert sample._data_array is not array
+    assert np.array_equal(sample.data_numpy_array[:, 1], sample.y)
+
+    sample.transform_axis_to_mm()
+    assert np.array_equal(sample.xy, np.sqrt(sample.x ** 2 + sample.y ** 2))
+    assert sample.html_pointer_event_data["x"] == [x / sample.transformer.PX_TO_MM for x in sample.x]
+
+
+def test_slicing():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    window = sample[10:50]
+    assert len(window) == 40
+    assert np.array_equal(window.data_numpy_array, sample.data_numpy_array[10:50])
+    assert np.shares_memory(window.x, sample.x)
+    assert window.meta == sample.meta
+    assert np.array_equal(sample[-1].time, sample.time[-1:])
+
+    # Transforming the window does not change the parent
+    window.transform_axis_to_mm()
+    assert np.array_equal(sample.x[10:50], window.original_data_pandas_dataframe["x"])
+
+
+def test_slicing_keeps_original_data():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    sample.transform_all_units()
+    augmented = sample.augment(seed=0, jitter=0.1)
+
+    for parent in (sample, augmented):
+        window = parent[10:50]
+        assert window.transformations == parent.transformations
+        assert np.array_equal(window.original_numpy_array, parent.original_numpy_array[10:50])
+        assert window.original_data_pandas_dataframe.dtypes.equals(parent.original_data_pandas_dataframe.dtypes)
+
+
+def test_slicing_resampled_sample():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    raw_data = sample.data_numpy_array
+    sample.resample(sampling_rate=50)
+
+    # The original values kept before resampling do not map to the rows of the window
+    window = sample[0:10]
+    assert np.array_equal(window.x, sample.x[:10])
+    assert np.array_equal(window.original_numpy_array, raw_data)
+
+
+def test_between():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    start_time, end_time = sample.time[5], sample.time[25]
+
+    window = sample.between(start_time, end_time)
+
+    assert np.array_equal(window.time, sample.time[(sample.time >= start_time) & (sample.time <= end_time)])
+    assert np.shares_memory(window.time, sample.time)
+    assert len(sample.between(end_time, start_time)) == 0
+    assert len(sample.between(start_time)) == len(sample) - 5
+    assert np.array_equal(sample.between(start_time, end_time).x, sample.x[5:26])
+
+    # In-place transformations of a window do not write to the parent
+    raw_x = sample.x.copy()
+    window.transform_all_units(inplace=True)
+    assert np.array_equal(sample.x, raw_x)
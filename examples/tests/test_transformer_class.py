@@ -1,4 +1,12 @@
+import copy
+import json
+import numpy as np
+import pickle
+import zipfile
+import pytest
 from examples.tests.common_test_data import *
+from handwriting_sample.transformer import HandwritingSampleTransformationPipeline, HandwritingDeviceProfile, \
+    HandwritingDeviceProfileRegistry, TransformerDeviceProfileException
 
 
 def test_normalize_time_series():
@@ -69,3 +77,583 @@ def test_control_for_pressure():
     sample.pressure = sample.transformer.control_for_pressure(sample.pressure)
 
     assert sample
+
+
+def test_kernels_match_element_wise_computation():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    transformer = sample.transformer
+
+    assert np.array_equal(transformer.normalize_time_series(sample.x, 1056), [x / 1056 for x in sample.x])
+    assert np.array_equal(transformer.normalize_pressure(sample.pressure),
+                          [(p / transformer.MAX_PRESSURE_VALUE) * transformer.PRESSURE_LEVELS for p in sample.pressure])
+    assert np.array_equal(transformer.transform_time_to_seconds(sample.time),
+                          [(t - sample.time[0]) / 1e3 for t in sample.time])
+    assert np.array_equal(transformer.transform_angle(sample.tilt, 900, 90), [t * (90 / 900) for t in sample.tilt])
+    assert np.array_equal(transformer.revert_axis(sample.y, 19000), [19000 - y for y in sample.y])
+
+
+def test_kernels_in_place():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    time = sample.time.astype(float)
+    expected = sample.transformer.transform_time_to_seconds(time)
+
+    output = sample.transformer.transform_time_to_seconds(time, out=time)
+
+    assert output is time
+    assert np.array_equal(time, expected)
+
+
+def test_kernels_reject_non_numeric_input():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+
+    with pytest.raises(ValueError):
+        sample.transformer.transform_angle(np.array(["a", "b"]), 900, 90)
+    with pytest.raises(ValueError):
+        sample.transformer.normalize_pressure(sample.pressure, max_value="32767")
+
+
+def _reference_tilt_xy_to_azimuth_and_tilt(tilt_x, tilt_y):
+    azimuth = np.zeros(len(tilt_x))
+    tilt = np.zeros(len(tilt_x))
+
+    for idx, (t_x, t_y) in enumerate(zip(tilt_x, tilt_y)):
+        t_x = np.radians(t_x)
+        t_y = np.radians(t_y)
+
+        if t_x == 0 and t_y == 0:
+            azimuth[idx], tilt[idx] = 0, np.pi / 2
+        elif t_x == 0 and t_y > 0:
+            azimuth[idx], tilt[idx] = np.pi / 2, (np.pi / 2) - t_y
+        elif t_x == 0 and t_y < 0:
+            azimuth[idx], tilt[idx] = 3 * (np.pi / 2), (np.pi / 2) + t_y
+        elif t_x > 0 and t_y == 0:
+            azimuth[idx], tilt[idx] = 0, (np.pi / 2) - t_x
+        elif t_x < 0 and t_y == 0:
+            azimuth[idx], tilt[idx] = np.pi, (np.pi / 2) + t_x
+        else:
+            azimuth[idx] = np.arctan(np.tan(t_y) / np.tan(t_x))
+            tilt[idx] = np.arctan(np.sin(azimuth[idx]) / np.tan(t_y))
+
+    return np.abs(np.degrees(azimuth)), np.abs(np.degrees(tilt))
+
+
+def test_transform_tilt_xy_to_azimuth_and_tilt():
+    html_data = json.load(open(html_file, "r"))
+    rng = np.random.default_rng(0)
+    tilt_x = list(rng.integers(-90, 91, size=5000)) + [0, 0, 0, 30, -30] + html_data["tiltX"]
+    tilt_y = list(rng.integers(-90, 91, size=5000)) + [0, 30, -30, 0, 0] + html_data["tiltY"]
+
+    azimuth, tilt = HandwritingSample.transformer.transform_tilt_xy_to_azimuth_and_tilt(tilt_x, tilt_y)
+    expected_azimuth, expected_tilt = _reference_tilt_xy_to_azimuth_and_tilt(tilt_x, tilt_y)
+
+    assert np.array_equal(azimuth, expected_azimuth)
+    assert np.array_equal(tilt, expected_tilt)
+
+
+def test_transform_all_units_fused():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    fused = HandwritingSample.from_svc(svc_file_with_meta_data)
+    original = fused.original_data_pandas_dataframe.copy()
+
+    sample.transformer.transform_all_units(sample)
+    fused.transformer.transform_all_units(fused, fused=True)
+
+    assert np.array_equal(fused.data_numpy_array, sample.data_numpy_array)
+    assert fused.transformations == sample.transformations
+    assert fused.original_data_pandas_dataframe.equals(original)
+
+
+def test_transform_all_units_inplace():
+    sample = HandwritingSample.from_svc(svc_file)
+    expected = HandwritingSample.from_svc(svc_file)
+    expected.transform_all_units(conversion_type=expected.transformer.MM)
+
+    x, raw_data = sample.x, sample.data_numpy_array
+    sample.transform_all_units(conversion_type=sample.transformer.MM, inplace=True)
+
+    assert sample.x is x
+    assert np.array_equal(sample.data_numpy_array, expected.data_numpy_array)
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+
+
+def test_transform_all_units_inplace_does_not_write_to_views():
+    data = HandwritingSample.from_svc(svc_file).data_numpy_array.astype(float).T.copy()
+    raw_data = data.copy()
+    sample = HandwritingSample._from_arrays(dict(zip(HandwritingSample.COLUMNS, data)))
+
+    HandwritingSample.transform_all_units_batch([sample], conversion_type=sample.transformer.MM, inplace=True)
+
+    assert np.array_equal(data, raw_data)
+    assert not np.shares_memory(sample.pressure, data)
+
+
+def test_transform_all_units_batch():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+    expected = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+
+    HandwritingSample.transform_all_units_batch(samples)
+
+    for sample, other in zip(samples, expected):
+        other.transform_all_units()
+        assert np.array_equal(sample.data_numpy_array, other.data_numpy_array)
+    assert all(sample.x.base is None for sample in samples)
+
+
+def _revert_y_axis(sample):
+    sample.y = sample.transformer.revert_axis(sample.y, 200)
+    return sample
+
+
+def test_transformation_pipeline():
+    pipeline = HandwritingSampleTransformationPipeline(lpi_value=5080, pressure_levels=4096)
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+    expected = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+
+    samples = pipeline.apply(samples)
+
+    for sample, other in zip(samples, expected):
+        other.transform_all_units(pressure_levels=4096)
+        assert np.array_equal(sample.data_numpy_array, other.data_numpy_array)
+        assert sample.transformations == other.transformations
+
+
+def test_transformation_pipeline_with_user_step_is_picklable():
+    pipeline = HandwritingSampleTransformationPipeline(
+        steps=["transform_axis", _revert_y_axis, "rescale_axis"], conversion_type="mm", rescale_coef=2)
+    pipeline = pickle.loads(pickle.dumps(pipeline))
+
+    sample = pipeline.apply(HandwritingSample.from_svc(svc_file))
+    expected = HandwritingSample.from_svc(svc_file)
+    expected.transform_axis_to_mm(conversion_type="mm")
+    expected.y = expected.transformer.revert_axis(expected.y, 200)
+    expected.transformer.rescale_axis(expected, 2)
+
+    assert np.array_equal(sample.y, expected.y)
+
+
+def test_transformation_pipeline_checks_parameters():
+    with pytest.raises(ValueError):
+        HandwritingSampleTransformationPipeline(lpi="5080")
+    with pytest.raises(ValueError):
+        HandwritingSampleTransformationPipeline(steps=["transform_everything"])
+
+
+def test_resolve_device_profile_from_meta_data():
+    registry = HandwritingDeviceProfileRegistry()
+    registry.register(HandwritingDeviceProfile("Wacom Intuos 5 L", lpi_value=5080, max_pressure=2047))
+
+    assert registry.resolve({}) is registry.default
+    assert registry.resolve({"device_type": "unknown device"}) is registry.default
+
+    meta = {"device_type": "wacom intuos 5 l", "lpi": 1025, "time_series_ranges": {"pressure": [0, 2048]}}
+    profile = registry.resolve(meta)
+    assert profile.name == "Wacom Intuos 5 L"
+    assert profile.parameters["lpi_value"] == 1025
+    assert profile.parameters["max_pressure"] == 2048
+    assert registry.resolve(dict(meta)) is profile
+
+    with pytest.raises(TransformerDeviceProfileException):
+        registry.resolve({"device_type": "unknown device"}, strict=True)
+
+
+def test_device_profile_checks_parameters():
+    with pytest.raises(ValueError):
+        HandwritingDeviceProfile("Broken", lpi_value=0)
+    with pytest.raises(ValueError):
+        HandwritingDeviceProfile("Broken", max_pressure="32767")
+
+
+def test_transform_all_units_by_device():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file),
+               HandwritingSample.from_svc(svc_file)]
+    expected = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file),
+                HandwritingSample.from_svc(svc_file)]
+
+    samples = HandwritingSample.transform_all_units_by_device(samples)
+
+    for sample, other in zip(samples, expected):
+        other.transform_all_units(**other.device_profile.parameters)
+        assert np.allclose(sample.data_numpy_array, other.data_numpy_array)
+
+
+def _fail_on_json_sample(sample):
+    if sample.meta.get("device_type") == "Wacom Intuos 5 L":
+        raise ValueError("Unsupported sample")
+
+
+def test_transform_batch_on_process_pool():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_svc(svc_file),
+               HandwritingSample.from_json(json_file)]
+    expected = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_svc(svc_file),
+                HandwritingSample.from_json(json_file)]
+
+    report = HandwritingSample.transform_batch(samples, n_jobs=2, shard_size=1)
+
+    assert [record["index"] for record in report] == [0, 1, 2]
+    for record, sample, other in zip(report, samples, expected):
+        other.transform_all_units()
+        assert record["transformed"] and record["sample"] is sample
+        assert np.array_equal(sample.data_numpy_array, other.data_numpy_array)
+        assert sample.transformations == other.transformations
+        assert np.array_equal(sample.original_numpy_array, other.original_numpy_array)
+
+
+def test_transform_batch_reports_failures(tmp_path):
+    archive_path = tmp_path / "samples.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.write(json_file, arcname="signal.json")
+        archive.write(svc_file, arcname="signal.svc")
+
+    pipeline = HandwritingSampleTransformationPipeline(steps=[_fail_on_json_sample, "transform_axis"])
+    report = HandwritingSample.transform_batch(str(archive_path), pipeline=pipeline, n_jobs=2, shard_size=1)
+
+    assert [record["transformed"] for record in report] == [False, True]
+    assert report[0]["error"] == "ValueError: Unsupported sample"
+    assert report[0]["sample"].transformations == []
+    assert [t["operation"] for t in report[1]["sample"].transformations] == ["transform_axis"]
+
+
+class _Interrupted(BaseException):
+    pass
+
+
+def _interrupt(sample):
+    raise _Interrupted()
+
+
+def test_transform_batch_keeps_interrupting_exception():
+    pipeline = HandwritingSampleTransformationPipeline(steps=[_interrupt])
+
+    with pytest.raises(_Interrupted):
+        pipeline.apply_parallel([HandwritingSample.from_svc(svc_file)], n_jobs=1)
+
+
+def _change_meta_and_fail(sample):
+    sample.meta["changed"] = True
+    raise ValueError("Unsupported sample")
+
+
+def test_transform_batch_in_process_keeps_meta_data():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    meta = copy.deepcopy(sample.meta)
+    pipeline = HandwritingSampleTransformationPipeline(steps=[_change_meta_and_fail])
+
+    report = pipeline.apply_parallel([sample], n_jobs=1)
+
+    assert not report[0]["transformed"]
+    assert sample.meta == meta
+
+
+def test_correct_pen_status():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    meta, raw_pen_status = dict(sample.meta), sample.pen_status.copy()
+
+    corrected = sample.transformer.correct_pen_status(sample)
+
+    assert corrected is sample
+    assert sample.meta == meta
+    assert np.array_equal(sample.pen_status, [1 if x > 0 else 0 for x in sample.pressure])
+    assert np.array_equal(sample.original_data_pandas_dataframe["pen_status"], raw_pen_status)
+
+
+def test_correct_pen_status_with_hysteresis():
+    transformer = HandwritingSample.transformer
+    pressure = np.array([0, 5, 12, 7, 3, 8, 1, 15, 6])
+
+    assert np.array_equal(transformer.compute_pen_status(pressure, threshold=10),
+                          [0, 0, 1, 0, 0, 0, 0, 1, 0])
+    assert np.array_equal(transformer.compute_pen_status(pressure, threshold=10, release_threshold=4),
+                          [0, 0, 1, 1, 0, 0, 0, 1, 1])
+
+    with pytest.raises(ValueError):
+        transformer.compute_pen_status(pressure, threshold=10, release_threshold=12)
+
+
+def test_control_for_pressure_batch():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file),
+               HandwritingSample.from_svc(svc_file)]
+    samples[1].pressure = np.round(samples[1].pressure).astype(int)
+    expected = [sample.transformer.control_for_pressure(sample.pressure) for sample in samples]
+    raw_pressure = [sample.pressure for sample in samples]
+
+    report = HandwritingSample.control_for_pressure_batch(samples)
+
+    assert [record["index"] for record in report] == [0, 1, 2]
+    for record, sample, pressure, raw in zip(report, samples, expected, raw_pressure):
+        assert record["pressure_range"] == np.ptp(raw)
+        assert record["corrected"] == (np.ptp(raw) > 1024)
+        assert np.array_equal(sample.pressure, [round((x / 32767) * 1024) for x in raw] if record["corrected"] else raw)
+        assert np.array_equal(sample.pressure, pressure)
+
+
+def test_resample():
+    sample = HandwritingSample.from_list(
+        np.array([[0, 10, 20, 40, 50, 60, 75],
+                  [0, 10, 20, 40, 50, 60, 75],
+                  [0, 10, 20, 40, 50, 60, 75],
+                  [1, 1, 1, 1, 0, 0, 0],
+                  [0, 0, 0, 0, 0, 0, 0],
+                  [0, 0, 0, 0, 0, 0, 0],
+                  [5, 5, 5, 5, 0, 0, 0]]),
+        columns=["x", "y", "time", "pen_status", "azimuth", "tilt", "pressure"], validate=False)
+    raw_data = sample.data_numpy_array
+
+    sample.resample(sampling_rate=50)
+
+    assert np.array_equal(sample.time, [0, 20, 40, 50, 70])
+    assert np.array_equal(sample.x, [0, 20, 40, 50, 70])
+    assert np.array_equal(sample.pen_status, [1, 1, 1, 0, 0])
+    assert np.array_equal(sample.pressure, [5, 5, 5, 0, 0])
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+
+
+def test_resample_infers_time_unit():
+    sample = HandwritingSample.from_json(json_file)
+    in_seconds = HandwritingSample.from_json(json_file)
+    in_milliseconds = HandwritingSample.from_json(json_file)
+    in_milliseconds.time = in_milliseconds.time * 1e3
+
+    sample.resample(sampling_rate=100)
+    in_seconds.resample(sampling_rate=100, time_scale=1)
+    in_milliseconds.resample(sampling_rate=100)
+
+    assert len(sample.x) > 1
+    assert np.array_equal(sample.x, in_seconds.x)
+    assert np.allclose(sample.x, in_milliseconds.x)
+    assert sample.transformations[-1]["parameters"]["time_scale"] == 1
+
+
+def test_resample_batch():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+    expected = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+    expected[1].transform_time_to_seconds()
+    samples[1].transform_time_to_seconds()
+
+    HandwritingSample.resample_batch(samples, sampling_rate=100)
+
+    for sample, other in zip(samples, expected):
+        other.resample(sampling_rate=100)
+        assert np.array_equal(sample.data_numpy_array, other.data_numpy_array)
+
+        # Uniform steps within the strokes
+        starts, ends = sample.transformer.stroke_bounds(sample.pen_status)
+        period = sample.transformations[-1]["parameters"]["period"]
+        for start, end in zip(starts, ends):
+            assert np.allclose(np.diff(sample.time[start:end]), period)
+
+
+def test_simplify():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    simplified = sample.simplify(tolerance=20)
+
+    # The strokes are kept and the retained points are the original ones
+    assert 0 < len(simplified.x) < len(sample.x)
+    assert len(simplified.get_strokes()) == len(sample.get_strokes())
+    assert np.isin(simplified.time, sample.time).all()
+    assert simplified.meta == sample.meta
+
+    # Zero tolerance keeps all points except the collinear ones
+    line = HandwritingSample.from_list(
+        np.array([[0, 1, 2, 3, 4], [0, 1, 2, 3, 0], [0, 1, 2, 3, 4], [1, 1, 1, 1, 1],
+                  [0, 0, 0, 0, 0], [0, 0, 0, 0, 0], [1, 1, 1, 1, 1]]),
+        columns=["x", "y", "time", "pen_status", "azimuth", "tilt", "pressure"])
+    assert np.array_equal(line.simplify(tolerance=0).x, [0, 3, 4])
+
+
+def test_simplify_resampled_sample():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    raw_data = sample.data_numpy_array
+    sample.resample(sampling_rate=100)
+
+    # The original values kept before resampling are carried unchanged
+    for simplified in (sample.simplify(tolerance=1), sample.decimate(stride=4)):
+        assert len(simplified.x) < len(sample.x)
+        assert simplified.transformations == sample.transformations
+        assert np.array_equal(simplified.original_numpy_array, raw_data)
+
+
+def test_decimate():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    starts, ends = sample.transformer.stroke_bounds(sample.pen_status)
+
+    decimated = sample.decimate(stride=4)
+    expected = np.unique(np.concatenate([np.append(np.arange(start, end, 4), end - 1)
+                                         for start, end in zip(starts, ends)]))
+    assert np.array_equal(decimated.time, sample.time[expected])
+
+    decimated = sample.decimate(bucket_size=16)
+    assert len(decimated.x) < len(sample.x)
+    assert decimated.x.max() == sample.x.max() and decimated.y.min() == sample.y.min()
+    assert len(sample.transform_sample_to_html_pointer_event(tolerance=20)["x"]) < len(sample.x)
+
+
+def _filter_stroke_loop(values, pen_status, kernel, mode):
+    filtered = []
+    for stroke in np.split(np.asarray(values, dtype=float), np.flatnonzero(np.diff(pen_status)) + 1):
+        padded = np.pad(stroke, len(kernel) // 2, mode="edge" if mode == "nearest" else "reflect")
+        filtered.append(np.correlate(padded, kernel, mode="valid"))
+    return np.concatenate(filtered)
+
+
+def test_decimate_keeps_original_data():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    sample.transform_all_units()
+    sample = sample.augment(seed=0, jitter=0.1)
+    starts, ends = sample.transformer.stroke_bounds(sample.pen_status)
+
+    decimated = sample.decimate(stride=4)
+    expected = np.unique(np.concatenate([np.append(np.arange(start, end, 4), end - 1)
+                                         for start, end in zip(starts, ends)]))
+    assert decimated.transformations == sample.transformations
+    assert np.array_equal(decimated.original_numpy_array, sample.original_numpy_array[expected])
+
+
+def test_filter_strokes():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+    filters = HandwritingSample.filters
+
+    for kernel, mode in [(filters.gaussian_kernel(sigma=2), "nearest"),
+                         (filters.moving_average_kernel(window=5), "reflect"),
+                         (filters.savitzky_golay_kernel(window=7, polyorder=2), "nearest")]:
+        filtered = filters.compute_batch(samples, kernel, mode=mode)
+
+        for sample, columns in zip(samples, filtered):
+            starts, ends = sample.transformer.stroke_bounds(sample.pen_status)
+            for column in ("x", "y", "pressure"):
+                expected = _filter_stroke_loop(getattr(sample, column), sample.pen_status, kernel, mode)
+                assert np.allclose(columns[column], expected)
+                assert np.array_equal(filters.filter_strokes(getattr(sample, column), starts, ends, kernel, mode),
+                                      columns[column])
+
+
+def test_savitzky_golay_derivative():
+    filters = HandwritingSample.filters
+    time = np.arange(20, dtype=float)
+    kernel = filters.savitzky_golay_kernel(window=5, polyorder=2, derivative=1, delta=0.5)
+
+    derivative = filters.filter_strokes((time * 0.5) ** 2, np.array([0]), np.array([20]), kernel)
+
+    assert np.allclose(derivative[2:-2], 2 * time[2:-2] * 0.5)
+
+
+def test_smooth():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    raw_data = sample.data_numpy_array
+
+    sample.smooth("gaussian", sigma=1.5)
+
+    assert not np.array_equal(sample.x, raw_data[:, 0])
+    assert np.array_equal(sample.time, raw_data[:, 2])
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+
+
+def test_augment_batch():
+    samples = [HandwritingSample.from_svc(svc_file_with_meta_data), HandwritingSample.from_json(json_file)]
+    raw_data = [sample.data_numpy_array for sample in samples]
+    augmentations = dict(rotation=10, scale=(0.9, 1.1), shear=15, translation=5, jitter=0.5,
+                         pressure_scale=(0.8, 1.2), time_warp=0.3)
+
+    augmented = HandwritingSample.augment_batch(samples, seed=42, **augmentations)
+    repeated = HandwritingSample.augment_batch(samples, seed=42, **augmentations)
+
+    for sample, new_sample, repeated_sample, raw in zip(samples, augmented, repeated, raw_data):
+        assert new_sample is not sample and np.array_equal(sample.data_numpy_array, raw)
+        assert np.array_equal(new_sample.data_numpy_array, repeated_sample.data_numpy_array)
+        assert np.array_equal(new_sample.pen_status, sample.pen_status)
+        assert not np.allclose(new_sample.x, sample.x)
+        assert np.all(np.diff(new_sample.time) >= 0)
+        assert np.isclose(new_sample.time[0], sample.time[0]) and np.isclose(new_sample.time[-1], sample.time[-1])
+        assert np.array_equal(new_sample.original_numpy_array, sample.original_numpy_array)
+
+
+def test_augment_does_not_share_variables():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    sample.transform_all_units()
+    pressure = sample.pressure.copy()
+
+    augmented = sample.augment(seed=0, jitter=0.1)
+    augmented.transform_all_units(inplace=True)
+
+    assert np.array_equal(sample.pressure, pressure)
+
+
+def test_augment_affine_about_centroid():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    x, y = np.asarray(sample.x, dtype=float), np.asarray(sample.y, dtype=float)
+
+    sample.augment(rotation=90, inplace=True)
+    angle = np.radians(sample.transformations[-1]["parameters"]["rotation"])
+    dx, dy = x - x.mean(), y - y.mean()
+
+    assert np.allclose(sample.x, np.cos(angle) * dx - np.sin(angle) * dy + x.mean())
+    assert np.allclose(sample.y, np.sin(angle) * dx + np.cos(angle) * dy + y.mean())
+
+    with pytest.raises(ValueError):
+        sample.augment(time_warp=1)
+
+
+def test_affine_matrices():
+    transformer = HandwritingSample.transformer
+    rotation = transformer.rotation_matrix(90, center=(1, 1))
+    scaling = transformer.scaling_matrix(2, 3, center=(1, 1))
+    shear = transformer.shear_matrix(45)
+
+    assert np.allclose(rotation @ [2, 1, 1], [1, 2, 1])
+    assert np.allclose(scaling @ [2, 2, 1], [3, 4, 1])
+    assert np.allclose(shear @ [0, 2, 1], [2, 2, 1])
+    assert np.allclose(transformer.compose_matrices(rotation, transformer.translation_matrix(1, 0)) @ [2, 1, 1],
+                       [2, 2, 1])
+
+
+def test_affine_transform_keeps_original_data():
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    raw_data = sample.data_numpy_array
+    x, y = np.asarray(sample.x, dtype=float), np.asarray(sample.y, dtype=float)
+
+    sample.transform_all_units()
+    sample.rotate(30)
+    sample.shear(-10)
+    sample.translate(5, -5)
+    sample.scale(2)
+
+    assert not np.allclose(sample.x, x)
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+    assert not sample._original_columns
+
+    # non-invertible steps keep both axis once they are coupled
+    sample.smooth("moving_average", window=3, columns=["x"])
+    assert set(sample._original_columns) == {"x", "y"}
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+
+    with pytest.raises(ValueError):
+        sample.affine_transform(np.eye(2))
+
+
+def test_affine_transform_in_place_in_blocks(monkeypatch):
+    sample = HandwritingSample.from_svc(svc_file_with_meta_data)
+    raw_data = sample.data_numpy_array
+    sample.transform_all_units()
+    x, y = sample.x, sample.y
+    expected = sample.transformer.rotation_matrix(30, center=(1, 2)) @ np.vstack((x, y, np.ones(len(x))))
+
+    monkeypatch.setattr(type(sample.transformer), "AFFINE_BLOCK_SIZE", 7)
+    sample.rotate(30, center=(1, 2))
+
+    assert sample.x is x and sample.y is y
+    assert np.allclose(sample.x, expected[0]) and np.allclose(sample.y, expected[1])
+    assert np.array_equal(sample.original_numpy_array, raw_data)
+
+
+def test_baseline_and_slant_correction():
+    t = np.linspace(0, 1, 200)
+    x, y = 100 * t, 20 * np.abs(np.sin(8 * np.pi * t))
+    x = x + np.tan(np.radians(20)) * y
+    angle = np.radians(10)
+    x, y = np.cos(angle) * x - np.sin(angle) * y, np.sin(angle) * x + np.cos(angle) * y
+    sample = HandwritingSample(x=x, y=y, time=t, pen_status=np.ones(200, dtype=int), azimuth=np.zeros(200),
+                               tilt=np.zeros(200), pressure=np.ones(200), validate=False)
+
+    baseline, slant = sample.correct_baseline_and_slant()
+
+    assert abs(baseline - 10) < 1 and abs(slant - 20) < 1
+    assert abs(sample.estimate_baseline_angle()) < 2 and abs(sample.estimate_slant()) < 2
@@ -8,7 +8,7 @@ long_description = (pathlib.Path(__file__).parent.resolve() / "README.md").read_
 # Prepare the packages and requirements
 packages = find_packages(where="src")
 requires = [
-    "numpy",
+    "numpy>=1.20",
     "pandas",
     "matplotlib"
 ]
@@ -0,0 +1,3 @@
+from handwriting_sample.analyzer.interface import HandwritingSampleAnalyzer
+from handwriting_sample.analyzer.spectral import HandwritingSampleSpectralAnalyzer
+from handwriting_sample.analyzer.quality import HandwritingSampleQualityAnalyzer
@@ -0,0 +1,100 @@
+import numpy as np
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer import HandwritingSampleTransformer
+
+
+class HandwritingSampleAnalyzer(HandwritingDataBase):
+    """Class implementing handwriting data analyzer"""
+
+    # Kinematic features
+    VELOCITY = "velocity"
+    ACCELERATION = "acceleration"
+    JERK = "jerk"
+    ANGULAR_VELOCITY = "angular_velocity"
+
+    KINEMATICS = [
+        f"{VELOCITY}_x", f"{VELOCITY}_y", VELOCITY,
+        f"{ACCELERATION}_x", f"{ACCELERATION}_y", ACCELERATION,
+        f"{JERK}_x", f"{JERK}_y", JERK,
+        ANGULAR_VELOCITY
+    ]
+
+    # ---------- #
+    # Kinematics #
+    # ---------- #
+
+    @classmethod
+    def compute_kinematics(cls, x, y, time, pen_status):
+        """
+        Computes velocity, acceleration and jerk (per axis and magnitude) and angular velocity.
+
+        The derivatives are computed by finite differences within the strokes (see derivative),
+        so they never cross a stroke boundary. The units follow the units of the variables
+        (e.g. mm/s for millimeters and seconds).
+
+        :param x: X axis
+        :type x: np.array
+        :param y: Y axis
+        :type y: np.array
+        :param time: timestamp
+        :type time: np.array
+        :param pen_status: pen status (defines the strokes)
+        :type pen_status: np.array
+        :return: kinematic features {name: values} (see KINEMATICS)
+        :rtype: dict[str, np.array]
+        """
+
+        # Get the strokes
+        starts, ends = HandwritingSampleTransformer.stroke_bounds(pen_status)
+        time = np.asarray(time, dtype=float)
+
+        # Compute the derivatives of the axis
+        kinematics = {}
+        values = {"x": np.asarray(x, dtype=float), "y": np.asarray(y, dtype=float)}
+
+        for feature in (cls.VELOCITY, cls.ACCELERATION, cls.JERK):
+            values = {axis: cls.derivative(axis_values, time, starts, ends) for axis, axis_values in values.items()}
+            kinematics[f"{feature}_x"] = values["x"]
+            kinematics[f"{feature}_y"] = values["y"]
+            kinematics[feature] = np.hypot(values["x"], values["y"])
+
+        # Compute the angular velocity (derivative of the unwrapped direction of the movement)
+        direction = np.unwrap(np.arctan2(kinematics[f"{cls.VELOCITY}_y"], kinematics[f"{cls.VELOCITY}_x"]))
+        kinematics[cls.ANGULAR_VELOCITY] = cls.derivative(direction, time, starts, ends)
+
+        # Return the kinematics
+        return kinematics
+
+    @staticmethod
+    def derivative(values, time, starts, ends):
+        """
+        Computes the derivative by finite differences within the strokes.
+
+        The inner points of a stroke use central differences, its first and last points
+        one-sided differences; points with zero time difference (and one-point strokes)
+        get zero derivative.
+
+        :param values: input values
+        :type values: np.array
+        :param time: timestamp
+        :type time: np.array
+        :param starts: start indices of the strokes
+        :type starts: np.array
+        :param ends: end indices (exclusive) of the strokes
+        :type ends: np.array
+        :return: derivative
+        :rtype: np.array
+        """
+
+        # Get the neighbours of the points within the strokes
+        indices = np.arange(len(values))
+        previous, following = indices - 1, indices + 1
+        previous[starts] = starts
+        following[ends - 1] = ends - 1
+
+        # Compute the differences
+        difference = values[following] - values[previous]
+        time_difference = time[following] - time[previous]
+
+        # Return the derivative
+        return np.divide(difference, time_difference, out=np.zeros(len(values)), where=time_difference != 0)
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer import HandwritingSampleTransformer
+
+
+class HandwritingSampleQualityAnalyzer(HandwritingDataBase):
+    """
+    Class implementing the sampling-quality analysis of handwriting samples.
+
+    The samples are concatenated and all statistics (sampling rate, jitter, gaps, duplicate
+    and backward timestamps, out-of-range values) are computed over the whole batch at once
+    and grouped per sample.
+    """
+
+    # Defaults
+    DEFAULT_GAP_FACTOR = 3.0
+
+    # Valid ranges of the (raw) handwriting variables (None = unbounded)
+    DEFAULT_RANGES = {
+        HandwritingDataBase.AXIS_X: (0, None),
+        HandwritingDataBase.AXIS_Y: (0, None),
+        HandwritingDataBase.TIME: (0, None),
+        HandwritingDataBase.PEN_STATUS: (0, 1),
+        HandwritingDataBase.AZIMUTH: (0, HandwritingSampleTransformer.MAX_AZIMUTH_VALUE),
+        HandwritingDataBase.TILT: (0, HandwritingSampleTransformer.MAX_TILT_VALUE),
+        HandwritingDataBase.PRESSURE: (0, HandwritingSampleTransformer.MAX_PRESSURE_VALUE)
+    }
+
+    @classmethod
+    def analyze(cls, samples, time_scale=None, gap_factor=DEFAULT_GAP_FACTOR, ranges=None):
+        """
+        Analyzes the sampling quality of the samples.
+
+        The nominal sampling period of a sample is the median of its positive time differences;
+        a gap is a time difference longer than gap_factor times the nominal period.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param time_scale: OPTIONAL, number of time units per second (inferred from the data if not given)
+        :type time_scale: float
+        :param gap_factor: OPTIONAL, minimal ratio of a gap to the nominal sampling period, DEFAULT = 3.0
+        :type gap_factor: float
+        :param ranges: OPTIONAL, valid ranges {column: (low, high)} (None = unbounded), DEFAULT = DEFAULT_RANGES
+        :type ranges: dict
+        :return: {"samples": DataFrame of the per-sample statistics,
+                  "gaps": DataFrame of the gaps (sample, index of the point after the gap,
+                          time of the point before the gap, duration [s])}
+        :rtype: dict
+        """
+
+        # Check input
+        samples = list(samples)
+        ranges = cls.DEFAULT_RANGES if ranges is None else ranges
+        if not HandwritingSampleTransformer._is_number(gap_factor) or gap_factor <= 1:
+            raise ValueError(f"Gap factor must be a number greater than 1!")
+        unknown = set(ranges).difference(cls.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown variables {sorted(unknown)}. Please select from {cls.COLUMNS}.")
+
+        # Get the points of the samples
+        count = len(samples)
+        lengths = np.array([len(sample.time) for sample in samples], dtype=np.int64)
+        ids = np.repeat(np.arange(count), lengths)
+
+        # Get the time differences within the samples (in their time units)
+        time = np.concatenate([np.asarray(sample.time, dtype=float) for sample in samples]) if count else np.empty(0)
+        within = ids[1:] == ids[:-1]
+        pair_ids = ids[1:][within]
+        difference = np.diff(time)[within]
+
+        # Count the duplicate and backward timestamps
+        duplicates = np.bincount(pair_ids[difference == 0], minlength=count)
+        backward = np.bincount(pair_ids[difference < 0], minlength=count)
+
+        # Get the nominal sampling period (median of the positive differences)
+        positive = difference > 0
+        period = cls._grouped_median(difference[positive], pair_ids[positive], count)
+
+        # Convert the differences and periods to seconds (the time unit is inferred from the periods if not given)
+        scales = np.full(count, float(time_scale)) if time_scale else \
+            HandwritingSampleTransformer.infer_time_scales(period)
+        difference /= scales[pair_ids]
+        period /= scales
+
+        # Get the jitter (standard deviation of the positive differences)
+        positive_counts = np.bincount(pair_ids[positive], minlength=count)
+        mean = cls._divide(np.bincount(pair_ids[positive], weights=difference[positive], minlength=count),
+                           positive_counts)
+        deviation = difference[positive] - mean[pair_ids[positive]]
+        jitter = np.sqrt(cls._divide(np.bincount(pair_ids[positive], weights=deviation ** 2, minlength=count),
+                                     positive_counts))
+        max_period = np.full(count, np.nan)
+        if positive.any():
+            np.fmax.at(max_period, pair_ids[positive], difference[positive])
+
+        # Find the gaps
+        is_gap = difference > gap_factor * np.nan_to_num(period, nan=np.inf)[pair_ids]
+        gap_ids = pair_ids[is_gap]
+        gap_durations = difference[is_gap]
+        gap_index = np.flatnonzero(within)[is_gap] + 1
+
+        # Count the out-of-range values
+        out_of_range = {}
+        for column, (low, high) in ranges.items():
+            values = np.concatenate([np.asarray(getattr(sample, column), dtype=float) for sample in samples]) \
+                if count else np.empty(0)
+            valid = np.ones(values.size, dtype=bool) if low is None else values >= low
+            if high is not None:
+                valid &= values <= high
+            out_of_range[f"out_of_range_{column}"] = np.bincount(ids[~valid], minlength=count)
+
+        # Prepare the sample summaries
+        first = np.cumsum(lengths) - lengths
+        multiple = lengths > 1
+        duration = np.zeros(count)
+        duration[multiple] = (time[first[multiple] + lengths[multiple] - 1] - time[first[multiple]]) / scales[multiple]
+        gaps = np.bincount(gap_ids, minlength=count)
+        total_out_of_range = sum(out_of_range.values()) if out_of_range else np.zeros(count, dtype=np.int64)
+
+        summary = pd.DataFrame({
+            "sample": np.arange(count),
+            "points": lengths,
+            "duration": duration,
+            "sampling_rate": cls._divide(np.ones(count), period),
+            "median_period": period,
+            "jitter": jitter,
+            "relative_jitter": cls._divide(jitter, period),
+            "max_period": max_period,
+            "gaps": gaps,
+            "gap_duration": np.bincount(gap_ids, weights=gap_durations, minlength=count),
+            "duplicate_timestamps": duplicates,
+            "backward_timestamps": backward,
+            "out_of_range": total_out_of_range,
+            **out_of_range
+        })
+        summary["flagged"] = (gaps + duplicates + backward + total_out_of_range) > 0
+
+        # Return the report
+        return {
+            "samples": summary,
+            "gaps": pd.DataFrame({
+                "sample": gap_ids,
+                "index": gap_index - first[gap_ids],
+                "time": time[gap_index - 1],
+                "duration": gap_durations
+            })
+        }
+
+    # --------------- #
+    # Utility methods #
+    # --------------- #
+
+    @staticmethod
+    def _grouped_median(values, groups, count):
+        """Returns the median of the values of each group (NaN for empty groups)"""
+        order = np.lexsort((values, groups))
+        sizes = np.bincount(groups, minlength=count)
+        starts = np.cumsum(sizes) - sizes
+
+        median = np.full(count, np.nan)
+        filled = sizes > 0
+        ordered = values[order]
+        median[filled] = (ordered[starts[filled] + (sizes[filled] - 1) // 2] +
+                          ordered[starts[filled] + sizes[filled] // 2]) / 2
+        return median
+
+    @staticmethod
+    def _divide(numerator, denominator):
+        """Divides the values (NaN for zero or NaN denominator)"""
+        return np.divide(numerator, denominator, out=np.full(len(numerator), np.nan),
+                         where=np.nan_to_num(denominator) > 0)
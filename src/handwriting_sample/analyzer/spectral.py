@@ -0,0 +1,197 @@
+import numpy as np
+import pandas as pd
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer import HandwritingSampleTransformer
+from handwriting_sample.analyzer.interface import HandwritingSampleAnalyzer
+
+
+class HandwritingSampleSpectralAnalyzer(HandwritingDataBase):
+    """
+    Class implementing spectral (e.g. tremor) analysis of handwriting strokes.
+
+    The strokes are resampled to a uniform sampling rate, laid out as rows of padded 2D
+    batches (Hann window of each stroke's own length, the mean removed) and transformed by
+    one rFFT per batch. The power spectral densities of the X and Y components are summed.
+    """
+
+    # Analyzed signals
+    POSITION = "position"
+    VELOCITY = "velocity"
+
+    SIGNALS = [POSITION, VELOCITY]
+
+    # Defaults
+    DEFAULT_SAMPLING_RATE = 200
+    DEFAULT_BAND = (4, 12)
+    DEFAULT_MIN_LENGTH = 16
+    DEFAULT_BATCH_SIZE = 1 << 14
+
+    @classmethod
+    def analyze(
+            cls,
+            samples,
+            band=DEFAULT_BAND,
+            signal=VELOCITY,
+            sampling_rate=DEFAULT_SAMPLING_RATE,
+            time_scale=None,
+            on_surface_only=True,
+            min_length=DEFAULT_MIN_LENGTH,
+            nfft=None,
+            batch_size=DEFAULT_BATCH_SIZE,
+            return_spectra=False):
+        """
+        Computes the power spectra of the strokes and their band power summaries.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param band: OPTIONAL, frequency band [Hz], DEFAULT = (4, 12)
+        :type band: tuple
+        :param signal: OPTIONAL ["position"|"velocity"], DEFAULT = "velocity"
+        :type signal: str
+        :param sampling_rate: OPTIONAL, sampling rate of the resampled strokes [Hz], DEFAULT = 200
+        :type sampling_rate: float
+        :param time_scale: OPTIONAL, number of time units per second (inferred from the data if not given)
+        :type time_scale: float
+        :param on_surface_only: OPTIONAL, analyze on-surface strokes only, DEFAULT = True
+        :type on_surface_only: bool
+        :param min_length: OPTIONAL, minimal number of (resampled) points of an analyzed stroke, DEFAULT = 16
+        :type min_length: int
+        :param nfft: OPTIONAL, length of the FFT, DEFAULT = the power of 2 fitting the longest stroke
+        :type nfft: int
+        :param batch_size: OPTIONAL, number of strokes transformed at once, DEFAULT = 16384
+        :type batch_size: int
+        :param return_spectra: OPTIONAL, return the spectra of the strokes and samples, DEFAULT = False
+        :type return_spectra: bool
+        :return: {"frequencies": frequencies,
+                  "strokes": DataFrame of the analyzed strokes,
+                  "samples": DataFrame of the samples,
+                  "stroke_spectra": power spectral densities of the strokes (or None),
+                  "sample_spectra": summed power spectral densities of the samples (or None)}
+        :rtype: dict
+        """
+
+        # Check input
+        samples = list(samples)
+        if signal not in cls.SIGNALS:
+            raise ValueError(f"Unknown signal {signal}. Please select from {cls.SIGNALS}.")
+        if len(band) != 2 or not 0 <= band[0] < band[1]:
+            raise ValueError(f"Band must be a (low, high) frequency range!")
+        if not isinstance(min_length, int) or min_length < 2:
+            raise ValueError(f"Minimal length must be an integer of at least 2!")
+
+        # Resample the strokes
+        resampled, starts, ends, stroke_samples, periods = HandwritingSampleTransformer.resample_strokes(
+            samples, sampling_rate, time_scale=time_scale, columns=[cls.AXIS_X, cls.AXIS_Y])
+
+        # Select the strokes
+        lengths = ends - starts
+        selected = lengths >= min_length
+        if on_surface_only and starts.size:
+            selected &= resampled[cls.PEN_STATUS][starts] == 1
+        selected = np.flatnonzero(selected)
+
+        # Get the components of the signal
+        components = [resampled[cls.AXIS_X], resampled[cls.AXIS_Y]]
+        if signal == cls.VELOCITY:
+            time = resampled[cls.TIME] / np.repeat(periods[stroke_samples] * sampling_rate, lengths)
+            components = [HandwritingSampleAnalyzer.derivative(values, time, starts, ends) for values in components]
+
+        # Prepare the frequencies
+        max_length = int(lengths[selected].max()) if selected.size else min_length
+        nfft = nfft or 1 << (max_length - 1).bit_length()
+        if nfft < max_length:
+            raise ValueError(f"Length of the FFT ({nfft}) is lower than the longest stroke ({max_length})!")
+
+        frequencies = np.fft.rfftfreq(nfft, d=1 / sampling_rate)
+        in_band = (frequencies >= band[0]) & (frequencies <= band[1])
+        resolution = sampling_rate / nfft
+
+        # Compute the spectra batch by batch
+        band_power = np.zeros(selected.size)
+        total_power = np.zeros(selected.size)
+        peak_frequency = np.full(selected.size, np.nan)
+        sample_spectra = np.zeros((len(samples), frequencies.size))
+        stroke_spectra = np.zeros((selected.size, frequencies.size)) if return_spectra else None
+
+        for first in range(0, selected.size, batch_size):
+            batch = selected[first:first + batch_size]
+            power = cls._power_spectra(components, starts[batch], lengths[batch], nfft, sampling_rate)
+
+            # Summarize the strokes
+            band_power[first:first + batch.size] = power[:, in_band].sum(axis=1) * resolution
+            total_power[first:first + batch.size] = power[:, 1:].sum(axis=1) * resolution
+            if in_band.any():
+                peak_frequency[first:first + batch.size] = frequencies[in_band][power[:, in_band].argmax(axis=1)]
+            if return_spectra:
+                stroke_spectra[first:first + batch.size] = power
+
+            # Sum the spectra of the samples (the strokes of a sample are consecutive)
+            groups = np.flatnonzero(np.diff(stroke_samples[batch], prepend=-1))
+            sample_spectra[stroke_samples[batch][groups]] += np.add.reduceat(power, groups, axis=0)
+
+        # Prepare the stroke summaries
+        stroke_index = np.arange(starts.size) - np.searchsorted(stroke_samples, stroke_samples, side="left")
+        strokes = pd.DataFrame({
+            "sample": stroke_samples[selected],
+            "stroke": stroke_index[selected],
+            "start_time": resampled[cls.TIME][starts[selected]],
+            "length": lengths[selected],
+            "band_power": band_power,
+            "total_power": total_power,
+            "relative_band_power": cls._ratio(band_power, total_power),
+            "peak_frequency": peak_frequency
+        })
+
+        # Prepare the sample summaries
+        sample_band_power = sample_spectra[:, in_band].sum(axis=1) * resolution
+        sample_total_power = sample_spectra[:, 1:].sum(axis=1) * resolution
+        samples_summary = pd.DataFrame({
+            "sample": np.arange(len(samples)),
+            "strokes": np.bincount(stroke_samples[selected], minlength=len(samples)),
+            "band_power": sample_band_power,
+            "total_power": sample_total_power,
+            "relative_band_power": cls._ratio(sample_band_power, sample_total_power),
+            "peak_frequency": np.where(sample_total_power > 0,
+                                       frequencies[in_band][sample_spectra[:, in_band].argmax(axis=1)]
+                                       if in_band.any() else np.nan, np.nan)
+        })
+
+        # Return the results
+        return {
+            "frequencies": frequencies,
+            "strokes": strokes,
+            "samples": samples_summary,
+            "stroke_spectra": stroke_spectra,
+            "sample_spectra": sample_spectra if return_spectra else None
+        }
+
+    @staticmethod
+    def _power_spectra(components, starts, lengths, nfft, sampling_rate):
+        """Computes the one-sided power spectral densities of a batch of strokes (summed over the components)"""
+
+        # Lay out the strokes as rows of a padded batch
+        positions = np.arange(lengths.max())
+        valid = positions < lengths[:, None]
+        indices = np.where(valid, starts[:, None] + positions, 0)
+
+        # Hann window of each stroke's own length
+        window = np.where(valid, 0.5 - 0.5 * np.cos(2 * np.pi * positions / (lengths[:, None] - 1)), 0)
+
+        # Sum the spectra of the components
+        power = 0
+        for values in components:
+            rows = np.where(valid, values[indices], 0)
+            rows -= (rows.sum(axis=1) / lengths)[:, None]
+            rows *= window
+            spectrum = np.fft.rfft(rows, n=nfft, axis=1)
+            power = power + spectrum.real ** 2 + spectrum.imag ** 2
+
+        # Scale to one-sided density
+        power /= (sampling_rate * (window ** 2).sum(axis=1))[:, None]
+        power[:, 1:(nfft + 1) // 2] *= 2
+        return power
+
+    @staticmethod
+    def _ratio(numerator, denominator):
+        """Divides the values (NaN for zero denominator)"""
+        return np.divide(numerator, denominator, out=np.full(len(numerator), np.nan), where=denominator > 0)
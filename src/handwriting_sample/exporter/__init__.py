@@ -0,0 +1 @@
+from handwriting_sample.exporter.interface import HandwritingSampleExporter
@@ -0,0 +1,288 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from handwriting_sample.base import HandwritingDataBase
+
+
+class HandwritingSampleExporter(HandwritingDataBase):
+    """Class implementing the export of handwriting data to arrays for (sequence) models (windows, padded batches)"""
+
+    # Padding policies
+    NO_PADDING = "none"
+    ZERO_PADDING = "zero"
+    EDGE_PADDING = "edge"
+
+    PADDING = [NO_PADDING, ZERO_PADDING, EDGE_PADDING]
+
+    # Window masks
+    CROSSES_STROKE = "crosses_stroke"
+    CROSSES_PEN_LIFT = "crosses_pen_lift"
+    VALID = "valid"
+
+    # --------------- #
+    # Sliding windows #
+    # --------------- #
+
+    def sliding_windows(self, sample, window, stride=1, columns=None, padding=NO_PADDING, dtype=None,
+                        contiguous=False, return_masks=False):
+        """
+        Segments the sample into (overlapping) windows.
+
+        The windows are a strided view of one (N, channels) array, so the overlapping windows
+        share the memory. The array is the cached data array of the sample if all variables are
+        selected and no padding or type conversion is needed; otherwise it is built once.
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param window: number of points of a window
+        :type window: int
+        :param stride: OPTIONAL, number of points between the starts of the windows, DEFAULT = 1
+        :type stride: int
+        :param columns: OPTIONAL, variables (channels), DEFAULT = all variables
+        :type columns: list[str]
+        :param padding: OPTIONAL ["none"|"zero"|"edge"], DEFAULT = "none"
+                        "none" drops the points not filling the last window, "zero" and "edge"
+                        pad the end so that the last window covers the last point
+        :type padding: str
+        :param dtype: OPTIONAL, data type of the windows, DEFAULT = float64
+        :type dtype: np.dtype
+        :param contiguous: OPTIONAL, return a contiguous copy instead of the view, DEFAULT = False
+        :type contiguous: bool
+        :param return_masks: OPTIONAL, return the masks of the windows, DEFAULT = False
+        :type return_masks: bool
+        :return: windows (n_windows, window, channels), optionally with the masks
+                 {"crosses_stroke": (n_windows,), "crosses_pen_lift": (n_windows,), "valid": (n_windows, window)}
+        :rtype: np.array or (np.array, dict)
+        """
+
+        # Check input
+        columns = self._check_columns(columns)
+        self._check_windowing(window, stride, padding)
+        dtype = np.dtype(dtype or float)
+
+        # Get the number of windows
+        size = len(sample.time)
+        n_windows = self._count_windows(size, window, stride, padding)
+        padded_size = (n_windows - 1) * stride + window if n_windows else size
+
+        # Get the (N, channels) array
+        if columns == self.COLUMNS and dtype == np.float64:
+            data = sample._data_array
+        else:
+            data = np.column_stack([np.asarray(getattr(sample, column), dtype=dtype) for column in columns]) \
+                if size else np.empty((0, len(columns)), dtype=dtype)
+
+        data = data.astype(dtype, copy=False)
+        if padded_size > size:
+            data = np.pad(data, ((0, padded_size - size), (0, 0)),
+                          mode="constant" if padding == self.ZERO_PADDING or not size else "edge")
+
+        # Get the windows (strided view)
+        if n_windows:
+            windows = sliding_window_view(data, window, axis=0)[::stride].transpose(0, 2, 1)
+        else:
+            windows = np.empty((0, window, len(columns)), dtype=dtype)
+
+        if contiguous:
+            windows = np.ascontiguousarray(windows)
+
+        # Return the windows
+        if not return_masks:
+            return windows
+        return windows, self.window_masks(sample.pen_status, window, stride, n_windows)
+
+    def sliding_windows_batch(self, samples, window, stride=1, columns=None, padding=NO_PADDING, dtype=None,
+                              contiguous=False, return_masks=False):
+        """
+        Segments many samples into (overlapping) windows (see sliding_windows).
+
+        The windows of different samples cannot share one strided view, so they are returned as
+        a list of views (one per sample) unless a contiguous array is requested.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param contiguous: OPTIONAL, return one contiguous array of all windows, DEFAULT = False
+        :type contiguous: bool
+        :return: windows (a list of views or one array), sample index of each window,
+                 optionally with the masks of all windows
+        :rtype: (list[np.array] or np.array, np.array) or (list[np.array] or np.array, np.array, dict)
+        """
+
+        # Segment the samples
+        results = [self.sliding_windows(sample, window, stride=stride, columns=columns, padding=padding,
+                                        dtype=dtype, return_masks=return_masks)
+                   for sample in samples]
+        windows = [result[0] for result in results] if return_masks else results
+        index = np.repeat(np.arange(len(windows)), [len(values) for values in windows])
+
+        if contiguous:
+            windows = np.concatenate(windows) if windows else \
+                np.empty((0, window, len(self._check_columns(columns))), dtype=dtype or float)
+
+        # Return the windows
+        if not return_masks:
+            return windows, index
+        masks = {name: np.concatenate([result[1][name] for result in results]) if results else np.empty(0, bool)
+                 for name in (self.CROSSES_STROKE, self.CROSSES_PEN_LIFT, self.VALID)}
+        return windows, index, masks
+
+    @classmethod
+    def window_masks(cls, pen_status, window, stride, n_windows):
+        """
+        Gets the masks of the windows.
+
+        :param pen_status: pen status of the sample
+        :type pen_status: np.array
+        :param window: number of points of a window
+        :type window: int
+        :param stride: number of points between the starts of the windows
+        :type stride: int
+        :param n_windows: number of windows
+        :type n_windows: int
+        :return: {"crosses_stroke": windows with a pen status change,
+                  "crosses_pen_lift": windows with a pen lift (on-surface to in-air),
+                  "valid": points of the windows that are not padding}
+        :rtype: dict
+        """
+        pen_status = np.asarray(pen_status).astype(bool)
+        size = pen_status.size
+
+        # Count the stroke changes and pen lifts up to each point
+        changes = np.concatenate(([0], np.cumsum(pen_status[1:] != pen_status[:-1])))
+        lifts = np.concatenate(([0], np.cumsum(pen_status[:-1] & ~pen_status[1:])))
+
+        # Compare the counts at the first and the last (non-padding) points of the windows
+        starts = np.arange(n_windows) * stride
+        last = np.minimum(starts + window, size) - 1
+        first = np.minimum(starts, size - 1)
+
+        return {
+            cls.CROSSES_STROKE: changes[last] != changes[first] if size else np.zeros(n_windows, dtype=bool),
+            cls.CROSSES_PEN_LIFT: lifts[last] != lifts[first] if size else np.zeros(n_windows, dtype=bool),
+            cls.VALID: starts[:, None] + np.arange(window) < size
+        }
+
+    # -------------- #
+    # Padded batches #
+    # -------------- #
+
+    def padded_batch(self, samples, columns=None, dtype=None, max_length=None, pad_value=0):
+        """
+        Exports many samples to one padded array of shape (batch, max_len, channels).
+
+        The array is preallocated and filled directly from the variables of the samples
+        (no intermediate per-sample arrays are stacked).
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param columns: OPTIONAL, variables (channels), DEFAULT = all variables
+        :type columns: list[str]
+        :param dtype: OPTIONAL, data type of the array (e.g. np.float32), DEFAULT = float64
+        :type dtype: np.dtype
+        :param max_length: OPTIONAL, the samples are truncated to max_length points, DEFAULT = the longest sample
+        :type max_length: int
+        :param pad_value: OPTIONAL, value of the padding, DEFAULT = 0
+        :type pad_value: float
+        :return: {"data": padded array (batch, max_len, channels),
+                  "lengths": number of (not padded) points of each sample,
+                  "mask": mask of the (not padded) points (batch, max_len),
+                  "index": index of each sample in the input}
+        :rtype: dict
+        """
+
+        # Check input
+        samples = list(samples)
+        columns = self._check_columns(columns)
+        if max_length is not None and (not isinstance(max_length, (int, np.integer)) or max_length < 1):
+            raise ValueError(f"Maximal length must be a positive integer!")
+
+        # Export the samples
+        return self._padded_batch(samples, np.arange(len(samples)), columns, np.dtype(dtype or float), max_length,
+                                  pad_value)
+
+    def padded_batches(self, samples, batch_size, columns=None, dtype=None, max_length=None, pad_value=0,
+                       bucket=True):
+        """
+        Exports many samples to padded batches (see padded_batch).
+
+        With bucketing, the samples are sorted by their lengths first, so that the samples of
+        similar lengths share a batch and the padding is minimal. The "index" of each batch maps
+        its rows back to the input samples.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param batch_size: number of samples of a batch
+        :type batch_size: int
+        :param bucket: OPTIONAL, bucket the samples by their lengths, DEFAULT = True
+        :type bucket: bool
+        :return: padded batches
+        :rtype: list[dict]
+        """
+
+        # Check input
+        samples = list(samples)
+        columns = self._check_columns(columns)
+        dtype = np.dtype(dtype or float)
+        if not isinstance(batch_size, (int, np.integer)) or batch_size < 1:
+            raise ValueError(f"Batch size must be a positive integer!")
+        if max_length is not None and (not isinstance(max_length, (int, np.integer)) or max_length < 1):
+            raise ValueError(f"Maximal length must be a positive integer!")
+
+        # Order the samples (stable, so the samples of the same length keep their order)
+        order = np.arange(len(samples))
+        if bucket:
+            order = np.argsort([len(sample.time) for sample in samples], kind="stable")
+
+        # Export the batches
+        return [self._padded_batch([samples[i] for i in index], index, columns, dtype, max_length, pad_value)
+                for index in (order[first:first + batch_size] for first in range(0, len(samples), batch_size))]
+
+    @staticmethod
+    def _padded_batch(samples, index, columns, dtype, max_length, pad_value):
+        """Fills the preallocated padded array of the samples"""
+
+        # Get the lengths of the samples
+        lengths = np.array([len(sample.time) for sample in samples], dtype=np.int64)
+        if max_length is not None:
+            lengths = np.minimum(lengths, max_length)
+        length = int(lengths.max()) if lengths.size else 0
+
+        # Preallocate the arrays
+        data = np.full((len(samples), length, len(columns)), pad_value, dtype=dtype)
+        mask = np.arange(length) < lengths[:, None]
+
+        # Fill the array from the variables of the samples
+        for row, (sample, size) in enumerate(zip(samples, lengths.tolist())):
+            for channel, column in enumerate(columns):
+                data[row, :size, channel] = getattr(sample, column)[:size]
+
+        return {"data": data, "lengths": lengths, "mask": mask, "index": np.asarray(index, dtype=np.int64)}
+
+    # --------------- #
+    # Utility methods #
+    # --------------- #
+
+    @classmethod
+    def _count_windows(cls, size, window, stride, padding):
+        """Returns the number of windows"""
+        if padding == cls.NO_PADDING:
+            return (size - window) // stride + 1 if size >= window else 0
+        return max(0, -(-(size - window) // stride)) + 1 if size else 0
+
+    @classmethod
+    def _check_columns(cls, columns):
+        """Checks the selected variables"""
+        columns = list(columns or cls.COLUMNS)
+        unknown = set(columns).difference(cls.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown variables {sorted(unknown)}. Please select from {cls.COLUMNS}.")
+        return columns
+
+    @classmethod
+    def _check_windowing(cls, window, stride, padding):
+        """Checks the windowing parameters"""
+        if not isinstance(window, (int, np.integer)) or window < 1:
+            raise ValueError(f"Window must be a positive integer!")
+        if not isinstance(stride, (int, np.integer)) or stride < 1:
+            raise ValueError(f"Stride must be a positive integer!")
+        if padding not in cls.PADDING:
+            raise ValueError(f"Unknown padding {padding}. Please select from {cls.PADDING}.")
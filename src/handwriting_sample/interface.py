@@ -5,19 +5,51 @@ from handwriting_sample.base import HandwritingDataBase
 from handwriting_sample.reader import HandwritingSampleReader
 from handwriting_sample.writer import HandwritingSampleWriter
 from handwriting_sample.validator import HandwritingSampleValidator
-from handwriting_sample.transformer import HandwritingSampleTransformer, TransformerAngleTypeException
+from handwriting_sample.transformer import HandwritingSampleTransformer, HandwritingSampleTransformationPipeline, \
+    HandwritingSampleFilter, HandwritingSampleSimplifier, HandwritingSampleAugmenter, \
+    HandwritingDeviceProfileRegistry, TransformerAngleTypeException
 from handwriting_sample.visualizer import HandwritingSampleVisualizer
+from handwriting_sample.analyzer import HandwritingSampleAnalyzer, HandwritingSampleSpectralAnalyzer, \
+    HandwritingSampleQualityAnalyzer
+from handwriting_sample.exporter import HandwritingSampleExporter
+
+
+def _column_property(column):
+    """Creates a property of the handwriting variable (the setter keeps the original data reconstructable)"""
+    return property(lambda self: self._columns[column],
+                    lambda self, value: self._set_column(column, value),
+                    doc=f"Handwriting variable '{column}'")
 
 
 class HandwritingSample(HandwritingDataBase):
     """Class implementing the management of sample handwriting samples"""
 
-    # Handwriting data helpers (reading, writing, validation, transformer, visualizer)
+    # Handwriting data helpers (reading, writing, validation, transformer, filters, simplifier, augmenter, visualizer,
+    # analyzer, exporter)
     reader = HandwritingSampleReader()
     writer = HandwritingSampleWriter()
     validator = HandwritingSampleValidator()
     transformer = HandwritingSampleTransformer()
+    filters = HandwritingSampleFilter()
+    simplifier = HandwritingSampleSimplifier()
+    augmenter = HandwritingSampleAugmenter()
     visualizer = HandwritingSampleVisualizer()
+    analyzer = HandwritingSampleAnalyzer()
+    spectral_analyzer = HandwritingSampleSpectralAnalyzer()
+    quality_analyzer = HandwritingSampleQualityAnalyzer()
+    exporter = HandwritingSampleExporter()
+
+    # Registry of device profiles (resolved from the meta data)
+    device_profiles = HandwritingDeviceProfileRegistry()
+
+    # Handwriting variables
+    x = _column_property(HandwritingDataBase.AXIS_X)
+    y = _column_property(HandwritingDataBase.AXIS_Y)
+    time = _column_property(HandwritingDataBase.TIME)
+    pen_status = _column_property(HandwritingDataBase.PEN_STATUS)
+    azimuth = _column_property(HandwritingDataBase.AZIMUTH)
+    tilt = _column_property(HandwritingDataBase.TILT)
+    pressure = _column_property(HandwritingDataBase.PRESSURE)
 
     # TODO: idea: I think np.column_stack is going to work if X, Y, etc. are 1D numpy arrays as well
     def __init__(self, x, y, time, pen_status, azimuth, tilt, pressure, meta_data=None, validate=True, verbose=False):
@@ -49,20 +81,27 @@ class HandwritingSample(HandwritingDataBase):
         # Create pandas DataFrame object from the input handwriting variables
         df = pd.DataFrame(np.column_stack([x, y, time, pen_status, azimuth, tilt, pressure]), columns=self.COLUMNS)
 
-        # Validate and store input data
-        self._data = self.validator.validate_data(df, verbose=verbose) if validate else df
+        # Validate input data
+        df = self.validator.validate_data(df, verbose=verbose) if validate else df
 
         # Store meta data of any kind
         self.meta = meta_data
 
-        # Set the handwriting variables
-        self.x = self._data[self.AXIS_X].to_numpy()
-        self.y = self._data[self.AXIS_Y].to_numpy()
-        self.time = self._data[self.TIME].to_numpy()
-        self.pen_status = self._data[self.PEN_STATUS].to_numpy(dtype=bool if validate else None)
-        self.azimuth = self._data[self.AZIMUTH].to_numpy()
-        self.tilt = self._data[self.TILT].to_numpy()
-        self.pressure = self._data[self.PRESSURE].to_numpy()
+        # Set the handwriting variables (each variable owns its array, so replacing one releases its memory)
+        self._columns = {
+            column: df[column].to_numpy(dtype=bool if validate and column == self.PEN_STATUS else None, copy=True)
+            for column in self.COLUMNS
+        }
+
+        # The original data are not copied: they are reconstructed by inverting the recorded transformations,
+        # only the variables replaced outside of them are kept (in a compact form)
+        self._original_dtypes = {column: df[column].to_numpy().dtype for column in self.COLUMNS}
+        self._original_columns = {}
+        self._transformations = []
+
+        # Version of the handwriting variables (bumped whenever a variable is set) and the cached derived data
+        self._version = 0
+        self._cache = {}
 
     def __repr__(self):
         return f"<HandwritingSampleObject: \n" \
@@ -77,6 +116,61 @@ class HandwritingSample(HandwritingDataBase):
                f"METADATA:\n" \
                f"{self.meta.items() if self.meta else None}"
 
+    def __len__(self):
+        return len(self._columns[self.TIME])
+
+    def __getitem__(self, index):
+        """
+        Returns the rows of the sample (a view sharing the arrays of the sample, read-only).
+
+        :param index: row index or slice
+        :type index: int or slice
+        :return: instance of HandwritingSample with the selected rows
+        :rtype: HandwritingSample
+        """
+        if isinstance(index, slice):
+            return self._view(index)
+        if isinstance(index, (int, np.integer)):
+            position = range(len(self))[index]
+            return self._view(slice(position, position + 1))
+        raise TypeError(f"HandwritingSample indices must be integers or slices, not {type(index).__name__}")
+
+    def between(self, start_time=None, end_time=None):
+        """
+        Returns the rows recorded from the start time to the end time (inclusive).
+
+        The rows are found by binary search, so time must not decrease. The result is a view
+        sharing the arrays of the sample (read-only, the transformations create new arrays).
+
+        :param start_time: start time (in the units of time), defaults to None (beginning)
+        :type start_time: float, optional
+        :param end_time: end time (in the units of time), defaults to None (end)
+        :type end_time: float, optional
+        :return: instance of HandwritingSample with the selected rows
+        :rtype: HandwritingSample
+        """
+        time = self._columns[self.TIME]
+        start = np.searchsorted(time, start_time, side="left") if start_time is not None else 0
+        end = np.searchsorted(time, end_time, side="right") if end_time is not None else len(time)
+        return self._view(slice(int(start), int(max(start, end))))
+
+    def _view(self, rows):
+        """Returns a new instance of HandwritingSample with the slice of the rows (read-only views, no copies)"""
+        return self._from_arrays(
+            {column: self._read_only(values[rows]) for column, values in self._columns.items()},
+            meta_data=dict(self.meta) if self.meta else self.meta,
+            original_dtypes=self._original_dtypes,
+            original_columns=self._get_original_rows(rows),
+            transformations=[dict(transformation) for transformation in self._transformations])
+
+    def _get_original_rows(self, rows):
+        """Returns the kept original values of the rows (read-only)"""
+
+        # The values of another length (kept before a step changing the number of rows, e.g. resampling)
+        # do not map to the rows, so they are returned unchanged
+        return {column: self._read_only(values[rows]) if len(values) == len(self) else values
+                for column, values in self._original_columns.items()}
+
     # ---------- #
     # Properties #
     # ---------- #
@@ -84,42 +178,82 @@ class HandwritingSample(HandwritingDataBase):
     @property
     def data_list(self):
         """Returns list for the non-original data"""
-        return [self.x, self.y, self.time, self.pen_status, self.azimuth, self.tilt, self.pressure]
+        return list(self._get_cached("data_list", lambda: [getattr(self, column) for column in self.COLUMNS]))
 
     @property
     def data_numpy_array(self):
-        """Returns numpy array for the non-original data"""
-        return np.column_stack(self.data_list)
+        """Returns numpy array for the non-original data (a copy of the cached array)"""
+        return np.array(self._data_array)
 
     @property
     def data_pandas_dataframe(self):
-        """Returns pandas DataFrame for the non-original data"""
-        return pd.DataFrame(self.data_numpy_array, columns=self.COLUMNS)
+        """Returns pandas DataFrame for the non-original data (a copy of the cached DataFrame)"""
+        return self._data_frame.copy(deep=not self._pandas_copy_on_write())
 
     @property
     def original_data_list(self):
         """Returns list for the original data"""
-        return [self._data[column].to_numpy() for column in self._data.columns]
+        return [self._get_original_column(column) for column in self.COLUMNS]
 
     @property
     def original_numpy_array(self):
         """Returns numpy array for the original data"""
-        return self._data.values
+        return self.original_data_pandas_dataframe.values
 
     @property
     def original_data_pandas_dataframe(self):
         """Returns pandas DataFrame for the original data"""
-        return self._data
+        return pd.DataFrame(dict(zip(self.COLUMNS, self.original_data_list)))
+
+    @property
+    def transformations(self):
+        """Returns the recorded transformations (operation, parameters and per-variable coefficients)"""
+        return [dict(transformation) for transformation in self._transformations]
 
     @property
     def xy(self):
-        """Returns general movement of X and Y"""
-        return np.sqrt(np.power(self.x, 2) + np.power(self.y, 2))
+        """Returns general movement of X and Y (read-only)"""
+        return self._get_cached("xy", lambda: self._read_only(np.sqrt(np.power(self.x, 2) + np.power(self.y, 2))))
+
+    @property
+    def kinematics(self):
+        """
+        Returns kinematic features computed from X, Y and time within the strokes (see HandwritingSampleAnalyzer).
+
+        The features are computed on the first access and kept until a handwriting variable is set
+        (the arrays are read-only).
+        """
+        return dict(self._get_cached(
+            "kinematics",
+            lambda: {name: self._read_only(values) for name, values in self.analyzer.compute_kinematics(
+                self.x, self.y, self.time, self.pen_status).items()}))
+
+    @property
+    def velocity(self):
+        """Returns magnitude of velocity"""
+        return self.kinematics[self.analyzer.VELOCITY]
+
+    @property
+    def acceleration(self):
+        """Returns magnitude of acceleration"""
+        return self.kinematics[self.analyzer.ACCELERATION]
+
+    @property
+    def jerk(self):
+        """Returns magnitude of jerk"""
+        return self.kinematics[self.analyzer.JERK]
+
+    @property
+    def angular_velocity(self):
+        """Returns angular velocity (of the direction of the movement)"""
+        return self.kinematics[self.analyzer.ANGULAR_VELOCITY]
 
     @property
     def html_pointer_event_data(self):
         """Returns HTML Pointer Event data with X and Y in Pixel Values"""
-        return self.transform_sample_to_html_pointer_event()
+        return {key: list(values) if isinstance(values, list) else values
+                for key, values in self._get_cached("html_pointer_event_data",
+                                                    self.transform_sample_to_html_pointer_event).items()}
 
     # --------------- #
     # Reading methods #
@@ -142,6 +276,28 @@ class HandwritingSample(HandwritingDataBase):
         return cls._from_data_and_metadata(*cls.reader.read_from_json(path, columns or cls.COLUMNS),
                                            validate=validate)
 
+    @classmethod
+    def from_json_lines(cls, path, columns=None, validate=True, meta_filter=None):
+        """
+        Creates HandwritingSample instances from a JSON Lines file (one sample per line).
+
+        The file is read lazily line by line; records rejected by ``meta_filter``
+        are skipped without decoding their data.
+
+        :param path: path to a JSON Lines file
+        :type path: str
+        :param columns: handwriting variables, defaults to cls.COLUMNS
+        :type columns: list, optional
+        :param validate: true if validate input data
+        :type validate:bool
+        :param meta_filter: callable receiving the meta data, records are skipped if it returns False
+        :type meta_filter: callable, optional
+        :return: generator of HandwritingSample instances
+        :rtype: generator[HandwritingSample]
+        """
+        for data, meta_data in cls.reader.read_from_json_lines(path, columns or cls.COLUMNS, meta_filter=meta_filter):
+            yield cls._from_data_and_metadata(data, meta_data, validate=validate)
+
     @classmethod
     def from_svc(cls, path, columns=None, validate=True):
         """
@@ -159,6 +315,25 @@ class HandwritingSample(HandwritingDataBase):
         return cls._from_data_and_metadata(*cls.reader.read_from_svc(path, columns or cls.COLUMNS),
                                            validate=validate)
 
+    @classmethod
+    def from_archive(cls, path, columns=None, validate=True, n_jobs=1):
+        """
+        Creates HandwritingSample instances from the SVC/JSON files stored in a zip or tar archive.
+
+        :param path: path to a zip or tar archive
+        :type path: str
+        :param columns: handwriting variables, defaults to cls.COLUMNS
+        :type columns: list, optional
+        :param validate: true if validate input data
+        :type validate:bool
+        :param n_jobs: number of workers decoding zip members in parallel, defaults to 1
+        :type n_jobs: int, optional
+        :return: list of HandwritingSample instances (in the order of the archive members)
+        :rtype: list[HandwritingSample]
+        """
+        return [cls._from_data_and_metadata(data, meta_data, validate=validate)
+                for data, meta_data in cls.reader.read_from_archive(path, columns or cls.COLUMNS, n_jobs=n_jobs)]
+
     @classmethod
     def from_list(cls, data, columns=None, validate=True):
         """
@@ -176,6 +351,37 @@ class HandwritingSample(HandwritingDataBase):
         return cls._from_data_and_metadata(*cls.reader.read_from_list(data, columns or cls.COLUMNS),
                                            validate=validate)
 
+    @classmethod
+    def _from_arrays(cls, columns, meta_data=None, original_dtypes=None, original_columns=None, transformations=None):
+        """
+        Creates a HandwritingSample instance directly from the arrays of the variables.
+
+        The arrays are neither copied nor validated (they are expected to come from another sample).
+
+        :param columns: handwriting variables {column: array}
+        :type columns: dict
+        :param meta_data: dictionary with meta data, defaults to None
+        :type meta_data: dict, optional
+        :param original_dtypes: data types of the original variables, defaults to the types of the arrays
+        :type original_dtypes: dict, optional
+        :param original_columns: kept original values of the variables, defaults to None
+        :type original_columns: dict, optional
+        :param transformations: recorded transformations, defaults to None
+        :type transformations: list[dict], optional
+        :return: instance of HandwritingSample
+        :rtype: HandwritingSample
+        """
+        sample = cls.__new__(cls)
+        sample.meta = meta_data
+        sample._columns = {column: columns[column] for column in cls.COLUMNS}
+        sample._original_dtypes = dict(original_dtypes) if original_dtypes else \
+            {column: np.asarray(values).dtype for column, values in sample._columns.items()}
+        sample._original_columns = dict(original_columns or {})
+        sample._transformations = list(transformations or [])
+        sample._version = 0
+        sample._cache = {}
+        return sample
+
     @classmethod
     def from_numpy_array(cls, data, columns=None, validate=True):
         """
@@ -262,6 +468,19 @@ class HandwritingSample(HandwritingDataBase):
         """
         return self.writer.write_to_json(self, path, file_name=file_name, store_original_data=store_original_data)
 
+    def to_json_lines(self, path, store_original_data=False):
+        """
+        Appends sample data as a new line of a JSON Lines file.
+
+        :param path: path to the JSON Lines file
+        :type path: str
+        :param store_original_data: store original data, defaults to False
+        :type store_original_data: bool, optional
+        :return: None
+        :rtype: None type
+        """
+        return self.writer.write_to_json_lines(self, path, store_original_data=store_original_data)
+
     def to_svc(self, path, file_name=None, store_original_data=False):
         """
         Writes sample data to an SVC file.
@@ -277,6 +496,33 @@ class HandwritingSample(HandwritingDataBase):
         """
         return self.writer.write_to_svc(self, path, file_name=file_name, store_original_data=store_original_data)
 
+    @classmethod
+    def write_batch(cls, samples, path, file_format="json", file_names=None, store_original_data=False, n_jobs=4,
+                    use_processes=False):
+        """
+        Writes many samples to JSON or SVC files on a worker pool (each file is written atomically).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param path: path where data should be stored
+        :type path: str
+        :param file_format: OPTIONAL ["json"|"svc"], DEFAULT="json"
+        :type file_format: str
+        :param file_names: custom file names, defaults to None
+        :type file_names: list[str], optional
+        :param store_original_data: store original data, defaults to False
+        :type store_original_data: bool, optional
+        :param n_jobs: number of workers, defaults to 4
+        :type n_jobs: int, optional
+        :param use_processes: use worker processes instead of threads, defaults to False
+        :type use_processes: bool, optional
+        :return: per-sample report {"index", "path", "stored", "error"}
+        :rtype: list[dict]
+        """
+        return cls.writer.write_batch(samples, path, file_format=file_format, file_names=file_names,
+                                      store_original_data=store_original_data, n_jobs=n_jobs,
+                                      use_processes=use_processes)
+
     # ----------------------------- #
     # Handwriting data manipulation #
     # ----------------------------- #
@@ -285,7 +531,7 @@ class HandwritingSample(HandwritingDataBase):
         """Returns on-surface data as a HandwritingSample object"""
 
         # Get all on-surface data
-        df = self.data_pandas_dataframe
+        df = self._data_frame
         df = df[df[self.PEN_STATUS] == 1]
 
         # Return a new instance of HandwritingSample with only on-surface data
@@ -295,12 +541,38 @@ class HandwritingSample(HandwritingDataBase):
         """Returns in-air data as a HandwritingSample object"""
 
         # Return all in-air data
-        df = self.data_pandas_dataframe
+        df = self._data_frame
         df = df[df[self.PEN_STATUS] == 0]
 
         # Return a new instance of HandwritingSample with only in-air data
         return HandwritingSample(**df.to_dict(orient="list"), validate=False)
 
+    def simplify(self, tolerance):
+        """
+        Simplifies each stroke by the Douglas-Peucker algorithm.
+
+        :param tolerance: maximal distance of the removed points from the simplified trajectory (in units of X, Y)
+        :type tolerance: float
+        :return: simplified sample (all variables at the retained points)
+        :rtype: HandwritingSample
+        """
+        return self.simplifier.simplify(self, method=self.simplifier.DOUGLAS_PEUCKER, tolerance=tolerance)
+
+    def decimate(self, stride=None, bucket_size=None):
+        """
+        Decimates each stroke (keeps every stride-th point, or the min/max X and Y points of each bucket).
+
+        :param stride: stride of the retained points, defaults to None
+        :type stride: int, optional
+        :param bucket_size: number of points of a bucket (min-max decimation), defaults to None
+        :type bucket_size: int, optional
+        :return: decimated sample (all variables at the retained points)
+        :rtype: HandwritingSample
+        """
+        if bucket_size is not None:
+            return self.simplifier.simplify(self, method=self.simplifier.MIN_MAX, bucket_size=bucket_size)
+        return self.simplifier.simplify(self, method=self.simplifier.STRIDE, stride=stride)
+
     def get_on_surface_strokes(self):
         """Returns strokes on-surface"""
         return self.get_strokes(on_surface_only=True)
@@ -326,7 +598,7 @@ class HandwritingSample(HandwritingDataBase):
             on_surface_only, in_air_only = False, False
 
         # Get accessible data of the sample as a pandas DataFrame
-        df = self.data_pandas_dataframe
+        df = self._data_frame
 
         # Get index values of the pen status column changes
         idx_change = df.ne(df.shift()).filter(like=self.PEN_STATUS).apply(lambda x: x.index[x].tolist())
@@ -369,6 +641,219 @@ class HandwritingSample(HandwritingDataBase):
     # ------------------------------- #
     # Handwriting data transformation #
     # ------------------------------- #
+
+    def _apply_transformation(self, operation, parameters, columns, matrix=None, originals_kept=False):
+        """
+        Sets the transformed handwriting variables and records the transformation.
+
+        Each variable is transformed as ``new = old * scale + offset``; the original data
+        are then reconstructed by inverting the recorded chain and rounding, which is exact
+        for integers. If the scale is None (or 0), the transformation is not invertible and
+        the original values of the variable are kept instead; so are the original values
+        that are not integers (kept when the variable is transformed for the first time).
+        An affine transformation of X and Y is recorded as its 3x3 matrix (the coefficients
+        of the axis are then None) and the axis are inverted together.
+
+        :param operation: name of the transformation
+        :type operation: str
+        :param parameters: parameters of the transformation
+        :type parameters: dict
+        :param columns: transformed variables {column: (values, scale, offset)}
+        :type columns: dict
+        :param matrix: OPTIONAL, 3x3 matrix of the affine transformation of X and Y, DEFAULT = None
+        :type matrix: np.array
+        :param originals_kept: OPTIONAL, the original values were kept before the variables were changed
+                               in place (see _keep_original_data), DEFAULT = False
+        :type originals_kept: bool
+        :return: None
+        :rtype: None type
+        """
+
+        # Keep the original values that cannot be reconstructed
+        if not originals_kept:
+            self._keep_original_data({column: scale for column, (_, scale, _) in columns.items()}, matrix=matrix)
+
+        # Set the transformed variables
+        for column, (values, _, _) in columns.items():
+            self._columns[column] = values
+        self._version += 1
+
+        # Record the transformation
+        transformation = {
+            "operation": operation,
+            "parameters": parameters,
+            "coefficients": {column: (scale, offset) for column, (_, scale, offset) in columns.items()}
+        }
+        if matrix is not None:
+            transformation["matrix"] = np.asarray(matrix, dtype=float).tolist()
+        self._transformations.append(transformation)
+
+    def _keep_original_data(self, scales, matrix=None):
+        """
+        Keeps the original values of the variables that cannot be reconstructed after the transformation.
+
+        It is called by _apply_transformation, or before the variables are changed in place
+        (the original values are read from the variables, so they must not be changed yet).
+
+        :param scales: scales of the transformed variables {column: scale}
+        :type scales: dict
+        :param matrix: OPTIONAL, 3x3 matrix of the affine transformation of X and Y, DEFAULT = None
+        :type matrix: np.array
+        :return: None
+        :rtype: None type
+        """
+
+        # Get the variables that cannot be reconstructed
+        if matrix is None:
+            kept = [column for column, scale in scales.items() if not scale]
+        elif abs(np.linalg.det(matrix)) < np.finfo(float).eps or \
+                self.AXIS_X in self._original_columns or self.AXIS_Y in self._original_columns:
+            kept = [self.AXIS_X, self.AXIS_Y]
+        else:
+            kept = []
+
+        # Get the variables transformed for the first time that cannot be reconstructed exactly (not integers)
+        kept += [column for column in scales if not self._is_transformed(column)
+                 and not self._is_restorable(self._columns[column])]
+
+        # Keep their original values (X and Y are kept together once they are coupled by an affine transformation)
+        if matrix is not None or self._has_affine_transformation():
+            kept += [self.AXIS_X, self.AXIS_Y] if set(kept).intersection((self.AXIS_X, self.AXIS_Y)) else []
+        originals = {column: self._compact(self._get_original_column(column))
+                     for column in dict.fromkeys(kept) if column not in self._original_columns}
+        self._original_columns.update(originals)
+
+    def _set_column(self, column, values):
+        """Sets the handwriting variable outside of the recorded transformations"""
+
+        # Keep the original values (the new ones cannot be inverted)
+        columns = [column]
+        if column in (self.AXIS_X, self.AXIS_Y) and self._has_affine_transformation():
+            columns = [self.AXIS_X, self.AXIS_Y]
+        originals = {name: self._compact(self._get_original_column(name))
+                     for name in columns if name not in self._original_columns}
+        self._original_columns.update(originals)
+
+        # Set the variable
+        self._columns[column] = values
+        self._version += 1
+
+    def _get_original_column(self, column):
+        """Returns the original values of the handwriting variable"""
+
+        # Return the kept original values (a copy, so the kept values cannot be changed through the result)
+        if column in self._original_columns:
+            return self._original_columns[column].astype(self._original_dtypes[column])
+
+        # Invert the affine transformations of X and Y together
+        if column in (self.AXIS_X, self.AXIS_Y) and self._has_affine_transformation():
+            return self._restore_dtype(column, self._get_original_axis()[column])
+
+        # Get the recorded coefficients of the variable
+        coefficients = [transformation["coefficients"][column] for transformation in self._transformations
+                        if column in transformation["coefficients"]]
+
+        # Return the non-transformed values (a copy in the original data type, e.g. pen status is stored as bool)
+        if not coefficients:
+            return np.asarray(self._columns[column]).astype(self._original_dtypes[column])
+
+        # Invert the transformations
+        values = np.asarray(self._columns[column], dtype=float)
+        for scale, offset in reversed(coefficients):
+            values = (values - offset) / scale
+
+        # Return the original values
+        return self._restore_dtype(column, values)
+
+    def _get_original_axis(self):
+        """Returns the original (float) values of X and Y by inverting the chain of transformations together"""
+        axis = {self.AXIS_X: np.asarray(self.x, dtype=float), self.AXIS_Y: np.asarray(self.y, dtype=float)}
+
+        for transformation in reversed(self._transformations):
+            if "matrix" in transformation:
+                inverse = np.linalg.inv(np.asarray(transformation["matrix"]))
+                x, y = axis[self.AXIS_X], axis[self.AXIS_Y]
+                axis = {self.AXIS_X: inverse[0, 0] * x + inverse[0, 1] * y + inverse[0, 2],
+                        self.AXIS_Y: inverse[1, 0] * x + inverse[1, 1] * y + inverse[1, 2]}
+                continue
+            for column in axis:
+                if column in transformation["coefficients"]:
+                    scale, offset = transformation["coefficients"][column]
+                    axis[column] = (axis[column] - offset) / scale
+
+        return axis
+
+    def _has_affine_transformation(self):
+        """Returns true if an affine transformation of X and Y is recorded"""
+        return any("matrix" in transformation for transformation in self._transformations)
+
+    def _is_transformed(self, column):
+        """Returns true if a transformation of the handwriting variable is recorded or its original values are kept"""
+        return column in self._original_columns or \
+            any(column in transformation["coefficients"] for transformation in self._transformations)
+
+    @staticmethod
+    def _is_restorable(values):
+        """Returns true if rounding restores the values exactly from the inverted transformations (integers)"""
+        values = np.asarray(values)
+        if values.dtype == np.bool_ or not values.size:
+            return True
+        return bool(np.array_equal(values, np.round(values)) and np.abs(values).max() < 2 ** 48)
+
+    def _restore_dtype(self, column, values):
+        """Casts the reconstructed values to the original data type (only integers are reconstructed)"""
+        return np.round(values).astype(self._original_dtypes[column])
+
+    @property
+    def _data_array(self):
+        """Returns the cached numpy array for the non-original data (read-only, shared by all callers)"""
+        return self._get_cached("data_numpy_array", lambda: self._read_only(np.column_stack(self.data_list)))
+
+    @property
+    def _data_frame(self):
+        """Returns the cached pandas DataFrame for the non-original data (shared by all callers, not to be modified)"""
+        return self._get_cached("data_pandas_dataframe",
+                                lambda: pd.DataFrame(np.array(self._data_array), columns=self.COLUMNS, copy=False))
+
+    @staticmethod
+    def _pandas_copy_on_write():
+        """Returns true if pandas copy-on-write is enabled (a shallow copy of a DataFrame then cannot change it)"""
+        return int(pd.__version__.split(".")[0]) >= 3 or getattr(pd.options.mode, "copy_on_write", False) is True
+
+    def _get_cached(self, name, compute):
+        """
+        Returns the derived data computed from the handwriting variables.
+
+        The data are computed on the first access and kept until the version of the variables
+        changes (any variable is set or transformed). Changes made directly inside the arrays
+        of the variables are not tracked.
+
+        :param name: name of the derived data
+        :type name: str
+        :param compute: function computing the derived data
+        :type compute: callable
+        :return: derived data
+        :rtype: any
+        """
+        cached = self._cache.get(name)
+        if cached is None or cached[0] != self._version:
+            cached = self._cache[name] = (self._version, compute())
+        return cached[1]
+
+    @staticmethod
+    def _read_only(values):
+        """Marks the array as read-only (cached arrays are shared by all callers)"""
+        values.flags.writeable = False
+        return values
+
+    @staticmethod
+    def _compact(values):
+        """Stores integer values in the smallest integer type"""
+        values = np.asarray(values)
+        if values.size and np.issubdtype(values.dtype, np.integer):
+            return values.astype(np.promote_types(np.min_scalar_type(values.min()), np.min_scalar_type(values.max())))
+        return values
+
     # TODO: use **kwargs
     def transform_all_units(
             self,
@@ -382,7 +867,9 @@ class HandwritingSample(HandwritingDataBase):
             max_pressure=transformer.MAX_PRESSURE_VALUE,
             pressure_levels=transformer.PRESSURE_LEVELS,
             angles_to_degrees=True,
-            shift_to_zero=True):
+            shift_to_zero=True,
+            fused=False,
+            inplace=False):
         """
         Transforms all unites of sample object:
             - transforms X,Y to millimeters.
@@ -424,6 +911,12 @@ class HandwritingSample(HandwritingDataBase):
         :param shift_to_zero: OPTIONAL, DEFAULT = True
                               Shift axis values to start from 0,0 coordinates
         :type shift_to_zero: bool
+        :param fused: OPTIONAL, DEFAULT = False
+                      Compute all conversions in place over one float array per variable
+        :type fused: bool
+        :param inplace: OPTIONAL, DEFAULT = False
+                        Fused conversions write to the float arrays of the sample (implies fused)
+        :type inplace: bool
         """
         self.transformer.transform_all_units(
             self,
@@ -437,7 +930,135 @@ class HandwritingSample(HandwritingDataBase):
             max_pressure=max_pressure,
             pressure_levels=pressure_levels,
             angles_to_degrees=angles_to_degrees,
-            shift_to_zero=shift_to_zero)
+            shift_to_zero=shift_to_zero,
+            fused=fused,
+            inplace=inplace)
+
+    @classmethod
+    def transform_all_units_batch(cls, samples, **kwargs):
+        """
+        Transforms all unites of many samples at once (fused conversions in place over float arrays).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param kwargs: parameters of transform_all_units
+        :type kwargs: dict
+        :return: transformed instances of HandwritingSample
+        :rtype: list[HandwritingSample]
+        """
+        return cls.transformer.transform_all_units_batch(samples, **kwargs)
+
+    @classmethod
+    def control_for_pressure_batch(cls, samples, **kwargs):
+        """
+        Finds the samples with the pressure range of the old driver and converts their pressure.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param kwargs: parameters of HandwritingSampleTransformer.control_for_pressure_batch
+        :type kwargs: dict
+        :return: per-sample report {"index", "pressure_range", "corrected", "corrected_range"}
+        :rtype: list[dict]
+        """
+        return cls.transformer.control_for_pressure_batch(samples, **kwargs)
+
+    @classmethod
+    def analyze_spectrum(cls, samples, band=HandwritingSampleSpectralAnalyzer.DEFAULT_BAND, **kwargs):
+        """
+        Computes the power spectra of the strokes of many samples and their band power (e.g. tremor in 4-12 Hz).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param band: OPTIONAL, frequency band [Hz], DEFAULT = (4, 12)
+        :type band: tuple
+        :param kwargs: other parameters of HandwritingSampleSpectralAnalyzer.analyze
+        :type kwargs: dict
+        :return: frequencies, summaries of the strokes and samples (DataFrames), optionally the spectra
+        :rtype: dict
+        """
+        return cls.spectral_analyzer.analyze(samples, band=band, **kwargs)
+
+    @classmethod
+    def analyze_quality(cls, samples, columns=None, n_jobs=1, **kwargs):
+        """
+        Analyzes the sampling quality (rate, jitter, gaps, duplicate and backward timestamps, out-of-range values).
+
+        The samples of an archive are read without validation, so the report describes the recorded data.
+
+        :param samples: instances of HandwritingSample or a path to a zip/tar archive of SVC/JSON files
+        :type samples: iterable[HandwritingSample] or str
+        :param columns: column names of the SVC files of the archive, defaults to None
+        :type columns: list, optional
+        :param n_jobs: number of workers decoding zip members of the archive in parallel, DEFAULT = 1
+        :type n_jobs: int, optional
+        :param kwargs: parameters of HandwritingSampleQualityAnalyzer.analyze (time_scale, gap_factor, ranges)
+        :type kwargs: dict
+        :return: per-sample statistics and the gaps (DataFrames)
+        :rtype: dict
+        """
+
+        # Read the archive
+        if isinstance(samples, str):
+            samples = cls.from_archive(samples, columns=columns, validate=False, n_jobs=n_jobs)
+
+        # Analyze the samples
+        return cls.quality_analyzer.analyze(samples, **kwargs)
+
+    @classmethod
+    def transform_batch(cls, samples, pipeline=None, n_jobs=None, shard_size=None, columns=None, validate=True,
+                        **configuration):
+        """
+        Transforms many samples on a process pool (see HandwritingSampleTransformationPipeline.apply_parallel).
+
+        :param samples: instances of HandwritingSample or a path to a zip/tar archive of SVC/JSON files
+        :type samples: iterable[HandwritingSample] or str
+        :param pipeline: transformation pipeline, defaults to the steps of transform_all_units
+        :type pipeline: HandwritingSampleTransformationPipeline, optional
+        :param n_jobs: number of worker processes, defaults to the number of CPUs
+        :type n_jobs: int, optional
+        :param shard_size: number of samples sent to a worker at once, defaults to None (automatic)
+        :type shard_size: int, optional
+        :param columns: column names of the SVC files of the archive, defaults to None
+        :type columns: list, optional
+        :param validate: true if validate the data read from the archive
+        :type validate: bool, optional
+        :param configuration: device configuration of the default pipeline
+        :type configuration: dict
+        :return: per-sample report {"index", "sample", "transformed", "error"} (in the order of the samples)
+        :rtype: list[dict]
+        """
+
+        # Read the archive
+        if isinstance(samples, str):
+            samples = cls.from_archive(samples, columns=columns, validate=validate, n_jobs=n_jobs or 1)
+
+        # Transform the samples
+        pipeline = pipeline or HandwritingSampleTransformationPipeline(**configuration)
+        return pipeline.apply_parallel(samples, n_jobs=n_jobs, shard_size=shard_size)
+
+    @classmethod
+    def transform_all_units_by_device(cls, samples, strict=False, **kwargs):
+        """
+        Transforms all unites of many samples with the values of their devices.
+
+        The device profiles are resolved from the meta data (see HandwritingDeviceProfileRegistry.resolve),
+        the samples are grouped by profile and each group is converted at once.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param strict: raise an exception for unknown devices instead of using the default one
+        :type strict: bool, optional
+        :param kwargs: other parameters of transform_all_units_batch (angles_to_degrees, shift_to_zero, inplace)
+        :type kwargs: dict
+        :return: transformed instances of HandwritingSample
+        :rtype: list[HandwritingSample]
+        """
+        return cls.device_profiles.transform_all_units(samples, strict=strict, **kwargs)
+
+    @property
+    def device_profile(self):
+        """Returns the device profile resolved from the meta data"""
+        return self.device_profiles.resolve(self.meta)
 
     def transform_axis_to_mm(
             self,
@@ -470,7 +1091,7 @@ class HandwritingSample(HandwritingDataBase):
 
     def transform_time_to_seconds(self):
         """ Transform time to seconds """
-        self.time = self.transformer.transform_time_to_seconds(self.time)
+        self.transformer.transform_sample_time_to_seconds(self)
 
     def normalize_pressure(
             self,
@@ -487,9 +1108,7 @@ class HandwritingSample(HandwritingDataBase):
         :type pressure_levels: int
         """
 
-        self.pressure = self.transformer.normalize_pressure(self.pressure,
-                                                            max_value=max_pressure,
-                                                            pressure_levels=pressure_levels)
+        self.transformer.normalize_sample_pressure(self, max_value=max_pressure, pressure_levels=pressure_levels)
 
     def transform_angle_to_degree(self, angle=None, max_raw_value=None, max_degree_value=None):
         """
@@ -505,37 +1124,327 @@ class HandwritingSample(HandwritingDataBase):
 
         # For tilt
         if angle == self.TILT:
-            self.tilt = self.transformer.transform_angle(
-                self.tilt,
+            self.transformer.transform_sample_angle(
+                self,
+                self.TILT,
                 max_raw_value=max_raw_value or self.transformer.MAX_TILT_VALUE,
                 max_degree_value=max_degree_value or self.transformer.MAX_TILT_DEGREE)
 
         # For Azimuth
         elif angle == self.AZIMUTH:
-            self.azimuth = self.transformer.transform_angle(
-                self.azimuth,
+            self.transformer.transform_sample_angle(
+                self,
+                self.AZIMUTH,
                 max_raw_value=max_raw_value or self.transformer.MAX_AZIMUTH_VALUE,
                 max_degree_value=max_degree_value or self.transformer.MAX_AZIMUTH_DEGREE)
 
         else:
             raise TransformerAngleTypeException(angle)
 
-    def transform_sample_to_html_pointer_event(self, **kwargs):
+    def affine_transform(self, matrix):
+        """
+        Applies the 3x3 affine matrix to X and Y (see HandwritingSampleTransformer.compose_matrices).
+
+        :param matrix: 3x3 affine matrix
+        :type matrix: np.array
+        """
+        self.transformer.affine_transform(self, matrix)
+
+    def rotate(self, angle, center=None):
+        """
+        Rotates X and Y (counterclockwise) about the center.
+
+        :param angle: angle of the rotation [degrees]
+        :type angle: float
+        :param center: OPTIONAL, center of the rotation (x, y), DEFAULT = centroid of the sample
+        :type center: tuple
+        """
+        self.transformer.affine_transform(
+            self, self.transformer.rotation_matrix(angle, self._get_center(center)), operation="rotate")
+
+    def shear(self, angle_x=0, angle_y=0, center=None):
+        """
+        Shears X and Y about the center.
+
+        :param angle_x: OPTIONAL, shear angle along X [degrees], DEFAULT = 0
+        :type angle_x: float
+        :param angle_y: OPTIONAL, shear angle along Y [degrees], DEFAULT = 0
+        :type angle_y: float
+        :param center: OPTIONAL, center of the shear (x, y), DEFAULT = centroid of the sample
+        :type center: tuple
+        """
+        self.transformer.affine_transform(
+            self, self.transformer.shear_matrix(angle_x, angle_y, self._get_center(center)), operation="shear")
+
+    def translate(self, dx=0, dy=0):
+        """
+        Translates X and Y.
+
+        :param dx: OPTIONAL, translation of X, DEFAULT = 0
+        :type dx: float
+        :param dy: OPTIONAL, translation of Y, DEFAULT = 0
+        :type dy: float
+        """
+        self.transformer.affine_transform(self, self.transformer.translation_matrix(dx, dy), operation="translate")
+
+    def scale(self, scale_x, scale_y=None, center=None):
+        """
+        Scales X and Y about the center.
+
+        :param scale_x: scale of X
+        :type scale_x: float
+        :param scale_y: OPTIONAL, scale of Y, DEFAULT = scale_x
+        :type scale_y: float
+        :param center: OPTIONAL, center of the scaling (x, y), DEFAULT = centroid of the sample
+        :type center: tuple
+        """
+        self.transformer.affine_transform(
+            self, self.transformer.scaling_matrix(scale_x, scale_y, self._get_center(center)), operation="scale")
+
+    def estimate_baseline_angle(self):
+        """Returns the angle of the baseline [degrees] estimated from the on-surface data"""
+        return self.transformer.estimate_baseline_angle(self.x, self.y, self.pen_status)
+
+    def estimate_slant(self, max_angle=45):
+        """Returns the slant [degrees] estimated from the near-vertical on-surface segments"""
+        return self.transformer.estimate_slant(self.x, self.y, self.pen_status, max_angle=max_angle)
+
+    def correct_baseline_and_slant(self, baseline=True, slant=True, center=None):
+        """
+        Rotates the baseline to horizontal and removes the slant by one composed affine transformation.
+
+        :param baseline: OPTIONAL, correct the baseline, DEFAULT = True
+        :type baseline: bool
+        :param slant: OPTIONAL, correct the slant, DEFAULT = True
+        :type slant: bool
+        :param center: OPTIONAL, center of the correction (x, y), DEFAULT = centroid of the sample
+        :type center: tuple
+        :return: estimated baseline angle and slant [degrees]
+        :rtype: tuple
+        """
+        center = self._get_center(center)
+
+        # Rotate the baseline to horizontal (the slant is estimated after the rotation)
+        angle = self.estimate_baseline_angle() if baseline else 0.0
+        rotation = self.transformer.rotation_matrix(-angle, center)
+        x, y = (rotation[:2, :2] @ np.vstack((self.x, self.y))) + rotation[:2, 2:]
+        slant_angle = self.transformer.estimate_slant(x, y, self.pen_status) if slant else 0.0
+
+        # Apply the composed transformation
+        self.transformer.affine_transform(
+            self,
+            self.transformer.compose_matrices(rotation, self.transformer.shear_matrix(-slant_angle, center=center)),
+            operation="correct_baseline_and_slant")
+
+        return angle, slant_angle
+
+    def _get_center(self, center=None):
+        """Returns the center of a transformation (the centroid of the sample by default)"""
+        if center is not None:
+            return center
+        return (float(np.mean(self.x)), float(np.mean(self.y))) if len(self.x) else (0.0, 0.0)
+
+    def resample(self, sampling_rate, time_scale=None):
+        """
+        Resamples the handwriting variables to a uniform sampling rate (stroke by stroke).
+
+        :param sampling_rate: target sampling rate [Hz]
+        :type sampling_rate: float
+        :param time_scale: OPTIONAL, number of time units per second (inferred from the data if not given)
+        :type time_scale: float
+        """
+        self.transformer.resample(self, sampling_rate, time_scale=time_scale)
+
+    @classmethod
+    def resample_batch(cls, samples, sampling_rate, time_scale=None):
+        """
+        Resamples many samples to a uniform sampling rate at once.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param sampling_rate: target sampling rate [Hz]
+        :type sampling_rate: float
+        :param time_scale: OPTIONAL, number of time units per second (inferred from the data if not given)
+        :type time_scale: float
+        :return: resampled instances of HandwritingSample
+        :rtype: list[HandwritingSample]
+        """
+        return cls.transformer.resample_batch(samples, sampling_rate, time_scale=time_scale)
+
+    def smooth(self, kernel=HandwritingSampleFilter.GAUSSIAN, columns=None, mode=HandwritingSampleFilter.NEAREST,
+               **parameters):
+        """
+        Smooths the handwriting variables stroke by stroke (see HandwritingSampleFilter).
+
+        :param kernel: OPTIONAL ["moving_average"|"gaussian"|"savitzky_golay"] or kernel array, DEFAULT="gaussian"
+        :type kernel: str or np.array
+        :param columns: OPTIONAL, smoothed variables, DEFAULT = x, y, pressure
+        :type columns: list[str]
+        :param mode: OPTIONAL ["nearest"|"reflect"], padding of the strokes, DEFAULT = "nearest"
+        :type mode: str
+        :param parameters: parameters of the kernel (e.g. sigma, window, polyorder)
+        :type parameters: dict
+        """
+        self.smooth_batch([self], kernel=kernel, columns=columns, mode=mode, **parameters)
+
+    @classmethod
+    def smooth_batch(cls, samples, kernel=HandwritingSampleFilter.GAUSSIAN, columns=None,
+                     mode=HandwritingSampleFilter.NEAREST, **parameters):
+        """
+        Smooths the handwriting variables of many samples at once (see smooth).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :return: smoothed instances of HandwritingSample
+        :rtype: list[HandwritingSample]
+        """
+        if isinstance(kernel, str):
+            kernel = cls.filters.get_kernel(kernel, **parameters)
+        return cls.filters.filter_batch(samples, kernel, columns=columns, mode=mode)
+
+    def augment(self, seed=None, inplace=False, **augmentations):
+        """
+        Applies randomized augmentations to the sample (see augment_batch).
+
+        :param seed: OPTIONAL, seed of the random number generator, DEFAULT = the shared generator
+        :type seed: int
+        :param inplace: OPTIONAL, augment this sample instead of returning a new one, DEFAULT = False
+        :type inplace: bool
+        :param augmentations: rotation, scale, shear, translation, jitter, pressure_scale, time_warp
+        :type augmentations: dict
+        :return: augmented instance of HandwritingSample
+        :rtype: HandwritingSample
+        """
+        return self.augment_batch([self], seed=seed, inplace=inplace, **augmentations)[0]
+
+    @classmethod
+    def augment_batch(cls, samples, seed=None, inplace=False, **augmentations):
+        """
+        Applies randomized augmentations (affine, jitter, pressure scaling, time warp) to many samples at once.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param seed: OPTIONAL, seed of the random number generator, DEFAULT = the shared generator
+        :type seed: int
+        :param inplace: OPTIONAL, augment the samples instead of returning new ones, DEFAULT = False
+        :type inplace: bool
+        :param augmentations: parameters of HandwritingSampleAugmenter.augment
+        :type augmentations: dict
+        :return: augmented instances of HandwritingSample
+        :rtype: list[HandwritingSample]
+        """
+        augmenter = cls.augmenter if seed is None else HandwritingSampleAugmenter(seed)
+        return augmenter.augment(samples, inplace=inplace, **augmentations)
+
+    def transform_sample_to_html_pointer_event(self, tolerance=None, **kwargs):
         """
         Transforms sample to HTML Pointer Event.
 
+        :param tolerance: OPTIONAL, simplify the strokes first (see simplify), DEFAULT = None
+        :type tolerance: float
         :return: HTML Pointer Event
         :rtype: dict
         """
+
+        # Simplify the sample
+        sample = self.simplify(tolerance) if tolerance is not None else self
+
         # all as type float16
         return {
-            "x": [x / self.transformer.PX_TO_MM for x in self.x],
-            "y": [y / self.transformer.PX_TO_MM for y in self.y],
-            "time": self.time,
-            "buttons": self.pen_status,
-            "pressure": self.pressure,
+            "x": (np.asarray(sample.x) / self.transformer.PX_TO_MM).tolist(),
+            "y": (np.asarray(sample.y) / self.transformer.PX_TO_MM).tolist(),
+            "time": sample.time,
+            "buttons": sample.pen_status,
+            "pressure": sample.pressure,
         }
 
+    # ----------------- #
+    # Exporting methods #
+    # ----------------- #
+
+    def sliding_windows(self, window, stride=1, columns=None, padding=HandwritingSampleExporter.NO_PADDING,
+                        dtype=None, contiguous=False, return_masks=False):
+        """
+        Segments the sample into (overlapping) windows of shape (n_windows, window, channels).
+
+        The windows are a read-only strided view of the data (no copy is made for the overlapping
+        windows) unless a contiguous array is requested.
+
+        :param window: number of points of a window
+        :type window: int
+        :param stride: OPTIONAL, number of points between the starts of the windows, DEFAULT = 1
+        :type stride: int
+        :param columns: OPTIONAL, variables (channels), DEFAULT = all variables
+        :type columns: list[str]
+        :param padding: OPTIONAL ["none"|"zero"|"edge"], padding of the last window, DEFAULT = "none"
+        :type padding: str
+        :param dtype: OPTIONAL, data type of the windows, DEFAULT = float64
+        :type dtype: np.dtype
+        :param contiguous: OPTIONAL, return a contiguous copy of the windows, DEFAULT = False
+        :type contiguous: bool
+        :param return_masks: OPTIONAL, return the masks of windows crossing a stroke or a pen lift, DEFAULT = False
+        :type return_masks: bool
+        :return: windows, optionally with the masks
+        :rtype: np.array or (np.array, dict)
+        """
+        return self.exporter.sliding_windows(self, window, stride=stride, columns=columns, padding=padding,
+                                             dtype=dtype, contiguous=contiguous, return_masks=return_masks)
+
+    @classmethod
+    def sliding_windows_batch(cls, samples, window, stride=1, columns=None,
+                              padding=HandwritingSampleExporter.NO_PADDING, dtype=None, contiguous=False,
+                              return_masks=False):
+        """
+        Segments many samples into (overlapping) windows (see sliding_windows).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :return: windows (a list of views per sample, or one array if contiguous), sample index of each window,
+                 optionally with the masks
+        :rtype: tuple
+        """
+        return cls.exporter.sliding_windows_batch(samples, window, stride=stride, columns=columns, padding=padding,
+                                                  dtype=dtype, contiguous=contiguous, return_masks=return_masks)
+
+    @classmethod
+    def to_padded_batch(cls, samples, columns=None, dtype=None, max_length=None, pad_value=0):
+        """
+        Exports many samples to one padded array of shape (batch, max_len, channels) with lengths and mask.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param columns: OPTIONAL, variables (channels), DEFAULT = all variables
+        :type columns: list[str]
+        :param dtype: OPTIONAL, data type of the array (e.g. np.float32), DEFAULT = float64
+        :type dtype: np.dtype
+        :param max_length: OPTIONAL, the samples are truncated to max_length points, DEFAULT = the longest sample
+        :type max_length: int
+        :param pad_value: OPTIONAL, value of the padding, DEFAULT = 0
+        :type pad_value: float
+        :return: {"data", "lengths", "mask", "index"}
+        :rtype: dict
+        """
+        return cls.exporter.padded_batch(samples, columns=columns, dtype=dtype, max_length=max_length,
+                                         pad_value=pad_value)
+
+    @classmethod
+    def to_padded_batches(cls, samples, batch_size, bucket=True, **kwargs):
+        """
+        Exports many samples to padded batches (bucketed by the lengths of the samples to minimize padding).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param batch_size: number of samples of a batch
+        :type batch_size: int
+        :param bucket: OPTIONAL, bucket the samples by their lengths, DEFAULT = True
+        :type bucket: bool
+        :param kwargs: other parameters of to_padded_batch
+        :type kwargs: dict
+        :return: padded batches {"data", "lengths", "mask", "index"}
+        :rtype: list[dict]
+        """
+        return cls.exporter.padded_batches(samples, batch_size, bucket=bucket, **kwargs)
+
     # ---------------------- #
     # Meta data manipulation #
     # ---------------------- #
@@ -35,3 +35,10 @@ class HTMLDataTransformationArgumentNotAllowed(ReaderException):
 
     def __init__(self, message):
         super(HTMLDataTransformationArgumentNotAllowed, self).__init__(message)
+
+
+class ArchiveFormatNotSupported(ReaderException):
+    """ Exception raised when the file is neither a zip nor a tar archive """
+
+    def __init__(self, message):
+        super(ArchiveFormatNotSupported, self).__init__(message)
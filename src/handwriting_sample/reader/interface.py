@@ -1,11 +1,13 @@
 from handwriting_sample.base import LoggableObject
 from handwriting_sample.reader.readers import (
     JSONFileReader,
+    JSONLinesFileReader,
     SVCFileReader,
     ListReader,
     NumpyArrayReader,
     PandasDataFrameReader,
-    HTMLPointerEventReader
+    HTMLPointerEventReader,
+    ArchiveFileReader
 )
 
 
@@ -32,6 +34,24 @@ class HandwritingSampleReader(LoggableObject):
         """
         return JSONFileReader.read(path, verbose=verbose)
 
+    @classmethod
+    def read_from_json_lines(cls, path, columns, meta_filter=None, verbose=False):
+        """
+        Reads handwriting data and meta data from a JSON Lines file (one sample per line).
+
+        :param path: path to a JSON Lines file
+        :type path: str
+        :param columns: handwriting variables to be present in the data
+        :type columns: list
+        :param meta_filter: callable receiving the meta data, records are skipped if it returns False
+        :type meta_filter: callable, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: generator of data and meta data
+        :rtype: generator[tuple]
+        """
+        return JSONLinesFileReader.read(path, meta_filter=meta_filter, verbose=verbose)
+
     @classmethod
     def read_from_svc(cls, path, columns, verbose=False):
         """
@@ -48,6 +68,24 @@ class HandwritingSampleReader(LoggableObject):
         """
         return SVCFileReader.read(path, columns, verbose=verbose)
 
+    @classmethod
+    def read_from_archive(cls, path, columns, n_jobs=1, verbose=False):
+        """
+        Reads handwriting data and meta data of all SVC/JSON members of a zip or tar archive.
+
+        :param path: path to a zip or tar archive
+        :type path: str
+        :param columns: handwriting variables to be present in the data
+        :type columns: list
+        :param n_jobs: number of workers decoding zip members in parallel, defaults to 1
+        :type n_jobs: int, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: list of data and meta data
+        :rtype: list[tuple]
+        """
+        return ArchiveFileReader.read(path, columns, n_jobs=n_jobs, verbose=verbose)
+
     @classmethod
     def read_from_list(cls, data, columns, verbose=False):
         """
@@ -1,5 +1,10 @@
+import io
 import os
 import json
+import tarfile
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -7,7 +12,8 @@ from handwriting_sample.base import LoggableObject
 from handwriting_sample.reader.exceptions import (HTMLPointerNotAllowedException,
                                                   HTMLDataMissingColumn,
                                                   HTMLDataMColumnMissingValues,
-                                                  HTMLDataTransformationArgumentNotAllowed)
+                                                  HTMLDataTransformationArgumentNotAllowed,
+                                                  ArchiveFormatNotSupported)
 from handwriting_sample.transformer import HandwritingSampleTransformer
 
 
@@ -34,6 +40,69 @@ class JSONFileReader(LoggableObject):
         # Return data and meta data
         return data, meta
 
+    @classmethod
+    def read_from_buffer(cls, buffer, name, verbose=False):
+        """Reads the handwriting data and meta data from an in-memory JSON file content"""
+
+        # Read the handwriting data from the JSON content
+        json_data = json.loads(buffer)
+
+        # Get data and meta data
+        data = json_data.get("data")
+        meta = json_data.get("meta_data")
+        cls.log(f"Data has been loaded from a JSON content: {name}", be_verbose=verbose)
+
+        # Return data and meta data
+        return data, meta
+
+
+class JSONLinesFileReader(LoggableObject):
+    """Class implementing JSON Lines file reader (one sample per line)"""
+
+    # Prefix of the lines written by JSONLinesFileWriter
+    META_DATA_PREFIX = '{"meta_data": '
+
+    @classmethod
+    def read(cls, path, meta_filter=None, verbose=False):
+        """
+        Reads the handwriting data and meta data line by line
+
+        :param path: path to a JSON Lines file
+        :type path: str
+        :param meta_filter: callable receiving the meta data, records are skipped if it returns False
+        :type meta_filter: callable, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: generator of data and meta data
+        :rtype: generator[tuple]
+        """
+
+        # Prepare the decoder
+        decoder = json.JSONDecoder()
+
+        # Read the handwriting data record by record
+        with open(path, "r") as file:
+            for line in file:
+
+                # Skip empty lines
+                if not line.strip():
+                    continue
+
+                # Filter the records using the meta data only (the data part is not decoded)
+                if meta_filter is not None:
+                    if line.startswith(cls.META_DATA_PREFIX):
+                        meta, _ = decoder.raw_decode(line, len(cls.META_DATA_PREFIX))
+                    else:
+                        meta = json.loads(line).get("meta_data")
+                    if not meta_filter(meta):
+                        continue
+
+                # Get data and meta data
+                json_data = json.loads(line)
+                yield json_data.get("data"), json_data.get("meta_data")
+
+        cls.log(f"Data has been loaded from a JSON Lines file: {path}", be_verbose=verbose, is_verbose=True)
+
 
 class SVCFileReader(LoggableObject):
     """Class implementing SVC file reader"""
@@ -50,17 +119,36 @@ class SVCFileReader(LoggableObject):
         # Return data and meta data
         return data, meta
 
+    @classmethod
+    def read_from_buffer(cls, buffer, name, column_names, verbose=False):
+        """Reads the handwriting data and meta data from an in-memory SVC file content"""
+
+        # Read the handwriting data from the SVC content
+        data = pd.read_csv(io.BytesIO(buffer), sep=" ", names=column_names, skiprows=1).to_dict(orient="list")
+        meta = cls._parse_metadata(name, buffer.split(b"\n", 1)[0].decode())
+        cls.log(f"Data has been loaded from an SVC content: {name}", be_verbose=verbose)
+
+        # Return data and meta data
+        return data, meta
+
     @classmethod
     def _read_metadata_from_svc_file_name(cls, file_path):
         """Reads meta data included in the file name"""
 
-        # Prepare meta data
-        meta_data = {}
-
         # Open file and read the first line
         with open(file_path) as f:
             raw_meta_data = f.readline()
 
+        # Return meta data
+        return cls._parse_metadata(file_path, raw_meta_data)
+
+    @classmethod
+    def _parse_metadata(cls, file_path, raw_meta_data):
+        """Parses meta data from the file name and the first line of an SVC file"""
+
+        # Prepare meta data
+        meta_data = {}
+
         # Store the samples count
         meta_data["samples_count"] = int(raw_meta_data)
 
@@ -89,6 +177,102 @@ class SVCFileReader(LoggableObject):
         return meta_data
 
 
+class ArchiveFileReader(LoggableObject):
+    """Class implementing zip/tar archive reader (members are parsed in memory)"""
+
+    # Supported member types
+    SVC_EXTENSION = ".svc"
+    JSON_EXTENSION = ".json"
+    SUPPORTED_EXTENSIONS = [SVC_EXTENSION, JSON_EXTENSION]
+
+    @classmethod
+    def read(cls, path, column_names, n_jobs=1, verbose=False):
+        """
+        Reads the handwriting data and meta data of all supported archive members
+
+        :param path: path to a zip or tar archive
+        :type path: str
+        :param column_names: handwriting variables to be present in the data
+        :type column_names: list
+        :param n_jobs: number of workers decoding zip members in parallel, defaults to 1
+        :type n_jobs: int, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: list of data and meta data (in the order of the archive members)
+        :rtype: list[tuple]
+        """
+
+        # Read the archive members
+        if zipfile.is_zipfile(path):
+            samples = cls._read_zip(path, column_names, n_jobs, verbose)
+        elif tarfile.is_tarfile(path):
+            samples = cls._read_tar(path, column_names, verbose)
+        else:
+            raise ArchiveFormatNotSupported(f"File {path} is not a zip or tar archive.")
+
+        cls.log(f"{len(samples)} samples have been loaded from an archive: {path}", be_verbose=verbose)
+
+        # Return list of data and meta data
+        return samples
+
+    @classmethod
+    def _read_zip(cls, path, column_names, n_jobs, verbose):
+        """Reads the supported members of a zip archive"""
+
+        # Get the supported members
+        with zipfile.ZipFile(path) as archive:
+            names = [info.filename for info in archive.infolist()
+                     if not info.is_dir() and cls._is_supported(info.filename)]
+
+        # Each worker thread uses its own archive handle
+        handles = []
+        lock = threading.Lock()
+        local = threading.local()
+
+        def read_member(name):
+            if not hasattr(local, "archive"):
+                local.archive = zipfile.ZipFile(path)
+                with lock:
+                    handles.append(local.archive)
+            return cls._read_member(local.archive.read(name), name, column_names, verbose)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+                return list(executor.map(read_member, names))
+        finally:
+            for handle in handles:
+                handle.close()
+
+    @classmethod
+    def _read_tar(cls, path, column_names, verbose):
+        """Reads the supported members of a tar archive (sequentially, as tar is not seekable per member)"""
+
+        # Prepare the samples
+        samples = []
+
+        # Read the members
+        with tarfile.open(path, "r:*") as archive:
+            for member in archive:
+                if member.isfile() and cls._is_supported(member.name):
+                    samples.append(cls._read_member(archive.extractfile(member).read(), member.name,
+                                                    column_names, verbose))
+
+        # Return the samples
+        return samples
+
+    @classmethod
+    def _read_member(cls, buffer, name, column_names, verbose):
+        """Reads the data and meta data of an archive member"""
+        if name.lower().endswith(cls.SVC_EXTENSION):
+            return SVCFileReader.read_from_buffer(buffer, os.path.basename(name), column_names, verbose=verbose)
+        return JSONFileReader.read_from_buffer(buffer, os.path.basename(name), verbose=verbose)
+
+    @classmethod
+    def _is_supported(cls, name):
+        """Checks if the archive member is a supported file"""
+        return os.path.splitext(name)[1].lower() in cls.SUPPORTED_EXTENSIONS
+
+
 # ------------ #
 # Data readers #
 # ------------ #
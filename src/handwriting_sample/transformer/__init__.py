@@ -1,2 +1,7 @@
 from handwriting_sample.transformer.interface import HandwritingSampleTransformer
+from handwriting_sample.transformer.pipeline import HandwritingSampleTransformationPipeline
+from handwriting_sample.transformer.filters import HandwritingSampleFilter
+from handwriting_sample.transformer.simplification import HandwritingSampleSimplifier
+from handwriting_sample.transformer.augmenter import HandwritingSampleAugmenter
+from handwriting_sample.transformer.devices import HandwritingDeviceProfile, HandwritingDeviceProfileRegistry
 from handwriting_sample.transformer.exceptions import *
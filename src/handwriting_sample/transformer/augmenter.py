@@ -0,0 +1,227 @@
+import numpy as np
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer.interface import HandwritingSampleTransformer
+
+
+class HandwritingSampleAugmenter(HandwritingDataBase):
+    """
+    Class implementing randomized data augmentation of handwriting samples.
+
+    The variables of all samples are concatenated and every augmentation is computed once
+    for the whole batch; the random parameters are drawn per sample and repeated to its
+    points. Pen status (hence the strokes) is never changed.
+    """
+
+    # Augmentations (the default ranges are given in the units of the variables)
+    ROTATION = "rotation"
+    SCALE = "scale"
+    SHEAR = "shear"
+    TRANSLATION = "translation"
+    JITTER = "jitter"
+    PRESSURE_SCALE = "pressure_scale"
+    TIME_WARP = "time_warp"
+
+    AUGMENTATIONS = [ROTATION, SCALE, SHEAR, TRANSLATION, JITTER, PRESSURE_SCALE, TIME_WARP]
+
+    def __init__(self, seed=None):
+        """
+        Initializes the augmenter.
+
+        :param seed: OPTIONAL, seed of the random number generator (or the generator), DEFAULT = None
+        :type seed: int or np.random.Generator
+        """
+        self.rng = np.random.default_rng(seed)
+
+    def augment(
+            self,
+            samples,
+            rotation=0,
+            scale=(1, 1),
+            shear=0,
+            translation=0,
+            jitter=0,
+            pressure_scale=(1, 1),
+            time_warp=0,
+            inplace=False):
+        """
+        Applies randomized augmentations to many samples at once.
+
+        The affine augmentations (rotation, scaling, shear and translation) are composed into one
+        2x2 matrix and an offset per sample and applied about the centroid of the sample.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param rotation: OPTIONAL, maximal rotation angle [degrees] (uniform in +-rotation), DEFAULT = 0
+        :type rotation: float
+        :param scale: OPTIONAL, range of the scale factor (uniform), DEFAULT = (1, 1)
+        :type scale: tuple
+        :param shear: OPTIONAL, maximal shear angle along X [degrees] (uniform in +-shear), DEFAULT = 0
+        :type shear: float
+        :param translation: OPTIONAL, maximal translation of X and Y (uniform in +-translation), DEFAULT = 0
+        :type translation: float
+        :param jitter: OPTIONAL, standard deviation of the Gaussian noise of X and Y, DEFAULT = 0
+        :type jitter: float
+        :param pressure_scale: OPTIONAL, range of the pressure scale factor (uniform), DEFAULT = (1, 1)
+        :type pressure_scale: tuple
+        :param time_warp: OPTIONAL, maximal amplitude of the (monotonic) time warp from [0, 1), DEFAULT = 0
+        :type time_warp: float
+        :param inplace: OPTIONAL, augment the samples instead of returning new ones, DEFAULT = False
+        :type inplace: bool
+        :return: augmented objects of HandwritingSample class
+        :rtype: list[handwriting_sample.HandwritingSample]
+        """
+
+        # Check input
+        samples = list(samples)
+        for name, value in ((self.ROTATION, rotation), (self.SHEAR, shear), (self.TRANSLATION, translation),
+                            (self.JITTER, jitter)):
+            if not HandwritingSampleTransformer._is_number(value) or value < 0:
+                raise ValueError(f"Augmentation {name} must be a non-negative number!")
+        for name, value in ((self.SCALE, scale), (self.PRESSURE_SCALE, pressure_scale)):
+            if len(value) != 2 or not 0 < value[0] <= value[1]:
+                raise ValueError(f"Augmentation {name} must be a (low, high) range of positive numbers!")
+        if not HandwritingSampleTransformer._is_number(time_warp) or not 0 <= time_warp < 1:
+            raise ValueError(f"Augmentation {self.TIME_WARP} must be a number from [0, 1)!")
+        if not samples:
+            return []
+
+        # Get the points of the samples
+        lengths = np.array([len(sample.time) for sample in samples], dtype=np.int64)
+        starts = np.cumsum(lengths) - lengths
+        ids = np.repeat(np.arange(len(samples)), lengths)
+        nonempty = starts[lengths > 0]
+
+        x = np.concatenate([np.asarray(sample.x, dtype=float) for sample in samples])
+        y = np.concatenate([np.asarray(sample.y, dtype=float) for sample in samples])
+
+        # Draw the parameters of the samples
+        parameters = self._draw(len(samples), rotation, scale, shear, translation, pressure_scale, time_warp)
+        augmented = {}
+
+        # Apply the affine augmentations about the centroids
+        if rotation or shear or translation or scale[0] != 1 or scale[1] != 1:
+            matrices = self.affine_matrices(parameters[self.ROTATION], parameters[self.SCALE], parameters[self.SHEAR])
+            center_x = np.zeros(len(samples))
+            center_y = np.zeros(len(samples))
+            center_x[lengths > 0] = np.add.reduceat(x, nonempty) / lengths[lengths > 0]
+            center_y[lengths > 0] = np.add.reduceat(y, nonempty) / lengths[lengths > 0]
+
+            dx, dy = x - center_x[ids], y - center_y[ids]
+            translation_x, translation_y = parameters[self.TRANSLATION].T
+            x = matrices[ids, 0, 0] * dx + matrices[ids, 0, 1] * dy + (center_x + translation_x)[ids]
+            y = matrices[ids, 1, 0] * dx + matrices[ids, 1, 1] * dy + (center_y + translation_y)[ids]
+            augmented.update({self.AXIS_X: x, self.AXIS_Y: y})
+
+        # Add the jitter
+        if jitter:
+            x = x + self.rng.normal(0, jitter, x.size)
+            y = y + self.rng.normal(0, jitter, y.size)
+            augmented.update({self.AXIS_X: x, self.AXIS_Y: y})
+
+        # Scale the pressure
+        if pressure_scale[0] != 1 or pressure_scale[1] != 1:
+            pressure = np.concatenate([np.asarray(sample.pressure, dtype=float) for sample in samples])
+            augmented[self.PRESSURE] = pressure * parameters[self.PRESSURE_SCALE][ids]
+
+        # Warp the time
+        if time_warp:
+            time = np.concatenate([np.asarray(sample.time, dtype=float) for sample in samples])
+            augmented[self.TIME] = self.warp_time(time, starts, lengths, parameters[self.TIME_WARP],
+                                                  parameters["time_warp_phase"])
+
+        # Set the augmented variables
+        results = []
+        for index, (sample, start, length) in enumerate(zip(samples, starts.tolist(), lengths.tolist())):
+            if not inplace:
+                sample = type(sample)._from_arrays(
+                    {column: values if column in augmented else np.array(values)
+                     for column, values in sample._columns.items()},
+                    meta_data=dict(sample.meta) if sample.meta else sample.meta,
+                    original_dtypes=sample._original_dtypes,
+                    original_columns=sample._original_columns,
+                    transformations=[dict(transformation) for transformation in sample._transformations])
+            if augmented:
+                sample._apply_transformation(
+                    "augment",
+                    {name: np.asarray(values[index]).tolist() for name, values in parameters.items()},
+                    {column: (values[start:start + length], None, None) for column, values in augmented.items()})
+            results.append(sample)
+
+        # Return the augmented samples
+        return results
+
+    # --------------- #
+    # Utility methods #
+    # --------------- #
+
+    @staticmethod
+    def affine_matrices(rotation, scale, shear):
+        """
+        Composes the 2x2 matrices of the affine augmentations (rotation @ shear @ scale).
+
+        :param rotation: rotation angles [degrees]
+        :type rotation: np.array
+        :param scale: scale factors
+        :type scale: np.array
+        :param shear: shear angles along X [degrees]
+        :type shear: np.array
+        :return: matrices (n, 2, 2)
+        :rtype: np.array
+        """
+        angle = np.radians(rotation)
+        cos, sin, shear = np.cos(angle), np.sin(angle), np.tan(np.radians(shear))
+
+        matrices = np.empty((len(angle), 2, 2))
+        matrices[:, 0, 0] = cos * scale
+        matrices[:, 0, 1] = (cos * shear - sin) * scale
+        matrices[:, 1, 0] = sin * scale
+        matrices[:, 1, 1] = (sin * shear + cos) * scale
+        return matrices
+
+    @staticmethod
+    def warp_time(time, starts, lengths, amplitude, phase):
+        """
+        Warps the time of the samples monotonically (the first and the last timestamps are kept).
+
+        The normalized time u of a sample is mapped to u + a * (sin(2 pi u + phase) - sin(phase)) / (2 pi),
+        whose derivative 1 + a * cos(2 pi u + phase) is positive for |a| < 1.
+
+        :param time: timestamps of the samples (concatenated)
+        :type time: np.array
+        :param starts: start indices of the samples
+        :type starts: np.array
+        :param lengths: lengths of the samples
+        :type lengths: np.array
+        :param amplitude: amplitudes of the warp of the samples
+        :type amplitude: np.array
+        :param phase: phases of the warp of the samples
+        :type phase: np.array
+        :return: warped time
+        :rtype: np.array
+        """
+
+        # Get the time range of each sample
+        if not time.size:
+            return time
+        ids = np.repeat(np.arange(len(lengths)), lengths)
+        first = time[np.minimum(starts, time.size - 1)][ids]
+        duration = time[np.clip(starts + lengths - 1, 0, time.size - 1)][ids] - first
+
+        # Warp the normalized time
+        normalized = np.divide(time - first, duration, out=np.zeros(time.size), where=duration != 0)
+        amplitude, phase = amplitude[ids], phase[ids]
+        warped = normalized + amplitude * (np.sin(2 * np.pi * normalized + phase) - np.sin(phase)) / (2 * np.pi)
+
+        return first + warped * duration
+
+    def _draw(self, size, rotation, scale, shear, translation, pressure_scale, time_warp):
+        """Draws the random parameters of the samples (the same number of draws for any values)"""
+        return {
+            self.ROTATION: self.rng.uniform(-rotation, rotation, size),
+            self.SCALE: self.rng.uniform(scale[0], scale[1], size),
+            self.SHEAR: self.rng.uniform(-shear, shear, size),
+            self.TRANSLATION: self.rng.uniform(-translation, translation, (size, 2)),
+            self.PRESSURE_SCALE: self.rng.uniform(pressure_scale[0], pressure_scale[1], size),
+            self.TIME_WARP: self.rng.uniform(-time_warp, time_warp, size),
+            "time_warp_phase": self.rng.uniform(0, 2 * np.pi, size)
+        }
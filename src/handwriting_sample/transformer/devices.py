@@ -0,0 +1,241 @@
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer.interface import HandwritingSampleTransformer
+from handwriting_sample.transformer.pipeline import HandwritingSampleTransformationPipeline
+from handwriting_sample.transformer.exceptions import TransformerDeviceProfileException
+
+
+class HandwritingDeviceProfile(HandwritingDataBase):
+    """Class implementing technical values of a digitizing device used for the unit transformations"""
+
+    def __init__(
+            self,
+            name,
+            conversion_type=HandwritingSampleTransformer.LPI,
+            lpi_value=HandwritingSampleTransformer.LPI_VALUE,
+            lpmm_value=HandwritingSampleTransformer.LPMM_VALUE,
+            max_raw_azimuth=HandwritingSampleTransformer.MAX_AZIMUTH_VALUE,
+            max_raw_tilt=HandwritingSampleTransformer.MAX_TILT_VALUE,
+            max_degree_azimuth=HandwritingSampleTransformer.MAX_AZIMUTH_DEGREE,
+            max_degree_tilt=HandwritingSampleTransformer.MAX_TILT_DEGREE,
+            max_pressure=HandwritingSampleTransformer.MAX_PRESSURE_VALUE,
+            pressure_levels=HandwritingSampleTransformer.PRESSURE_LEVELS,
+            mm_dimensions=HandwritingSampleTransformer.DEFAULT_MM_DIMENSIONS,
+            pixel_resolution=HandwritingSampleTransformer.DEFAULT_PIXEL_RESOLUTION):
+        """
+        Initializes the HandwritingDeviceProfile object (defaults are the values of DTK-1660).
+
+        :param name: name of the device
+        :type name: str
+        :param conversion_type: OPTIONAL ["lpi"|"mm"], DEFAULT="lpi"
+        :type conversion_type: str
+        :param lpi_value: OPTIONAL, DEFAULT = 5080
+        :type lpi_value: int
+        :param lpmm_value: OPTIONAL, DEFAULT = 200
+        :type lpmm_value: int
+        :param max_raw_azimuth: OPTIONAL, DEFAULT = 3600
+        :type max_raw_azimuth: int
+        :param max_raw_tilt: OPTIONAL, DEFAULT = 900
+        :type max_raw_tilt: int
+        :param max_degree_azimuth: OPTIONAL, DEFAULT = 360
+        :type max_degree_azimuth: int
+        :param max_degree_tilt: OPTIONAL, DEFAULT = 90
+        :type max_degree_tilt: int
+        :param max_pressure: OPTIONAL, DEFAULT = 32767
+        :type max_pressure: int
+        :param pressure_levels: OPTIONAL, DEFAULT = 8192
+        :type pressure_levels: int
+        :param mm_dimensions: OPTIONAL, DEFAULT = (344.2, 193.6)
+        :type mm_dimensions: tuple
+        :param pixel_resolution: OPTIONAL, DEFAULT = (1920, 1080)
+        :type pixel_resolution: tuple
+        """
+        self.name = name
+        self.parameters = {
+            "conversion_type": conversion_type,
+            "lpi_value": lpi_value,
+            "lpmm_value": lpmm_value,
+            "max_raw_azimuth": max_raw_azimuth,
+            "max_raw_tilt": max_raw_tilt,
+            "max_degree_azimuth": max_degree_azimuth,
+            "max_degree_tilt": max_degree_tilt,
+            "max_pressure": max_pressure,
+            "pressure_levels": pressure_levels
+        }
+        self.mm_dimensions = tuple(mm_dimensions)
+        self.pixel_resolution = tuple(pixel_resolution)
+
+        # Check the parameters
+        HandwritingSampleTransformationPipeline._check_configuration(
+            {**HandwritingSampleTransformationPipeline.DEFAULT_CONFIGURATION, **self.parameters})
+
+    def __repr__(self):
+        return f"<HandwritingDeviceProfile: {self.name}, {self.parameters}>"
+
+    def __eq__(self, other):
+        return isinstance(other, HandwritingDeviceProfile) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    @property
+    def key(self):
+        """Returns the identification of the profile (name and parameters)"""
+        return self.name, tuple(sorted(self.parameters.items())), self.mm_dimensions, self.pixel_resolution
+
+    @property
+    def px_to_mm(self):
+        """Returns the size of one pixel in millimeters"""
+        return self.mm_dimensions[0] / self.pixel_resolution[0]
+
+    def with_overrides(self, **parameters):
+        """Returns a copy of the profile with the overridden parameters"""
+        return HandwritingDeviceProfile(
+            self.name,
+            **{**self.parameters, **parameters},
+            mm_dimensions=self.mm_dimensions,
+            pixel_resolution=self.pixel_resolution)
+
+
+class HandwritingDeviceProfileRegistry(HandwritingDataBase):
+    """Class implementing the registry of device profiles resolved from the meta data of samples"""
+
+    # Default device
+    DEFAULT_DEVICE = "DTK-1660"
+    DEFAULT_DEVICE_ALIASES = ["Wacom Cintiq 16"]
+
+    # Meta data keys
+    META_DEVICE_TYPE = "device_type"
+    META_LPI = "lpi"
+    META_TIME_SERIES_RANGES = ["time_series_range", "time_series_ranges"]
+
+    # Time-series ranges -> profile parameters
+    RANGE_PARAMETERS = {
+        HandwritingDataBase.PRESSURE: "max_pressure",
+        HandwritingDataBase.TILT: "max_raw_tilt",
+        HandwritingDataBase.AZIMUTH: "max_raw_azimuth"
+    }
+
+    def __init__(self):
+        """Initializes the HandwritingDeviceProfileRegistry object with the default device"""
+        self._profiles = {}
+        self._resolved = {}
+        self.register(HandwritingDeviceProfile(self.DEFAULT_DEVICE), aliases=self.DEFAULT_DEVICE_ALIASES)
+
+    @property
+    def default(self):
+        """Returns the default profile"""
+        return self.get(self.DEFAULT_DEVICE)
+
+    def register(self, profile, aliases=None):
+        """
+        Registers the device profile.
+
+        :param profile: device profile
+        :type profile: HandwritingDeviceProfile
+        :param aliases: other device names (e.g. as stored in the meta data), defaults to None
+        :type aliases: list[str], optional
+        :return: None
+        :rtype: None type
+        """
+        for name in [profile.name] + list(aliases or []):
+            self._profiles[self._normalize_name(name)] = profile
+        self._resolved.clear()
+
+    def get(self, name):
+        """
+        Returns the registered device profile.
+
+        :param name: name (or alias) of the device
+        :type name: str
+        :return: device profile
+        :rtype: HandwritingDeviceProfile
+        """
+        try:
+            return self._profiles[self._normalize_name(name)]
+        except KeyError:
+            raise TransformerDeviceProfileException(name, list(self._profiles))
+
+    def resolve(self, meta_data=None, strict=False):
+        """
+        Resolves the device profile from the meta data of a sample.
+
+        The profile is selected by ``device_type``; ``lpi`` and the maxima of
+        ``time_series_range(s)`` (pressure, tilt, azimuth) override its values.
+        The resolved profiles are cached.
+
+        :param meta_data: meta data of the sample, defaults to None
+        :type meta_data: dict, optional
+        :param strict: raise an exception for unknown devices instead of using the default one
+        :type strict: bool, optional
+        :return: device profile
+        :rtype: HandwritingDeviceProfile
+        """
+
+        # Get the device
+        meta_data = meta_data or {}
+        device_type = meta_data.get(self.META_DEVICE_TYPE)
+
+        if device_type and (strict or self._normalize_name(device_type) in self._profiles):
+            profile = self.get(device_type)
+        else:
+            profile = self.default
+
+        # Get the overrides
+        overrides = {}
+        if isinstance(meta_data.get(self.META_LPI), int):
+            overrides["lpi_value"] = meta_data[self.META_LPI]
+        for key in self.META_TIME_SERIES_RANGES:
+            for column, value_range in (meta_data.get(key) or {}).items():
+                if column in self.RANGE_PARAMETERS and isinstance(value_range, (list, tuple)) and value_range:
+                    overrides[self.RANGE_PARAMETERS[column]] = value_range[-1]
+
+        # Return the profile (cached)
+        if not overrides:
+            return profile
+        key = (profile.key, tuple(sorted(overrides.items())))
+        if key not in self._resolved:
+            self._resolved[key] = profile.with_overrides(**overrides)
+        return self._resolved[key]
+
+    def group(self, samples, strict=False):
+        """
+        Groups the samples by their device profiles.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param strict: raise an exception for unknown devices instead of using the default one
+        :type strict: bool, optional
+        :return: profiles and the indices of their samples
+        :rtype: dict[HandwritingDeviceProfile, list[int]]
+        """
+        groups = {}
+        for index, sample in enumerate(samples):
+            groups.setdefault(self.resolve(sample.meta, strict=strict), []).append(index)
+        return groups
+
+    def transform_all_units(self, samples, strict=False, **kwargs):
+        """
+        Transforms all unites of the samples with the values of their device profiles.
+
+        The samples are grouped by profile and each group is converted at once
+        (see HandwritingSampleTransformer.transform_all_units_batch).
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param strict: raise an exception for unknown devices instead of using the default one
+        :type strict: bool, optional
+        :param kwargs: other parameters of transform_all_units_batch (angles_to_degrees, shift_to_zero, inplace)
+        :type kwargs: dict
+        :return: transformed instances of HandwritingSample (in the input order)
+        :rtype: list[HandwritingSample]
+        """
+        samples = list(samples)
+        for profile, indices in self.group(samples, strict=strict).items():
+            HandwritingSampleTransformer().transform_all_units_batch(
+                [samples[index] for index in indices], **profile.parameters, **kwargs)
+        return samples
+
+    @staticmethod
+    def _normalize_name(name):
+        """Normalizes the device name"""
+        return str(name).strip().lower()
@@ -27,4 +27,20 @@ class TransformerAngleTypeException(TransformerException):
             self.message = f"Unknown Angle Type '{self.angle}' for HandwritingSample object instance. " \
                            f"Please select from ['{self.TILT}', '{self.AZIMUTH}']."
         
-        super(TransformerAngleTypeException, self).__init__(self.message)
\ No newline at end of file
+        super(TransformerAngleTypeException, self).__init__(self.message)
+
+
+class TransformerDeviceProfileException(TransformerException):
+    """ Exception raised for unknown devices.
+
+       Attributes:
+           device -- name of the device which caused the error
+           message -- explanation of the error
+    """
+
+    def __init__(self, device, known_devices=None):
+        self.device = device
+        self.message = f"Unknown device '{self.device}'. " \
+                       f"Please select from {known_devices or []} or register its profile."
+
+        super(TransformerDeviceProfileException, self).__init__(self.message)
@@ -0,0 +1,281 @@
+import math
+import numpy as np
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer.interface import HandwritingSampleTransformer
+
+
+class HandwritingSampleFilter(HandwritingDataBase):
+    """
+    Class implementing FIR filtering (smoothing, differentiation) of handwriting data.
+
+    The filters are applied to every stroke separately (they never mix the values across
+    a pen lift). The strokes of all samples are padded at their boundaries and laid out
+    in one buffer, which is filtered by a single convolution per variable.
+    """
+
+    # Kernels
+    MOVING_AVERAGE = "moving_average"
+    GAUSSIAN = "gaussian"
+    SAVITZKY_GOLAY = "savitzky_golay"
+
+    KERNELS = [MOVING_AVERAGE, GAUSSIAN, SAVITZKY_GOLAY]
+
+    # Padding of the strokes
+    NEAREST = "nearest"
+    REFLECT = "reflect"
+
+    MODES = [NEAREST, REFLECT]
+
+    # Filtered variables
+    DEFAULT_COLUMNS = [HandwritingDataBase.AXIS_X, HandwritingDataBase.AXIS_Y, HandwritingDataBase.PRESSURE]
+
+    # ------- #
+    # Kernels #
+    # ------- #
+
+    @classmethod
+    def get_kernel(cls, kernel, **parameters):
+        """
+        Gets the filter kernel.
+
+        :param kernel: ["moving_average"|"gaussian"|"savitzky_golay"]
+        :type kernel: str
+        :param parameters: parameters of the kernel (see the kernel methods)
+        :type parameters: dict
+        :return: kernel (odd length, applied as correlation)
+        :rtype: np.array
+        """
+        if kernel not in cls.KERNELS:
+            raise ValueError(f"Unknown kernel {kernel}. Please select from {cls.KERNELS}.")
+        return getattr(cls, f"{kernel}_kernel")(**parameters)
+
+    @classmethod
+    def moving_average_kernel(cls, window):
+        """
+        Gets the moving average kernel.
+
+        :param window: length of the window (odd)
+        :type window: int
+        :return: kernel
+        :rtype: np.array
+        """
+        cls._check_window(window)
+        return np.full(window, 1 / window)
+
+    @classmethod
+    def gaussian_kernel(cls, sigma, window=None):
+        """
+        Gets the Gaussian kernel.
+
+        :param sigma: standard deviation (in samples)
+        :type sigma: float
+        :param window: OPTIONAL, length of the window (odd), DEFAULT = 2 * ceil(3 * sigma) + 1
+        :type window: int
+        :return: kernel
+        :rtype: np.array
+        """
+        if not HandwritingSampleTransformer._is_number(sigma) or sigma <= 0:
+            raise ValueError(f"Sigma must be a positive number!")
+
+        window = window or 2 * math.ceil(3 * sigma) + 1
+        cls._check_window(window)
+
+        positions = np.arange(window) - window // 2
+        kernel = np.exp(-0.5 * (positions / sigma) ** 2)
+        return kernel / kernel.sum()
+
+    @classmethod
+    def savitzky_golay_kernel(cls, window, polyorder, derivative=0, delta=1.0):
+        """
+        Gets the Savitzky-Golay kernel (least-squares polynomial fit in the window).
+
+        :param window: length of the window (odd)
+        :type window: int
+        :param polyorder: order of the polynomial (lower than the window)
+        :type polyorder: int
+        :param derivative: OPTIONAL, order of the derivative, DEFAULT = 0 (smoothing)
+        :type derivative: int
+        :param delta: OPTIONAL, sampling period (for the derivatives), DEFAULT = 1.0
+        :type delta: float
+        :return: kernel
+        :rtype: np.array
+        """
+        cls._check_window(window)
+        if not isinstance(polyorder, int) or not 0 <= polyorder < window:
+            raise ValueError(f"Polynomial order must be an integer from 0 to {window - 1}!")
+        if not isinstance(derivative, int) or not 0 <= derivative <= polyorder:
+            raise ValueError(f"Derivative must be an integer from 0 to the polynomial order ({polyorder})!")
+
+        # Least-squares fit of the polynomial coefficients (row d gives the d-th coefficient)
+        positions = np.arange(window) - window // 2
+        coefficients = np.linalg.pinv(np.vander(positions, polyorder + 1, increasing=True))
+
+        # Return the kernel of the derivative
+        return coefficients[derivative] * math.factorial(derivative) / delta ** derivative
+
+    # --------- #
+    # Filtering #
+    # --------- #
+
+    @classmethod
+    def filter_strokes(cls, values, starts, ends, kernel, mode=NEAREST):
+        """
+        Filters the values stroke by stroke.
+
+        :param values: input values
+        :type values: np.array
+        :param starts: start indices of the strokes
+        :type starts: np.array
+        :param ends: end indices (exclusive) of the strokes
+        :type ends: np.array
+        :param kernel: filter kernel (odd length, applied as correlation)
+        :type kernel: np.array
+        :param mode: OPTIONAL ["nearest"|"reflect"], padding of the strokes, DEFAULT = "nearest"
+        :type mode: str
+        :return: filtered values
+        :rtype: np.array
+        """
+        kernel = np.asarray(kernel, dtype=float)
+        sources, positions = cls._padded_layout(starts, ends, kernel.size // 2, mode)
+        return cls._filter_padded(np.asarray(values, dtype=float), sources, positions, kernel)
+
+    def filter(self, sample, kernel, columns=None, mode=NEAREST):
+        """
+        Filters the handwriting variables of the sample (see filter_batch).
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param kernel: filter kernel (see get_kernel)
+        :type kernel: np.array
+        :param columns: OPTIONAL, filtered variables, DEFAULT = x, y, pressure
+        :type columns: list[str]
+        :param mode: OPTIONAL ["nearest"|"reflect"], padding of the strokes, DEFAULT = "nearest"
+        :type mode: str
+        :return: filtered object of HandwritingSample class
+        :rtype: handwriting_sample.HandwritingSample
+        """
+        return self.filter_batch([sample], kernel, columns=columns, mode=mode)[0]
+
+    def filter_batch(self, samples, kernel, columns=None, mode=NEAREST):
+        """
+        Filters the handwriting variables of many samples at once.
+
+        The filtered variables are set to the samples and the filtering is recorded
+        (it is not invertible, so the original data are kept).
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param kernel: filter kernel (see get_kernel)
+        :type kernel: np.array
+        :param columns: OPTIONAL, filtered variables, DEFAULT = x, y, pressure
+        :type columns: list[str]
+        :param mode: OPTIONAL ["nearest"|"reflect"], padding of the strokes, DEFAULT = "nearest"
+        :type mode: str
+        :return: filtered objects of HandwritingSample class
+        :rtype: list[handwriting_sample.HandwritingSample]
+        """
+        samples = list(samples)
+        for sample, filtered in zip(samples, self.compute_batch(samples, kernel, columns=columns, mode=mode)):
+            sample._apply_transformation(
+                "filter",
+                {"kernel": np.asarray(kernel).tolist(), "mode": mode},
+                {column: (values, None, None) for column, values in filtered.items()})
+        return samples
+
+    def compute_batch(self, samples, kernel, columns=None, mode=NEAREST):
+        """
+        Computes the filtered handwriting variables of many samples (the samples are not changed).
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param kernel: filter kernel (see get_kernel)
+        :type kernel: np.array
+        :param columns: OPTIONAL, filtered variables, DEFAULT = x, y, pressure
+        :type columns: list[str]
+        :param mode: OPTIONAL ["nearest"|"reflect"], padding of the strokes, DEFAULT = "nearest"
+        :type mode: str
+        :return: filtered variables of each sample {column: values}
+        :rtype: list[dict[str, np.array]]
+        """
+
+        # Check input
+        samples = list(samples)
+        columns = list(columns or self.DEFAULT_COLUMNS)
+        kernel = np.asarray(kernel, dtype=float)
+
+        unknown = set(columns).difference(self.COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown variables {sorted(unknown)}. Please select from {self.COLUMNS}.")
+        if kernel.ndim != 1 or kernel.size % 2 == 0:
+            raise ValueError(f"Kernel must be a 1D array of odd length!")
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode {mode}. Please select from {self.MODES}.")
+        if not samples:
+            return []
+
+        # Get the strokes of all samples (a new stroke also starts with each sample)
+        lengths = np.array([len(sample.time) for sample in samples], dtype=np.int64)
+        sample_starts = np.cumsum(lengths) - lengths
+        pen_status = np.concatenate([np.asarray(sample.pen_status) for sample in samples])
+        starts, ends = HandwritingSampleTransformer.stroke_bounds(pen_status, sample_starts[lengths > 0])
+
+        # Get the layout of the padded strokes once (the same layout is used for all variables)
+        sources, positions = self._padded_layout(starts, ends, kernel.size // 2, mode)
+
+        # Filter the variables
+        filtered = {}
+        for column in columns:
+            values = np.concatenate([np.asarray(getattr(sample, column), dtype=float) for sample in samples])
+            filtered[column] = self._filter_padded(values, sources, positions, kernel)
+
+        # Return the filtered variables of each sample
+        return [{column: values[start:start + length] for column, values in filtered.items()}
+                for start, length in zip(sample_starts, lengths)]
+
+    # --------------- #
+    # Utility methods #
+    # --------------- #
+
+    @staticmethod
+    def _filter_padded(values, sources, positions, kernel):
+        """Lays out the padded strokes in one buffer and filters it by a single convolution"""
+        return np.convolve(values[sources], kernel[::-1], mode="valid")[positions]
+
+    @staticmethod
+    def _padded_layout(starts, ends, half, mode):
+        """
+        Gets the layout of the padded strokes.
+
+        :return: source index of each value of the padded buffer,
+                 position of each value in the output of the valid convolution of the buffer
+        :rtype: np.array, np.array
+        """
+
+        # Get the padded strokes
+        lengths = ends - starts
+        padded_lengths = lengths + 2 * half
+        padded_starts = np.cumsum(padded_lengths) - padded_lengths
+
+        # Get the position of each value of the buffer within its stroke (from -half to length + half)
+        stroke_ids = np.repeat(np.arange(starts.size), padded_lengths)
+        local = np.arange(padded_lengths.sum()) - padded_starts[stroke_ids] - half
+        stroke_lengths = lengths[stroke_ids]
+
+        # Map the positions outside of the strokes
+        if mode == HandwritingSampleFilter.NEAREST:
+            local = np.clip(local, 0, stroke_lengths - 1)
+        else:
+            period = np.maximum(2 * (stroke_lengths - 1), 1)
+            local = np.abs(local) % period
+            local = np.where(local >= stroke_lengths, period - local, local)
+            local = np.where(stroke_lengths > 1, local, 0)
+
+        # Return the layout (the output of a value starts its window at its padded position - half)
+        positions = np.repeat(padded_starts - starts, lengths) + np.arange(lengths.sum())
+        return starts[stroke_ids] + local, positions
+
+    @staticmethod
+    def _check_window(window):
+        """Checks the length of the window"""
+        if not isinstance(window, int) or window < 1 or window % 2 == 0:
+            raise ValueError(f"Window must be a positive odd integer!")
@@ -1,5 +1,6 @@
 import numpy as np
 from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer.exceptions import TransformerAngleTypeException
 
 
 class HandwritingSampleTransformer(HandwritingDataBase):
@@ -32,8 +33,33 @@ class HandwritingSampleTransformer(HandwritingDataBase):
 
     PX_TO_MM = DEFAULT_MM_DIMENSIONS[0] / DEFAULT_PIXEL_RESOLUTION[0]
 
+    # Time is taken to be in seconds if the median sampling period is lower (above 2 Hz), in milliseconds otherwise
+    MAX_PERIOD_IN_SECONDS = 0.5
+
+    # Number of points transformed at once by the affine transformations
+    AFFINE_BLOCK_SIZE = 1 << 16
+
+    @staticmethod
+    def _as_numeric_array(input_array):
+        """Returns input data as a numpy array, raises ValueError if the data are not numbers"""
+        input_array = np.asarray(input_array)
+        if input_array.dtype.kind not in "biuf":
+            raise ValueError(f"Input data are not numbers!")
+        return input_array
+
+    @staticmethod
+    def _owns_float_array(values):
+        """Returns true if the values are a writeable float64 array owning its memory (not a view of another array)"""
+        return isinstance(values, np.ndarray) and values.dtype == np.float64 and values.flags.writeable and \
+            values.base is None
+
     @staticmethod
-    def normalize_time_series(input_array, max_value):
+    def _is_number(value):
+        """Checks if the value is a real number (Python or numpy scalar)"""
+        return isinstance(value, (int, float, np.integer, np.floating))
+
+    @classmethod
+    def normalize_time_series(cls, input_array, max_value, out=None):
         """
         Normalizes input time-series.
 
@@ -41,21 +67,22 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         :type input_array: nd.array
         :param max_value: max heoretical value
         :type max_value: int
+        :param out: OPTIONAL, float array the result is written to (may be the input array)
+        :type out: nd.array
         :return: Normalized data
-        :rtype: list
+        :rtype: nd.array
         """
 
         # Check input
-        if not all(isinstance(x.item(), (int, float)) for x in input_array):
-            raise ValueError(f"Input data are not numbers!")
-        if not isinstance(max_value, (int, float)):
+        input_array = cls._as_numeric_array(input_array)
+        if not cls._is_number(max_value):
             raise ValueError(f"Max value is not number!")
 
         # Return normalized array
-        return np.array(list(map((lambda x: x / max_value), input_array)))
+        return np.divide(input_array, max_value, out=out)
 
-    @staticmethod
-    def normalize_pressure(input_array, max_value=MAX_PRESSURE_VALUE, pressure_levels=PRESSURE_LEVELS):
+    @classmethod
+    def normalize_pressure(cls, input_array, max_value=MAX_PRESSURE_VALUE, pressure_levels=PRESSURE_LEVELS, out=None):
         """
         Normalizes pressure to pressure level of the device.
 
@@ -67,39 +94,49 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         :param pressure_levels: OPTIONAL, DEFAULT = 8192
                                 level of pressure of the device
         :type pressure_levels: int
+        :param out: OPTIONAL, float array the result is written to (may be the input array)
+        :type out: np.array
         :return: array with normalized pressure
         :rtype: np.array
         """
 
         # Check input
-        if not all(isinstance(x.item(), (int, float)) for x in input_array):
-            raise ValueError(f"Input data are not numbers!")
-        if not isinstance(max_value, (int, float)):
+        input_array = cls._as_numeric_array(input_array)
+        if not cls._is_number(max_value):
             raise ValueError(f"Max value is not number!")
-        if not isinstance(pressure_levels, (int, float)):
+        if not cls._is_number(pressure_levels):
             raise ValueError(f"Pressure levels is not number!")
 
-        return np.array(list(map((lambda x: (x / max_value) * pressure_levels), input_array)))
+        # Normalize pressure (the second step reuses the buffer of the first one)
+        output = np.divide(input_array, max_value, out=out)
+        return np.multiply(output, pressure_levels, out=output)
 
-    @staticmethod
-    def transform_time_to_seconds(time_array):
+    @classmethod
+    def transform_time_to_seconds(cls, time_array, out=None):
         """
         Transforms time to seconds.
 
         :param time_array: input array of timestamp
         :type time_array: np.array
+        :param out: OPTIONAL, float array the result is written to (may be the input array)
+        :type out: np.array
         :return: time in seconds
         :rtype: nd.array
         """
 
         # Check input
-        if not all(isinstance(x.item(), (int, float)) for x in time_array):
-            raise ValueError(f"Input data are not numbers!")
+        time_array = cls._as_numeric_array(time_array)
 
-        return np.array(list(map((lambda x: (x - time_array[0]) / 1e3), time_array)))
+        # Handle empty time
+        if not time_array.size:
+            return np.array(time_array, dtype=float) if out is None else out
 
-    @staticmethod
-    def transform_angle(input_array, max_raw_value, max_degree_value):
+        # Shift time to 0 and transform to seconds (the second step reuses the buffer of the first one)
+        output = np.subtract(time_array, time_array[0], out=out)
+        return np.divide(output, 1e3, out=output if output.dtype.kind == "f" else None)
+
+    @classmethod
+    def transform_angle(cls, input_array, max_raw_value, max_degree_value, out=None):
         """
         Transforms raw angle to degrees.
 
@@ -109,23 +146,71 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         :type max_raw_value: int
         :param max_degree_value: Maximal value of angle in degrees
         :type max_degree_value: int
+        :param out: OPTIONAL, float array the result is written to (may be the input array)
+        :type out: np.array
         :return: angle in degrees
         :rtype: nd.array
         """
 
         # Check input
-        if not all(isinstance(x.item(), (int, float)) for x in input_array):
-            raise ValueError(f"Input data are not numbers!")
-        if not isinstance(max_raw_value, (int, float)):
+        input_array = cls._as_numeric_array(input_array)
+        if not cls._is_number(max_raw_value):
             raise ValueError(f"Max raw value is not number!")
-        if not isinstance(max_degree_value, (int, float)):
+        if not cls._is_number(max_degree_value):
             raise ValueError(f"Max angle value is not number!")
 
         # Get value of degree per one point
         degree_per_point = max_degree_value / max_raw_value
 
         # Transform array to degrees
-        return np.array(list(map((lambda x: (x * degree_per_point)), input_array)))
+        return np.multiply(input_array, degree_per_point, out=out)
+
+    @classmethod
+    def get_axis_scale(cls, conversion_type=LPI, lpi_value=LPI_VALUE):
+        """
+        Gets the scale of the conversion of the axis to millimeters.
+
+        :param conversion_type: OPTIONAL ["lpi"|"mm"], DEFAULT="lpi"
+        :type conversion_type: str
+        :param lpi_value: OPTIONAL, DEFAULT = 5080
+        :type lpi_value: int
+        :return: millimeters per raw unit
+        :rtype: float
+        """
+        if conversion_type == cls.LPI:
+            return cls.INCH_TO_MM / lpi_value
+        if conversion_type == cls.MM:
+            return cls.MM_VALUE
+        if conversion_type == cls.LPMM:
+            raise NotImplementedError(f"Do not supporting this conversion anymore, due to incorrect formula.")
+        raise ValueError(f"Unknown conversion type {conversion_type}")
+
+    @classmethod
+    def convert_axis_to_mm(cls, input_array, conversion_type=LPI, lpi_value=LPI_VALUE, out=None):
+        """
+        Converts raw axis values to millimeters.
+
+        :param input_array: Input array with raw axis values
+        :type input_array: np.array
+        :param conversion_type: OPTIONAL ["lpi"|"mm"], DEFAULT="lpi"
+        :type conversion_type: str
+        :param lpi_value: OPTIONAL, DEFAULT = 5080
+        :type lpi_value: int
+        :param out: OPTIONAL, float array the result is written to (may be the input array)
+        :type out: np.array
+        :return: axis in millimeters
+        :rtype: np.array
+        """
+
+        # Check input
+        input_array = cls._as_numeric_array(input_array)
+        cls.get_axis_scale(conversion_type, lpi_value)
+
+        # Convert the axis (the second step reuses the buffer of the first one)
+        if conversion_type == cls.LPI:
+            output = np.multiply(input_array, cls.INCH_TO_MM, out=out)
+            return np.divide(output, lpi_value, out=output)
+        return np.multiply(input_array, cls.MM_VALUE, out=out)
 
     def transform_axis(self, sample, conversion_type=LPI, lpi_value=LPI_VALUE, lpmm_value=LPMM_VALUE,
                        shift_to_zero=True):
@@ -166,8 +251,9 @@ class HandwritingSampleTransformer(HandwritingDataBase):
             self.log(f"Using {conversion_type} = {lpi_value} for axis conversion to millimeters.")
 
             # Convert axis
-            sample.x = (sample.x * self.INCH_TO_MM) / lpi_value
-            sample.y = (sample.y * self.INCH_TO_MM) / lpi_value
+            scale = self.get_axis_scale(conversion_type, lpi_value)
+            x = self.convert_axis_to_mm(sample.x, conversion_type, lpi_value)
+            y = self.convert_axis_to_mm(sample.y, conversion_type, lpi_value)
 
         # BAD FORMULA... MAKING NO SENSE!
         # elif conversion_type == self.LPMM:
@@ -185,16 +271,105 @@ class HandwritingSampleTransformer(HandwritingDataBase):
             self.log(f"Using {conversion_type} = {self.MM_VALUE} for axis conversion to millimeters.")
 
             # Convert axis
-            sample.x = sample.x * self.MM_VALUE
-            sample.y = sample.y * self.MM_VALUE
+            scale = self.get_axis_scale(conversion_type)
+            x = self.convert_axis_to_mm(sample.x, conversion_type)
+            y = self.convert_axis_to_mm(sample.y, conversion_type)
 
         else:
             raise ValueError(f"Unknown conversion type {conversion_type}")
 
+        # Get the shift of the axis
+        shift_x, shift_y = 0, 0
+
         if shift_to_zero:
             self.log(f"Shift axis data to start from 0,0 coordinates")
-            sample.x = sample.x - min(sample.x)
-            sample.y = sample.y - min(sample.y)
+            shift_x, shift_y = min(x), min(y)
+            x = x - shift_x
+            y = y - shift_y
+
+        # Set the axis and record the transformation
+        sample._apply_transformation(
+            "transform_axis",
+            {"conversion_type": conversion_type, "lpi_value": lpi_value, "lpmm_value": lpmm_value,
+             "shift_to_zero": shift_to_zero},
+            {self.AXIS_X: (x, scale, -shift_x), self.AXIS_Y: (y, scale, -shift_y)})
+
+        return sample
+
+    def transform_sample_time_to_seconds(self, sample):
+        """
+        Transforms time of the sample to seconds (and records the transformation).
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :return: updated object of HandwritingSample class
+        :rtype: handwriting_sample.HandwritingSample
+        """
+
+        # Transform time to seconds
+        start = sample.time[0]
+        time = self.transform_time_to_seconds(sample.time)
+
+        # Set the time and record the transformation
+        sample._apply_transformation("transform_time_to_seconds", {}, {self.TIME: (time, 1 / 1e3, -start / 1e3)})
+
+        return sample
+
+    def normalize_sample_pressure(self, sample, max_value=MAX_PRESSURE_VALUE, pressure_levels=PRESSURE_LEVELS):
+        """
+        Normalizes pressure of the sample to pressure level of the device (and records the transformation).
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param max_value: OPTIONAL, DEFAULT = 32767
+                          max theoretical raw pressure value
+        :type max_value: int
+        :param pressure_levels: OPTIONAL, DEFAULT = 8192
+                                level of pressure of the device
+        :type pressure_levels: int
+        :return: updated object of HandwritingSample class
+        :rtype: handwriting_sample.HandwritingSample
+        """
+
+        # Normalize pressure
+        pressure = self.normalize_pressure(sample.pressure, max_value=max_value, pressure_levels=pressure_levels)
+
+        # Set the pressure and record the transformation
+        sample._apply_transformation(
+            "normalize_pressure",
+            {"max_value": max_value, "pressure_levels": pressure_levels},
+            {self.PRESSURE: (pressure, pressure_levels / max_value, 0)})
+
+        return sample
+
+    def transform_sample_angle(self, sample, angle, max_raw_value, max_degree_value):
+        """
+        Transforms raw angle of the sample to degrees (and records the transformation).
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param angle: Angle that should be converted [tilt, azimuth]
+        :type angle: str
+        :param max_raw_value: Maximal theoretical value of raw angle
+        :type max_raw_value: int
+        :param max_degree_value: Maximal value of angle in degrees
+        :type max_degree_value: int
+        :return: updated object of HandwritingSample class
+        :rtype: handwriting_sample.HandwritingSample
+        """
+
+        # Check input
+        if angle not in (self.TILT, self.AZIMUTH):
+            raise TransformerAngleTypeException(angle)
+
+        # Transform angle to degrees
+        values = self.transform_angle(getattr(sample, angle), max_raw_value, max_degree_value)
+
+        # Set the angle and record the transformation
+        sample._apply_transformation(
+            "transform_angle",
+            {"angle": angle, "max_raw_value": max_raw_value, "max_degree_value": max_degree_value},
+            {angle: (values, max_degree_value / max_raw_value, 0)})
 
         return sample
 
@@ -211,7 +386,9 @@ class HandwritingSampleTransformer(HandwritingDataBase):
             max_pressure=MAX_PRESSURE_VALUE,
             pressure_levels=PRESSURE_LEVELS,
             angles_to_degrees=True,
-            shift_to_zero=True):
+            shift_to_zero=True,
+            fused=False,
+            inplace=False):
         """
         Transforms all unites of sample object:
             - transforms X,Y to millimeters.
@@ -256,12 +433,35 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         :param shift_to_zero: OPTIONAL, DEFAULT = True
                               Shift axis values to start from 0,0 coordinates
         :type shift_to_zero: bool
+        :param fused: OPTIONAL, DEFAULT = False
+                      Compute all conversions in place over one float array per variable
+        :type fused: bool
+        :param inplace: OPTIONAL, DEFAULT = False
+                        Fused conversions write to the float arrays of the sample (implies fused)
+        :type inplace: bool
         :return: updated object of HandwritingSample class
         :rtype: handwriting_sample.HandwritingSample
         """
 
         # TODO _read max/range values from metadata
 
+        # Use the fused conversions
+        if fused or inplace:
+            return self.transform_all_units_batch(
+                [sample],
+                conversion_type=conversion_type,
+                lpi_value=lpi_value,
+                lpmm_value=lpmm_value,
+                max_raw_azimuth=max_raw_azimuth,
+                max_raw_tilt=max_raw_tilt,
+                max_degree_azimuth=max_degree_azimuth,
+                max_degree_tilt=max_degree_tilt,
+                max_pressure=max_pressure,
+                pressure_levels=pressure_levels,
+                angles_to_degrees=angles_to_degrees,
+                shift_to_zero=shift_to_zero,
+                inplace=inplace)[0]
+
         sample = self.transform_axis(
             sample,
             conversion_type=conversion_type,
@@ -270,36 +470,196 @@ class HandwritingSampleTransformer(HandwritingDataBase):
             shift_to_zero=shift_to_zero)
 
         # Transform time to seconds
-        sample.time = self.transform_time_to_seconds(sample.time)
+        self.transform_sample_time_to_seconds(sample)
 
         # Normalize Azimuth, Tilt or transform to degree
         if angles_to_degrees:
 
             # Transform to degrees
-            sample.azimuth = self.transform_angle(
-                sample.azimuth,
+            self.transform_sample_angle(
+                sample,
+                self.AZIMUTH,
                 max_raw_azimuth,
                 max_degree_azimuth)
-            sample.tilt = self.transform_angle(
-                sample.tilt,
+            self.transform_sample_angle(
+                sample,
+                self.TILT,
                 max_raw_tilt,
                 max_degree_tilt)
 
         # Normalize pressure
-        sample.pressure = self.normalize_pressure(
-            sample.pressure,
+        self.normalize_sample_pressure(
+            sample,
             max_value=max_pressure,
             pressure_levels=pressure_levels)
 
         # Return
         return sample
 
-    def control_for_pressure(
+    def transform_all_units_batch(
             self,
+            samples,
+            conversion_type=LPI,
+            lpi_value=LPI_VALUE,
+            lpmm_value=LPMM_VALUE,
+            max_raw_azimuth=MAX_AZIMUTH_VALUE,
+            max_raw_tilt=MAX_TILT_VALUE,
+            max_degree_azimuth=MAX_AZIMUTH_DEGREE,
+            max_degree_tilt=MAX_TILT_DEGREE,
+            max_pressure=MAX_PRESSURE_VALUE,
+            pressure_levels=PRESSURE_LEVELS,
+            angles_to_degrees=True,
+            shift_to_zero=True,
+            inplace=False):
+        """
+        Transforms all unites of many sample objects at once (fused conversions).
+
+        The parameters are checked once. The variables of each sample are copied into new
+        float arrays once and every conversion is computed in place over them, so no
+        intermediate arrays are created. With ``inplace=True`` the float arrays owned by the
+        samples are reused instead (views and arrays of other types are copied once). The
+        results are identical to ``transform_all_units`` and the transformations are
+        recorded in the same way.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param conversion_type: OPTIONAL ["lpi"|"mm"], DEFAULT="lpi".
+        :type conversion_type: str
+        :param lpi_value:  OPTIONAL , DEFAULT = 5080
+        :type lpi_value: int
+        :param lpmm_value: OPTIONAL, DEFAULT = 200
+        :type lpmm_value: int
+        :param max_raw_azimuth: OPTIONAL, DEFAULT = 3600
+        :type max_raw_azimuth: int
+        :param max_raw_tilt: OPTIONAL, DEFAULT = 900
+        :type max_raw_tilt: int
+        :param max_degree_azimuth: OPTIONAL, DEFAULT = 360
+        :type max_degree_azimuth: int
+        :param max_degree_tilt: OPTIONAL, DEFAULT = 90
+        :type max_degree_tilt: int
+        :param max_pressure: OPTIONAL, DEFAULT = 32767
+        :type max_pressure: int
+        :param pressure_levels: OPTIONAL, DEFAULT = 8192
+        :type pressure_levels: int
+        :param angles_to_degrees: OPTIONAL, DEFAULT = True
+        :type angles_to_degrees: bool
+        :param shift_to_zero: OPTIONAL, DEFAULT = True
+        :type shift_to_zero: bool
+        :param inplace: OPTIONAL, DEFAULT = False
+                        Write to the float arrays owned by the samples instead of new arrays
+        :type inplace: bool
+        :return: updated objects of HandwritingSample class
+        :rtype: list[handwriting_sample.HandwritingSample]
+        """
+
+        # Check input
+        if not isinstance(conversion_type, str):
+            raise ValueError(f"Conversion type must be string not {type(conversion_type)}.")
+        if not isinstance(lpi_value, int):
+            raise ValueError(f"LPI value must be int not {type(lpi_value)}.")
+        if not isinstance(lpmm_value, int):
+            raise ValueError(f"LPMM value must be int not {type(lpmm_value)}.")
+        if conversion_type == self.LPMM:
+            raise NotImplementedError(f"Do not supporting this conversion anymore, due to incorrect formula.")
+        if conversion_type not in (self.LPI, self.MM):
+            raise ValueError(f"Unknown conversion type {conversion_type}")
+        for value in (max_raw_azimuth, max_raw_tilt, max_degree_azimuth, max_degree_tilt, max_pressure,
+                      pressure_levels):
+            if not self._is_number(value):
+                raise ValueError(f"Value {value} is not number!")
+
+        # Prepare the variables to transform and the samples
+        columns = [self.AXIS_X, self.AXIS_Y, self.TIME, self.PRESSURE]
+        columns += [self.AZIMUTH, self.TILT] if angles_to_degrees else []
+        samples = list(samples)
+
+        # Get the constants
+        axis_scale = self.get_axis_scale(conversion_type, lpi_value)
+        azimuth_scale = max_degree_azimuth / max_raw_azimuth
+        tilt_scale = max_degree_tilt / max_raw_tilt
+        scales = {self.AXIS_X: axis_scale, self.AXIS_Y: axis_scale, self.TIME: 1 / 1e3,
+                  self.PRESSURE: pressure_levels / max_pressure, self.AZIMUTH: azimuth_scale, self.TILT: tilt_scale}
+
+        for sample in samples:
+
+            # Keep the original values that cannot be reconstructed (before the arrays are changed in place)
+            sample._keep_original_data({column: scales[column] for column in columns})
+
+            # Prepare the float arrays the conversions are computed in (each sample gets its own arrays,
+            # so a surviving sample does not keep the arrays of the others alive)
+            arrays = {}
+            for column in columns:
+                values = getattr(sample, column)
+                if not (inplace and self._owns_float_array(values)):
+                    values = np.array(values, dtype=np.float64)
+                arrays[column] = values
+
+            x, y, time, pressure = (arrays[column] for column in columns[:4])
+            length = len(time)
+
+            # Transform axis to millimeters
+            for axis in (x, y):
+                self.convert_axis_to_mm(axis, conversion_type, lpi_value, out=axis)
+
+            # Transform angles to degrees
+            if angles_to_degrees:
+                self.transform_angle(arrays[self.AZIMUTH], max_raw_azimuth, max_degree_azimuth,
+                                     out=arrays[self.AZIMUTH])
+                self.transform_angle(arrays[self.TILT], max_raw_tilt, max_degree_tilt, out=arrays[self.TILT])
+
+            # Normalize pressure
+            self.normalize_pressure(pressure, max_value=max_pressure, pressure_levels=pressure_levels, out=pressure)
+
+            # Shift axis data to start from 0,0 coordinates
+            shift_x, shift_y = 0, 0
+            if shift_to_zero and length:
+                shift_x, shift_y = x.min(), y.min()
+                np.subtract(x, shift_x, out=x)
+                np.subtract(y, shift_y, out=y)
+
+            # Shift time to 0 and transform to seconds
+            start_time = time[0] if length else 0
+            self.transform_time_to_seconds(time, out=time)
+
+            # Set the variables and record the transformations
+            sample._apply_transformation(
+                "transform_axis",
+                {"conversion_type": conversion_type, "lpi_value": lpi_value, "lpmm_value": lpmm_value,
+                 "shift_to_zero": shift_to_zero},
+                {self.AXIS_X: (x, axis_scale, -shift_x),
+                 self.AXIS_Y: (y, axis_scale, -shift_y)},
+                originals_kept=True)
+            sample._apply_transformation(
+                "transform_time_to_seconds", {}, {self.TIME: (time, 1 / 1e3, -start_time / 1e3)}, originals_kept=True)
+            if angles_to_degrees:
+                sample._apply_transformation(
+                    "transform_angle",
+                    {"angle": self.AZIMUTH, "max_raw_value": max_raw_azimuth,
+                     "max_degree_value": max_degree_azimuth},
+                    {self.AZIMUTH: (arrays[self.AZIMUTH], azimuth_scale, 0)},
+                    originals_kept=True)
+                sample._apply_transformation(
+                    "transform_angle",
+                    {"angle": self.TILT, "max_raw_value": max_raw_tilt, "max_degree_value": max_degree_tilt},
+                    {self.TILT: (arrays[self.TILT], tilt_scale, 0)},
+                    originals_kept=True)
+            sample._apply_transformation(
+                "normalize_pressure",
+                {"max_value": max_pressure, "pressure_levels": pressure_levels},
+                {self.PRESSURE: (pressure, scales[self.PRESSURE], 0)},
+                originals_kept=True)
+
+        # Return the samples
+        return samples
+
+    @classmethod
+    def control_for_pressure(
+            cls,
             input_array,
             pressure_levels=PRESSURE_LEVELS,
             max_raw_press_value=MAX_PRESSURE_VALUE,
-            max_range_press=MAX_OLD_RANGE_PRESSURE):
+            max_range_press=MAX_OLD_RANGE_PRESSURE,
+            verbose=False):
         """
         Controls for pressure range values.
 
@@ -315,73 +675,212 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         :type max_raw_press_value: int
         :param max_range_press: OPTIONAL - maximum allowed pressure range of raw data. DEFAULT = 1024
         :type max_range_press: int
+        :param verbose: OPTIONAL - verbosity of the logging. DEFAULT = False
+        :type verbose: bool
         :return: converted pressure to new scale
         :rtype: np.array
         """
 
         data_pressure_range = np.ptp(input_array)
-        self.log(f"Pressure range of data is: {data_pressure_range}")
+        cls.log(f"Pressure range of data is: {data_pressure_range}", be_verbose=verbose, is_verbose=True)
 
         if data_pressure_range > max_range_press:
 
             # Convert the pressure to lower range
-            self.log(f"Maximum allowed pressure range is: {max_range_press}.")
-            self.log(f"Converting pressure values with following params:")
-            self.log(f"  - device max pressure level = {pressure_levels}")
-            self.log(f"  - raw data max pressure value = {max_raw_press_value}")
-
-            output = np.array(list(map(lambda x: round((x / max_raw_press_value) * max_range_press), input_array)))
-            print(f"Converted Pressure range is: {np.ptp(output)}")
+            cls.log(f"Maximum allowed pressure range is: {max_range_press}. "
+                    f"Converting pressure values with following params: "
+                    f"device max pressure level = {pressure_levels}, "
+                    f"raw data max pressure value = {max_raw_press_value}", be_verbose=verbose, is_verbose=True)
 
-            return output
+            return cls._rescale_pressure_range(input_array, max_raw_press_value, max_range_press)
         return input_array
 
-    @staticmethod
-    def correct_pen_status(sample):
+    def control_for_pressure_batch(
+            self,
+            samples,
+            pressure_levels=PRESSURE_LEVELS,
+            max_raw_press_value=MAX_PRESSURE_VALUE,
+            max_range_press=MAX_OLD_RANGE_PRESSURE,
+            verbose=False):
         """
-        Corrects pen status values to binary form
+        Controls for pressure range values of many samples (see control_for_pressure).
 
-        :param sample: updated object of HandwritingSample class
+        The pressure ranges of all samples are computed in one pass over the concatenated
+        pressure values. The pressure of the affected samples (range above the allowed one)
+        is converted at once and set to the samples (the conversion is recorded).
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param pressure_levels: OPTIONAL - level of pressures of the device. DEFAULT = 8192
+        :type pressure_levels: int
+        :param max_raw_press_value: OPTIONAL - maximum theoretical value of pressure. DEFAULT = 32767
+        :type max_raw_press_value: int
+        :param max_range_press: OPTIONAL - maximum allowed pressure range of raw data. DEFAULT = 1024
+        :type max_range_press: int
+        :param verbose: OPTIONAL - verbosity of the logging. DEFAULT = False
+        :type verbose: bool
+        :return: per-sample report {"index", "pressure_range", "corrected", "corrected_range"}
+        :rtype: list[dict]
+        """
+
+        # Check input
+        samples = list(samples)
+        if not self._is_number(max_raw_press_value) or max_raw_press_value == 0:
+            raise ValueError(f"Maximum raw pressure value must be a non-zero number!")
+
+        # Concatenate the pressure values
+        pressures = [self._as_numeric_array(sample.pressure) for sample in samples]
+        lengths = np.array([pressure.size for pressure in pressures], dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(lengths)))
+        values = np.concatenate(pressures) if pressures else np.empty(0)
+
+        # Compute the pressure ranges (empty samples have zero range)
+        ranges = np.zeros(len(samples), dtype=values.dtype)
+        non_empty = lengths > 0
+        if non_empty.any():
+            offsets = starts[:-1][non_empty]
+            ranges[non_empty] = np.maximum.reduceat(values, offsets) - np.minimum.reduceat(values, offsets)
+
+        # Convert the pressure of the affected samples at once
+        affected = np.flatnonzero(ranges > max_range_press)
+        converted = self._rescale_pressure_range(
+            np.concatenate([pressures[index] for index in affected]) if affected.size else np.empty(0),
+            max_raw_press_value, max_range_press)
+        converted = np.split(converted, np.cumsum(lengths[affected])[:-1])
+
+        # Set the converted pressure
+        report = [{"index": index, "pressure_range": ranges[index].item(), "corrected": False, "corrected_range": None}
+                  for index in range(len(samples))]
+
+        for index, pressure in zip(affected, converted):
+            samples[index]._apply_transformation(
+                "control_for_pressure",
+                {"pressure_levels": pressure_levels, "max_raw_press_value": max_raw_press_value,
+                 "max_range_press": max_range_press},
+                {self.PRESSURE: (pressure, None, None)})
+            report[index]["corrected"] = True
+            report[index]["corrected_range"] = np.ptp(pressure).item()
+
+        self.log(f"Corrected pressure of {affected.size} out of {len(samples)} samples",
+                 be_verbose=verbose, is_verbose=True)
+
+        # Return the report
+        return report
+
+    @classmethod
+    def _rescale_pressure_range(cls, input_array, max_raw_press_value, max_range_press):
+        """Converts the pressure values to the lower range (rounded to integers)"""
+        output = np.divide(input_array, max_raw_press_value)
+        np.multiply(output, max_range_press, out=output)
+        np.round(output, out=output)
+        return output.astype(np.int64)
+
+    @classmethod
+    def correct_pen_status(cls, sample, threshold=0, release_threshold=None, validate=False):
+        """
+        Corrects pen status values to binary form (on-surface where the pressure is above the threshold).
+
+        With the release threshold (hysteresis), the pen stays on-surface until the pressure drops
+        to the release threshold or below, so a noisy pressure near the threshold does not split
+        the strokes. The pen status of the sample is replaced (the meta data and the other
+        variables are kept) and the correction is recorded.
+
+        :param sample: object of HandwritingSample class
         :type sample: handwriting_sample.HandwritingSample
+        :param threshold: OPTIONAL, DEFAULT = 0
+                          Pressure above which the pen is on-surface
+        :type threshold: float
+        :param release_threshold: OPTIONAL, DEFAULT = None (no hysteresis)
+                                  Pressure at or below which the pen is in-air (must not exceed the threshold)
+        :type release_threshold: float
+        :param validate: OPTIONAL, DEFAULT = False
+                         Validate the corrected data (removes the in-air movement on the boundaries)
+                         and return a new instance of HandwritingSample
+        :type validate: bool
         :return: instance of HandwritingSample
         :rtype: HandwritingSample
         """
 
         # Correct pen status
-        sample.pen_status = np.array(list(map(lambda x: 1 if x > 0 else 0, sample.pressure)))
+        pen_status = cls.compute_pen_status(sample.pressure, threshold, release_threshold)
 
-        # Hold meta data
-        meta_data = sample.meta
+        sample._apply_transformation(
+            "correct_pen_status",
+            {"threshold": threshold, "release_threshold": release_threshold},
+            {cls.PEN_STATUS: (pen_status, None, None)})
 
-        # Validate sample and return
-        r_sample = sample.from_pandas_dataframe(sample.data_pandas_dataframe)
+        # Validate the sample (rebuilds it; the meta data are kept)
+        if validate:
+            meta_data = sample.meta
+            sample = sample.from_pandas_dataframe(sample.data_pandas_dataframe)
+            if meta_data:
+                sample.add_meta_data(meta_data)
 
-        # Put back teh meta data
-        r_sample.add_meta_data(meta_data)
+        return sample
 
-        return r_sample
+    @classmethod
+    def compute_pen_status(cls, pressure, threshold=0, release_threshold=None):
+        """
+        Computes pen status from pressure values
+
+        :param pressure: Input array with pressure values
+        :type pressure: np.array
+        :param threshold: OPTIONAL, DEFAULT = 0
+                          Pressure above which the pen is on-surface
+        :type threshold: float
+        :param release_threshold: OPTIONAL, DEFAULT = None (no hysteresis)
+                                  Pressure at or below which the pen is in-air
+        :type release_threshold: float
+        :return: pen status (on-surface=True | in-air=False)
+        :rtype: np.array
+        """
 
-    @staticmethod
-    def revert_axis(input_array, axis_max_value):
+        # Check input
+        if not cls._is_number(threshold):
+            raise ValueError(f"Threshold is not a number!")
+        if release_threshold is not None and not cls._is_number(release_threshold):
+            raise ValueError(f"Release threshold is not a number!")
+        if release_threshold is not None and release_threshold > threshold:
+            raise ValueError(f"Release threshold ({release_threshold}) must not exceed the threshold ({threshold})!")
+
+        # Compute pen status without hysteresis
+        pressure = cls._as_numeric_array(pressure)
+        pressed = pressure > threshold
+        if release_threshold is None or release_threshold == threshold:
+            return pressed
+
+        # Between the thresholds, the last state (pressed or released) holds
+        decided = pressed | (pressure <= release_threshold)
+        last = np.where(decided, np.arange(pressure.size), -1)
+        np.maximum.accumulate(last, out=last)
+
+        # Return pen status (the pen starts in-air)
+        return np.where(last >= 0, pressed[np.maximum(last, 0)], False)
+
+    @classmethod
+    def revert_axis(cls, input_array, axis_max_value, out=None):
         """
         Revert axis
 
         :param input_array: Input array with raw angle values
         :type input_array: np.array
+        :param axis_max_value: Maximal value of the axis
+        :type axis_max_value: float
+        :param out: OPTIONAL, array the result is written to (may be the input array)
+        :type out: np.array
         :return: reverted axis
         :rtype: nd.array
         """
 
         # Check input
-        if not all(isinstance(x.item(), (int, float)) for x in input_array):
-            raise ValueError(f"Input data are not numbers!")
-        if not isinstance(axis_max_value, (int, float)):
+        input_array = cls._as_numeric_array(input_array)
+        if not cls._is_number(axis_max_value):
             raise ValueError(f"Axis max value is not a number!")
-        if max(input_array) > axis_max_value:
+        if input_array.size and input_array.max() > axis_max_value:
             raise ValueError(f"Axis max value ({axis_max_value}) is lower than max value of the input array"
-                             f" ({max(input_array)})! ")
+                             f" ({input_array.max()})! ")
         # Revert axis
-        return np.array(list(map(lambda x: axis_max_value - x, input_array)))
+        return np.subtract(axis_max_value, input_array, out=out)
 
     @staticmethod
     def rescale_axis(sample, rescale_coef=0.5):
@@ -400,11 +899,424 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         if not isinstance(rescale_coef, (int, float)):
             raise ValueError(f"Coefficient of rescaling is not number!")
 
-        sample.x = sample.x * rescale_coef
-        sample.y = sample.y * rescale_coef
+        # Set the axis and record the transformation
+        sample._apply_transformation(
+            "rescale_axis",
+            {"rescale_coef": rescale_coef},
+            {HandwritingDataBase.AXIS_X: (sample.x * rescale_coef, rescale_coef, 0),
+             HandwritingDataBase.AXIS_Y: (sample.y * rescale_coef, rescale_coef, 0)})
+
+        return sample
+
+    # -------------------------- #
+    # Affine geometry transforms #
+    # -------------------------- #
+
+    @staticmethod
+    def translation_matrix(dx=0, dy=0):
+        """
+        Gets the 3x3 matrix of the translation.
+
+        :param dx: OPTIONAL, translation of X, DEFAULT = 0
+        :type dx: float
+        :param dy: OPTIONAL, translation of Y, DEFAULT = 0
+        :type dy: float
+        :return: affine matrix
+        :rtype: np.array
+        """
+        return np.array([[1, 0, dx], [0, 1, dy], [0, 0, 1]], dtype=float)
+
+    @classmethod
+    def rotation_matrix(cls, angle, center=(0, 0)):
+        """
+        Gets the 3x3 matrix of the (counterclockwise) rotation about the center.
+
+        :param angle: angle of the rotation [degrees]
+        :type angle: float
+        :param center: OPTIONAL, center of the rotation (x, y), DEFAULT = (0, 0)
+        :type center: tuple
+        :return: affine matrix
+        :rtype: np.array
+        """
+        cos, sin = np.cos(np.radians(angle)), np.sin(np.radians(angle))
+        return cls._about_center(np.array([[cos, -sin, 0], [sin, cos, 0], [0, 0, 1]]), center)
+
+    @classmethod
+    def scaling_matrix(cls, scale_x, scale_y=None, center=(0, 0)):
+        """
+        Gets the 3x3 matrix of the scaling about the center.
+
+        :param scale_x: scale of X
+        :type scale_x: float
+        :param scale_y: OPTIONAL, scale of Y, DEFAULT = scale_x
+        :type scale_y: float
+        :param center: OPTIONAL, center of the scaling (x, y), DEFAULT = (0, 0)
+        :type center: tuple
+        :return: affine matrix
+        :rtype: np.array
+        """
+        scale_y = scale_x if scale_y is None else scale_y
+        return cls._about_center(np.diag([scale_x, scale_y, 1]).astype(float), center)
+
+    @classmethod
+    def shear_matrix(cls, angle_x=0, angle_y=0, center=(0, 0)):
+        """
+        Gets the 3x3 matrix of the shear about the center.
+
+        X is shifted by tan(angle_x) * y and Y by tan(angle_y) * x (relative to the center),
+        e.g. the slant is removed by the shear with angle_x = -slant.
+
+        :param angle_x: OPTIONAL, shear angle along X [degrees], DEFAULT = 0
+        :type angle_x: float
+        :param angle_y: OPTIONAL, shear angle along Y [degrees], DEFAULT = 0
+        :type angle_y: float
+        :param center: OPTIONAL, center of the shear (x, y), DEFAULT = (0, 0)
+        :type center: tuple
+        :return: affine matrix
+        :rtype: np.array
+        """
+        matrix = np.array([[1, np.tan(np.radians(angle_x)), 0], [np.tan(np.radians(angle_y)), 1, 0], [0, 0, 1]])
+        return cls._about_center(matrix, center)
+
+    @staticmethod
+    def compose_matrices(*matrices):
+        """
+        Composes the affine matrices (the first matrix is applied first).
+
+        :param matrices: 3x3 affine matrices
+        :type matrices: np.array
+        :return: affine matrix
+        :rtype: np.array
+        """
+        composed = np.eye(3)
+        for matrix in matrices:
+            composed = np.asarray(matrix, dtype=float) @ composed
+        return composed
+
+    @classmethod
+    def affine_transform(cls, sample, matrix, operation="affine_transform"):
+        """
+        Applies the affine transformation to X and Y of the sample.
+
+        The axis are transformed in place (into the float arrays owned by the sample, others are
+        copied once) block by block: each block of the input is staged, multiplied by the matrix
+        into a preallocated block buffer and shifted into the axis. The matrix is recorded, so the
+        original data are reconstructed by its inverse.
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param matrix: 3x3 affine matrix (see the matrix methods and compose_matrices)
+        :type matrix: np.array
+        :param operation: OPTIONAL, name of the recorded transformation, DEFAULT = "affine_transform"
+        :type operation: str
+        :return: handwriting sample with transformed axis
+        :rtype: handwriting_sample.HandwritingSample
+        """
+
+        # Check input
+        matrix = np.asarray(matrix, dtype=float)
+        if matrix.shape != (3, 3) or not np.array_equal(matrix[2], [0, 0, 1]) or not np.isfinite(matrix).all():
+            raise ValueError(f"Matrix must be a finite 3x3 affine matrix (with the last row [0, 0, 1])!")
+
+        # Keep the original values that cannot be reconstructed (before the axis are changed in place)
+        sample._keep_original_data({HandwritingDataBase.AXIS_X: None, HandwritingDataBase.AXIS_Y: None}, matrix=matrix)
+
+        # Get the float arrays of the axis (the arrays owned by the sample are reused)
+        x, y = sample.x, sample.y
+        if not cls._owns_float_array(x):
+            x = np.array(x, dtype=np.float64)
+        if not cls._owns_float_array(y) or np.may_share_memory(x, y):
+            y = np.array(y, dtype=np.float64)
+
+        # Transform the axis in place block by block
+        size = min(len(x), cls.AFFINE_BLOCK_SIZE)
+        staged, product = np.empty((2, size)), np.empty((2, size))
+        for start in range(0, len(x), cls.AFFINE_BLOCK_SIZE):
+            block = slice(start, start + cls.AFFINE_BLOCK_SIZE)
+            length = len(x[block])
+            staged[0, :length], staged[1, :length] = x[block], y[block]
+            np.matmul(matrix[:2, :2], staged[:, :length], out=product[:, :length])
+            np.add(product[0, :length], matrix[0, 2], out=x[block])
+            np.add(product[1, :length], matrix[1, 2], out=y[block])
+
+        # Set the axis and record the transformation
+        sample._apply_transformation(
+            operation,
+            {"matrix": matrix.tolist()},
+            {HandwritingDataBase.AXIS_X: (x, None, None),
+             HandwritingDataBase.AXIS_Y: (y, None, None)},
+            matrix=matrix,
+            originals_kept=True)
 
         return sample
 
+    @classmethod
+    def estimate_baseline_angle(cls, x, y, pen_status):
+        """
+        Estimates the angle of the baseline by least-squares regression of Y on X (on-surface points).
+
+        :param x: X axis
+        :type x: np.array
+        :param y: Y axis
+        :type y: np.array
+        :param pen_status: pen status
+        :type pen_status: np.array
+        :return: angle of the baseline [degrees] (0 for fewer than 2 on-surface points)
+        :rtype: float
+        """
+        on_surface = np.asarray(pen_status).astype(bool)
+        x = np.asarray(x, dtype=float)[on_surface]
+        y = np.asarray(y, dtype=float)[on_surface]
+        if x.size < 2:
+            return 0.0
+
+        dx, dy = x - x.mean(), y - y.mean()
+        return float(np.degrees(np.arctan2(np.dot(dx, dy), np.dot(dx, dx))))
+
+    @classmethod
+    def estimate_slant(cls, x, y, pen_status, max_angle=45):
+        """
+        Estimates the slant as the length-weighted mean deviation of the near-vertical on-surface
+        segments from the vertical direction.
+
+        :param x: X axis
+        :type x: np.array
+        :param y: Y axis
+        :type y: np.array
+        :param pen_status: pen status
+        :type pen_status: np.array
+        :param max_angle: OPTIONAL, maximal deviation of a segment from the vertical [degrees], DEFAULT = 45
+        :type max_angle: float
+        :return: slant [degrees], positive if the strokes lean towards +X with increasing Y
+                 (0 if there is no near-vertical segment)
+        :rtype: float
+        """
+        if not cls._is_number(max_angle) or not 0 < max_angle <= 90:
+            raise ValueError(f"Maximal angle must be a number from (0, 90]!")
+
+        # Get the segments between the consecutive on-surface points
+        on_surface = np.asarray(pen_status).astype(bool)
+        segments = on_surface[1:] & on_surface[:-1]
+        dx = np.diff(np.asarray(x, dtype=float))[segments]
+        dy = np.diff(np.asarray(y, dtype=float))[segments]
+
+        # Get the deviations of the segments from the vertical (both directions of the movement)
+        deviation = np.arctan2(dx * np.sign(dy), np.abs(dy))
+        length = np.hypot(dx, dy)
+        selected = (np.abs(deviation) <= np.radians(max_angle)) & (length > 0)
+
+        # Return the weighted mean deviation
+        if not selected.any():
+            return 0.0
+        return float(np.degrees(np.average(deviation[selected], weights=length[selected])))
+
+    @staticmethod
+    def _about_center(matrix, center):
+        """Moves the center of the linear transformation from the origin to the center"""
+        center_x, center_y = center
+        matrix[0, 2] = center_x - matrix[0, 0] * center_x - matrix[0, 1] * center_y
+        matrix[1, 2] = center_y - matrix[1, 0] * center_x - matrix[1, 1] * center_y
+        return matrix
+
+    def resample(self, sample, sampling_rate, time_scale=None):
+        """
+        Resamples the sample to a uniform sampling rate (see resample_batch)
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param sampling_rate: target sampling rate [Hz]
+        :type sampling_rate: float
+        :param time_scale: OPTIONAL, DEFAULT = None (inferred from the data, see get_time_scales)
+                           Number of time units per second
+        :type time_scale: float
+        :return: resampled object of HandwritingSample class
+        :rtype: handwriting_sample.HandwritingSample
+        """
+        return self.resample_batch([sample], sampling_rate, time_scale=time_scale)[0]
+
+    def resample_batch(self, samples, sampling_rate, time_scale=None):
+        """
+        Resamples many samples to a uniform sampling rate at once.
+
+        Every stroke is resampled separately on a uniform grid starting at its first timestamp,
+        so the stroke boundaries are kept. X, Y, azimuth, tilt and pressure are linearly
+        interpolated, pen status is constant within a stroke (step function). The strokes of
+        all samples are interpolated by a single np.interp call per variable (each stroke is
+        moved to its own time interval). The resampling is recorded; it is not invertible,
+        so the original data are kept.
+
+        :param samples: objects of HandwritingSample class
+        :type samples: iterable[handwriting_sample.HandwritingSample]
+        :param sampling_rate: target sampling rate [Hz]
+        :type sampling_rate: float
+        :param time_scale: OPTIONAL, DEFAULT = None (inferred from the data, see get_time_scales)
+                           Number of time units per second
+        :type time_scale: float
+        :return: resampled objects of HandwritingSample class
+        :rtype: list[handwriting_sample.HandwritingSample]
+        """
+
+        # Resample the variables
+        samples = list(samples)
+        resampled, _, stroke_ends, stroke_samples, periods = self.resample_strokes(
+            samples, sampling_rate, time_scale=time_scale)
+
+        # Set the variables and record the resampling (the original data are kept)
+        new_lengths = np.bincount(stroke_samples, weights=np.diff(stroke_ends, prepend=0),
+                                  minlength=len(samples)).astype(np.int64)
+        new_starts = np.cumsum(new_lengths) - new_lengths
+
+        for sample, start, length, period in zip(samples, new_starts, new_lengths, periods):
+            sample._apply_transformation(
+                "resample",
+                {"sampling_rate": sampling_rate,
+                 "time_scale": (period * sampling_rate).item(),
+                 "period": period.item()},
+                {column: (resampled[column][start:start + length].astype(
+                    np.asarray(getattr(sample, column)).dtype if column == self.PEN_STATUS else float), None, None)
+                 for column in self.COLUMNS})
+
+        # Return the samples
+        return samples
+
+    @classmethod
+    def resample_strokes(cls, samples, sampling_rate, time_scale=None, columns=None):
+        """
+        Resamples the strokes of many samples to a uniform sampling rate (the samples are not changed).
+
+        :param samples: objects of HandwritingSample class
+        :type samples: list[handwriting_sample.HandwritingSample]
+        :param sampling_rate: target sampling rate [Hz]
+        :type sampling_rate: float
+        :param time_scale: OPTIONAL, DEFAULT = None (inferred from the data, see get_time_scales)
+                           Number of time units per second
+        :type time_scale: float
+        :param columns: OPTIONAL, interpolated variables, DEFAULT = x, y, azimuth, tilt, pressure
+        :type columns: list[str]
+        :return: resampled variables of all samples (concatenated, incl. time and pen status),
+                 start and end indices (exclusive) of the resampled strokes, sample index of the strokes,
+                 sampling period of the samples (in their time units)
+        :rtype: dict[str, np.array], np.array, np.array, np.array, np.array
+        """
+
+        # Check input
+        if not cls._is_number(sampling_rate) or sampling_rate <= 0:
+            raise ValueError(f"Sampling rate must be a positive number!")
+        if time_scale is not None and (not cls._is_number(time_scale) or time_scale <= 0):
+            raise ValueError(f"Time scale must be a positive number!")
+
+        # Get the sampling period of each sample (in its time units)
+        periods = cls.get_time_scales(samples, time_scale=time_scale) / sampling_rate
+
+        # Concatenate the variables
+        lengths = np.array([len(sample.time) for sample in samples], dtype=np.int64)
+        sample_starts = np.cumsum(lengths) - lengths
+        columns = columns or [cls.AXIS_X, cls.AXIS_Y, cls.AZIMUTH, cls.TILT, cls.PRESSURE]
+
+        time = np.concatenate([np.asarray(sample.time, dtype=float) for sample in samples]) if samples else np.empty(0)
+        pen_status = np.concatenate([np.asarray(sample.pen_status) for sample in samples]) if samples else np.empty(0)
+
+        # Get the strokes (a new stroke also starts with each sample)
+        starts, ends = cls.stroke_bounds(pen_status, sample_starts[lengths > 0])
+        stroke_samples = np.searchsorted(sample_starts, starts, side="right") - 1
+        stroke_ids = np.repeat(np.arange(starts.size), ends - starts)
+
+        # Check the time
+        stroke_time = time - time[starts][stroke_ids] if time.size else time
+        if np.any(stroke_time < 0) or np.any(np.diff(stroke_time)[np.diff(stroke_ids) == 0] < 0):
+            raise ValueError(f"Time must not decrease within a stroke!")
+
+        # Prepare the uniform grid of each stroke
+        stroke_periods = periods[stroke_samples]
+        durations = time[ends - 1] - time[starts] if starts.size else np.empty(0)
+        counts = np.floor(durations / stroke_periods + 1e-9).astype(np.int64) + 1
+        new_ids = np.repeat(np.arange(starts.size), counts)
+        new_stroke_time = (np.arange(new_ids.size) - np.repeat(np.cumsum(counts) - counts, counts)) \
+            * stroke_periods[new_ids]
+
+        # Move each stroke to its own interval (interpolation never crosses a stroke boundary)
+        interval = (durations.max() if durations.size else 0) + 1
+        keys = stroke_ids * interval + stroke_time
+        new_keys = new_ids * interval + new_stroke_time
+
+        # Interpolate the variables
+        resampled = {column: np.interp(new_keys, keys,
+                                       np.concatenate([np.asarray(getattr(sample, column), dtype=float)
+                                                       for sample in samples]))
+                     for column in columns} if keys.size else {column: np.empty(0) for column in columns}
+        resampled[cls.TIME] = time[starts][new_ids] + new_stroke_time
+        resampled[cls.PEN_STATUS] = pen_status[starts][new_ids]
+
+        # Return the resampled variables and strokes
+        stroke_ends = np.cumsum(counts)
+        return resampled, stroke_ends - counts, stroke_ends, stroke_samples, periods
+
+    @classmethod
+    def get_time_scales(cls, samples, time_scale=None):
+        """
+        Gets the number of time units per second of the samples.
+
+        If not given, the unit is inferred from the data: time is taken to be in seconds if the median
+        positive time difference of the sample is lower than 0.5 (sampling above 2 Hz) and in milliseconds
+        otherwise (samples without a positive time difference are taken to be in milliseconds).
+
+        :param samples: objects of HandwritingSample class
+        :type samples: list[handwriting_sample.HandwritingSample]
+        :param time_scale: OPTIONAL, DEFAULT = None (inferred from the data)
+                           Number of time units per second of all samples
+        :type time_scale: float
+        :return: number of time units per second of the samples
+        :rtype: np.array
+        """
+        if time_scale is not None:
+            return np.full(len(samples), float(time_scale))
+
+        # Get the median positive time difference of each sample
+        periods = np.full(len(samples), np.nan)
+        for index, sample in enumerate(samples):
+            difference = np.diff(np.asarray(sample.time, dtype=float))
+            if np.any(difference > 0):
+                periods[index] = np.median(difference[difference > 0])
+
+        return cls.infer_time_scales(periods)
+
+    @classmethod
+    def infer_time_scales(cls, periods):
+        """
+        Infers the number of time units per second from the median sampling periods (see get_time_scales).
+
+        :param periods: median positive time differences (NaN if there is none)
+        :type periods: np.array
+        :return: number of time units per second (1 for seconds, 1000 for milliseconds)
+        :rtype: np.array
+        """
+        return np.where(np.asarray(periods, dtype=float) < cls.MAX_PERIOD_IN_SECONDS, 1.0, 1e3)
+
+    @staticmethod
+    def stroke_bounds(pen_status, breaks=None):
+        """
+        Gets the bounds of strokes (runs of the same pen status)
+
+        :param pen_status: pen status values
+        :type pen_status: np.array
+        :param breaks: OPTIONAL, DEFAULT = None
+                       Indices where a new stroke starts regardless of the pen status
+        :type breaks: np.array
+        :return: start indices and end indices (exclusive) of the strokes
+        :rtype: np.array, np.array
+        """
+        pen_status = np.asarray(pen_status)
+        if not pen_status.size:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        starts = np.flatnonzero(pen_status[1:] != pen_status[:-1]) + 1
+        if breaks is not None:
+            starts = np.union1d(starts, np.asarray(breaks, dtype=np.int64))
+        starts = np.union1d([0], starts).astype(np.int64)
+        starts = starts[starts < pen_status.size]
+
+        return starts, np.append(starts[1:], pen_status.size)
+
     @staticmethod
     def transform_tilt_xy_to_azimuth_and_tilt(tilt_x, tilt_y):
         """
@@ -418,45 +1330,33 @@ class HandwritingSampleTransformer(HandwritingDataBase):
         :rtype: np.array, np.array
         """
 
-        azimuth = np.zeros(len(tilt_x))
-        tilt = np.zeros(len(tilt_x))
-        idx = 0
-
-        for t_x, t_y in zip(tilt_x, tilt_y):
-            t_x = np.radians(t_x)
-            t_y = np.radians(t_y)
+        # Transform to radians
+        t_x = np.radians(np.asarray(tilt_x, dtype=float))
+        t_y = np.radians(np.asarray(tilt_y, dtype=float))
 
+        # Prepare the branches (evaluated for all points at once, the first matching one is selected)
+        branches = [
             # if both TiltX and TiltY = 0 then azimuth = 0 and tilt = pi/ 2
-            if t_x == 0 and t_y == 0:
-                azimuth[idx] = 0
-                tilt[idx] = (np.pi / 2)
-
+            ((t_x == 0) & (t_y == 0), 0, np.pi / 2),
             # if TiltX = 0 and TiltY > 0 then azimuth = pi/ 2 and tilt = pi/ 2-TiltY
-            elif t_x == 0 and t_y > 0:
-                azimuth[idx] = (np.pi / 2)
-                tilt[idx] = (np.pi / 2) - t_y
-
+            ((t_x == 0) & (t_y > 0), np.pi / 2, (np.pi / 2) - t_y),
             # if TiltX = 0 and TiltY < 0 then azimuth = 3 * pi/ 2 and tilt = pi/ 2+TiltY
-            elif t_x == 0 and t_y < 0:
-                azimuth[idx] = (3 * (np.pi / 2))
-                tilt[idx] = (np.pi / 2) + t_y
-
+            ((t_x == 0) & (t_y < 0), 3 * (np.pi / 2), (np.pi / 2) + t_y),
             # if TiltY = 0 and TiltX > 0 then azimuth = 0 and tilt = pi/ 2-TiltX
-            elif t_x > 0 and t_y == 0:
-                azimuth[idx] = 0
-                tilt[idx] = (np.pi / 2) - t_x
-
+            ((t_x > 0) & (t_y == 0), 0, (np.pi / 2) - t_x),
             # if TiltY = 0 and TiltX < 0 then azimuth = pi and tilt = pi/ 2+TiltX
-            elif t_x < 0 and t_y == 0:
-                azimuth[idx] = np.pi
-                tilt[idx] = (np.pi / 2) + t_x
-
-            # All other cases
-            else:
-                azimuth[idx] = np.arctan(np.tan(t_y) / np.tan(t_x))
-                tilt[idx] = np.arctan(np.sin(azimuth[idx]) / np.tan(t_y))
-
-            idx += 1
+            ((t_x < 0) & (t_y == 0), np.pi, (np.pi / 2) + t_x),
+        ]
+        conditions, azimuths, tilts = zip(*branches)
+
+        # All other cases (the division warnings of the masked-out points are irrelevant)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            general_azimuth = np.arctan(np.tan(t_y) / np.tan(t_x))
+            general_tilt = np.arctan(np.sin(general_azimuth) / np.tan(t_y))
+
+        # Select the values
+        azimuth = np.select(conditions, azimuths, default=general_azimuth)
+        tilt = np.select(conditions, tilts, default=general_tilt)
 
         # Transform to degrees
         azimuth = np.degrees(azimuth)
@@ -0,0 +1,405 @@
+import os
+import copy
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer.interface import HandwritingSampleTransformer
+
+
+class HandwritingSampleTransformationPipeline(HandwritingDataBase):
+    """
+    Class implementing a reusable pipeline of handwriting data transformations.
+
+    The pipeline is built once from a device configuration and an ordered list of steps.
+    A step is either a name of a built-in transformation (see ``STEPS``) or a callable
+    receiving a HandwritingSample and returning the transformed HandwritingSample (or None
+    if it transforms the sample in place). The parameters are checked and the conversion
+    constants are computed when the pipeline is built, so applying it only runs the array
+    operations. The pipeline is picklable (as long as the user-defined steps are), so it
+    can be shipped to worker processes.
+    """
+
+    # Built-in steps
+    TRANSFORM_AXIS = "transform_axis"
+    TRANSFORM_TIME_TO_SECONDS = "transform_time_to_seconds"
+    TRANSFORM_AZIMUTH = "transform_azimuth"
+    TRANSFORM_TILT = "transform_tilt"
+    NORMALIZE_PRESSURE = "normalize_pressure"
+    RESCALE_AXIS = "rescale_axis"
+
+    STEPS = [TRANSFORM_AXIS, TRANSFORM_TIME_TO_SECONDS, TRANSFORM_AZIMUTH, TRANSFORM_TILT, NORMALIZE_PRESSURE,
+             RESCALE_AXIS]
+
+    # Steps of transform_all_units
+    DEFAULT_STEPS = [TRANSFORM_AXIS, TRANSFORM_TIME_TO_SECONDS, TRANSFORM_AZIMUTH, TRANSFORM_TILT, NORMALIZE_PRESSURE]
+
+    # Device configuration (defaults of transform_all_units)
+    DEFAULT_CONFIGURATION = {
+        "conversion_type": HandwritingSampleTransformer.LPI,
+        "lpi_value": HandwritingSampleTransformer.LPI_VALUE,
+        "lpmm_value": HandwritingSampleTransformer.LPMM_VALUE,
+        "max_raw_azimuth": HandwritingSampleTransformer.MAX_AZIMUTH_VALUE,
+        "max_raw_tilt": HandwritingSampleTransformer.MAX_TILT_VALUE,
+        "max_degree_azimuth": HandwritingSampleTransformer.MAX_AZIMUTH_DEGREE,
+        "max_degree_tilt": HandwritingSampleTransformer.MAX_TILT_DEGREE,
+        "max_pressure": HandwritingSampleTransformer.MAX_PRESSURE_VALUE,
+        "pressure_levels": HandwritingSampleTransformer.PRESSURE_LEVELS,
+        "shift_to_zero": True,
+        "rescale_coef": 0.5
+    }
+
+    def __init__(self, steps=None, **configuration):
+        """
+        Initializes the HandwritingSampleTransformationPipeline object.
+
+        :param steps: ordered list of steps (built-in step names or callables), defaults to DEFAULT_STEPS
+        :type steps: list, optional
+        :param configuration: device configuration (see DEFAULT_CONFIGURATION)
+        :type configuration: dict
+        """
+
+        # Check the configuration
+        unknown = set(configuration).difference(self.DEFAULT_CONFIGURATION)
+        if unknown:
+            raise ValueError(f"Unknown configuration parameters: {sorted(unknown)}. "
+                             f"Please select from {list(self.DEFAULT_CONFIGURATION)}.")
+
+        self.configuration = {**self.DEFAULT_CONFIGURATION, **configuration}
+        self._check_configuration(self.configuration)
+
+        # Check the steps
+        self.steps = list(self.DEFAULT_STEPS if steps is None else steps)
+        for step in self.steps:
+            if not callable(step) and step not in self.STEPS:
+                raise ValueError(f"Unknown step {step}. Please select from {self.STEPS} or use a callable.")
+
+        # Precompute the conversion constants
+        self._constants = self._compute_constants(self.configuration)
+
+    def __repr__(self):
+        steps = [step if isinstance(step, str) else getattr(step, "__name__", repr(step)) for step in self.steps]
+        return f"<HandwritingSampleTransformationPipeline: steps={steps}, configuration={self.configuration}>"
+
+    def __call__(self, samples):
+        return self.apply(samples)
+
+    # --------------- #
+    # Applying        #
+    # --------------- #
+
+    def apply(self, samples):
+        """
+        Applies the pipeline to a sample or to many samples.
+
+        :param samples: instance(s) of HandwritingSample
+        :type samples: HandwritingSample or iterable[HandwritingSample]
+        :return: transformed instance(s) of HandwritingSample
+        :rtype: HandwritingSample or list[HandwritingSample]
+        """
+        if isinstance(samples, HandwritingDataBase):
+            return self.apply_to_sample(samples)
+        return [self.apply_to_sample(sample) for sample in samples]
+
+    def apply_parallel(self, samples, n_jobs=None, shard_size=None):
+        """
+        Applies the pipeline to many samples on a process pool.
+
+        The variables of all samples are packed into one shared memory block, so the
+        workers read them without copying; only the shards of sample indices, the meta
+        data and the pipeline are pickled. The transformed variables are written to an
+        output shared memory block (variables whose length changes are sent back). The
+        samples are updated in place. A failure of a sample does not stop the others.
+
+        :param samples: instances of HandwritingSample
+        :type samples: iterable[HandwritingSample]
+        :param n_jobs: number of worker processes, defaults to the number of CPUs
+        :type n_jobs: int, optional
+        :param shard_size: number of samples sent to a worker at once, defaults to None (automatic)
+        :type shard_size: int, optional
+        :return: per-sample report {"index", "sample", "transformed", "error"} (in the order of the samples)
+        :rtype: list[dict]
+        """
+
+        # Prepare the samples and the shards
+        samples = list(samples)
+        n_jobs = max(1, n_jobs or os.cpu_count() or 1)
+        shard_size = shard_size or max(1, -(-len(samples) // (n_jobs * 4)))
+
+        lengths = np.array([len(sample._columns[self.TIME]) for sample in samples], dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(lengths)))
+        total = int(starts[-1])
+
+        # Lay out the variables in the input block (aligned to 8 bytes)
+        layout, size = {}, 0
+        for column in self.COLUMNS:
+            dtype = np.result_type(*{sample._columns[column].dtype for sample in samples}) if samples else np.dtype(float)
+            layout[column] = (dtype, size)
+            size += -(-total * dtype.itemsize // 8) * 8
+
+        input_memory = SharedMemory(create=True, size=max(1, size))
+        output_memory = SharedMemory(create=True, size=max(1, len(self.COLUMNS) * total * 8))
+
+        try:
+
+            # Pack the variables
+            for column, (dtype, offset) in layout.items():
+                packed = np.ndarray(total, dtype=dtype, buffer=input_memory.buf, offset=offset)
+                for sample, start, length in zip(samples, starts, lengths):
+                    packed[start:start + length] = sample._columns[column]
+                del packed
+
+            # Prepare the tasks (the meta data are copied, as the workers get pickled copies of them)
+            records = [(index, int(starts[index]), int(lengths[index]), type(sample), copy.deepcopy(sample.meta),
+                        sample._original_dtypes, sample._original_columns, sample._transformations)
+                       for index, sample in enumerate(samples)]
+            tasks = [(self, input_memory.name, output_memory.name, layout, total, records[i:i + shard_size])
+                     for i in range(0, len(records), shard_size)]
+
+            # Transform the shards
+            if n_jobs == 1 or len(tasks) <= 1:
+                results = [result for task in tasks for result in _transform_shard(task)]
+            else:
+                with ProcessPoolExecutor(max_workers=min(n_jobs, len(tasks))) as pool:
+                    results = [result for shard in pool.map(_transform_shard, tasks) for result in shard]
+
+            # Update the samples
+            outputs = np.ndarray((len(self.COLUMNS), total), dtype=float, buffer=output_memory.buf)
+            report = []
+
+            for result in results:
+                index = result["index"]
+                sample = samples[index]
+                report.append({"index": index, "sample": sample, "transformed": result["error"] is None,
+                               "error": result["error"]})
+
+                if result["error"] is not None:
+                    continue
+
+                start, end = starts[index], starts[index + 1]
+                for row, column in enumerate(self.COLUMNS):
+                    if column in result["columns"]:
+                        sample._columns[column] = result["columns"][column]
+                    else:
+                        sample._columns[column] = outputs[row, start:end].astype(result["dtypes"][column])
+
+                sample._version += 1
+                sample.meta = result["meta"]
+                sample._original_columns.update(result["original_columns"])
+                sample._transformations.extend(result["transformations"])
+            del outputs
+
+        finally:
+            packed = outputs = None
+            for memory in (input_memory, output_memory):
+                _close_memory(memory)
+                memory.unlink()
+
+        failed = sum(not record["transformed"] for record in report)
+        self.log(f"Transformed {len(report) - failed} samples, {failed} failed", be_verbose=False, is_verbose=True)
+
+        # Return the report
+        return report
+
+    def apply_to_sample(self, sample):
+        """
+        Applies the pipeline to a sample.
+
+        :param sample: instance of HandwritingSample
+        :type sample: HandwritingSample
+        :return: transformed instance of HandwritingSample
+        :rtype: HandwritingSample
+        """
+        for step in self.steps:
+            if callable(step):
+                result = step(sample)
+                sample = sample if result is None else result
+            else:
+                getattr(self, f"_{step}")(sample)
+        return sample
+
+    # --------------- #
+    # Built-in steps  #
+    # --------------- #
+
+    def _transform_axis(self, sample):
+        """Transforms X,Y axis to millimeters (see HandwritingSampleTransformer.transform_axis)"""
+        scale = self._constants["axis"]
+        conversion_type, lpi_value = self.configuration["conversion_type"], self.configuration["lpi_value"]
+        shift_to_zero = self.configuration["shift_to_zero"]
+
+        columns = {}
+        for column in (self.AXIS_X, self.AXIS_Y):
+            values = HandwritingSampleTransformer.convert_axis_to_mm(getattr(sample, column), conversion_type,
+                                                                     lpi_value)
+
+            shift = values.min() if shift_to_zero and values.size else 0
+            if shift_to_zero:
+                np.subtract(values, shift, out=values)
+
+            columns[column] = (values, scale, -shift)
+
+        sample._apply_transformation(
+            "transform_axis",
+            {"conversion_type": conversion_type,
+             "lpi_value": lpi_value,
+             "lpmm_value": self.configuration["lpmm_value"],
+             "shift_to_zero": shift_to_zero},
+            columns)
+
+    def _transform_time_to_seconds(self, sample):
+        """Transforms time to seconds (see HandwritingSampleTransformer.transform_time_to_seconds)"""
+        start = sample.time[0] if len(sample.time) else 0
+        values = HandwritingSampleTransformer.transform_time_to_seconds(np.asarray(sample.time, dtype=float))
+        sample._apply_transformation("transform_time_to_seconds", {}, {self.TIME: (values, 1 / 1e3, -start / 1e3)})
+
+    def _transform_azimuth(self, sample):
+        """Transforms azimuth to degrees (see HandwritingSampleTransformer.transform_angle)"""
+        self._transform_angle(sample, self.AZIMUTH, self.configuration["max_raw_azimuth"],
+                              self.configuration["max_degree_azimuth"])
+
+    def _transform_tilt(self, sample):
+        """Transforms tilt to degrees (see HandwritingSampleTransformer.transform_angle)"""
+        self._transform_angle(sample, self.TILT, self.configuration["max_raw_tilt"],
+                              self.configuration["max_degree_tilt"])
+
+    def _transform_angle(self, sample, angle, max_raw_value, max_degree_value):
+        """Transforms the angle to degrees"""
+        sample._apply_transformation(
+            "transform_angle",
+            {"angle": angle, "max_raw_value": max_raw_value, "max_degree_value": max_degree_value},
+            {angle: (HandwritingSampleTransformer.transform_angle(getattr(sample, angle), max_raw_value,
+                                                                  max_degree_value),
+                     self._constants[angle], 0)})
+
+    def _normalize_pressure(self, sample):
+        """Normalizes pressure (see HandwritingSampleTransformer.normalize_pressure)"""
+        max_pressure, pressure_levels = self.configuration["max_pressure"], self.configuration["pressure_levels"]
+        values = HandwritingSampleTransformer.normalize_pressure(sample.pressure, max_value=max_pressure,
+                                                                 pressure_levels=pressure_levels)
+        sample._apply_transformation(
+            "normalize_pressure",
+            {"max_value": max_pressure, "pressure_levels": pressure_levels},
+            {self.PRESSURE: (values, self._constants["pressure"], 0)})
+
+    def _rescale_axis(self, sample):
+        """Rescales axis values (see HandwritingSampleTransformer.rescale_axis)"""
+        coef = self.configuration["rescale_coef"]
+        sample._apply_transformation(
+            "rescale_axis",
+            {"rescale_coef": coef},
+            {self.AXIS_X: (sample.x * coef, coef, 0), self.AXIS_Y: (sample.y * coef, coef, 0)})
+
+    # --------------- #
+    # Utility methods #
+    # --------------- #
+
+    @classmethod
+    def _check_configuration(cls, configuration):
+        """Checks the device configuration"""
+
+        # Check the conversion type
+        conversion_type = configuration["conversion_type"]
+        if conversion_type == HandwritingSampleTransformer.LPMM:
+            raise NotImplementedError(f"Do not supporting this conversion anymore, due to incorrect formula.")
+        if conversion_type not in (HandwritingSampleTransformer.LPI, HandwritingSampleTransformer.MM):
+            raise ValueError(f"Unknown conversion type {conversion_type}")
+
+        # Check the values
+        for name in ("lpi_value", "lpmm_value"):
+            if not isinstance(configuration[name], int):
+                raise ValueError(f"{name} must be int not {type(configuration[name])}.")
+        for name in ("max_raw_azimuth", "max_raw_tilt", "max_degree_azimuth", "max_degree_tilt", "max_pressure",
+                     "pressure_levels", "rescale_coef"):
+            if not HandwritingSampleTransformer._is_number(configuration[name]):
+                raise ValueError(f"{name} is not number!")
+        for name in ("lpi_value", "max_raw_azimuth", "max_raw_tilt", "max_pressure"):
+            if configuration[name] == 0:
+                raise ValueError(f"{name} must not be 0!")
+
+    @classmethod
+    def _compute_constants(cls, configuration):
+        """Computes the conversion constants"""
+
+        # Return the constants (scales recorded with the transformations)
+        return {
+            "axis": HandwritingSampleTransformer.get_axis_scale(configuration["conversion_type"],
+                                                                configuration["lpi_value"]),
+            "azimuth": configuration["max_degree_azimuth"] / configuration["max_raw_azimuth"],
+            "tilt": configuration["max_degree_tilt"] / configuration["max_raw_tilt"],
+            "pressure": configuration["pressure_levels"] / configuration["max_pressure"]
+        }
+
+
+# ------------------ #
+# Worker processes   #
+# ------------------ #
+
+def _transform_shard(task):
+    """Transforms a shard of the samples packed in the shared memory (module-level to be usable by worker processes)"""
+
+    # Unpack the task
+    pipeline, input_name, output_name, layout, total, records = task
+
+    # Attach the shared memory
+    input_memory, output_memory = SharedMemory(name=input_name), SharedMemory(name=output_name)
+    try:
+        return _transform_shared_samples(pipeline, input_memory, output_memory, layout, total, records)
+    finally:
+        _close_memory(input_memory)
+        _close_memory(output_memory)
+
+
+def _close_memory(memory):
+    """Closes the shared memory (a view kept alive by a raised exception must not replace the exception)"""
+    try:
+        memory.close()
+    except BufferError:
+        pass
+
+
+def _transform_shared_samples(pipeline, input_memory, output_memory, layout, total, records):
+    """Transforms the samples (the views of the shared memory are dropped before returning or raising)"""
+    inputs = {column: np.ndarray(total, dtype=dtype, buffer=input_memory.buf, offset=offset)
+              for column, (dtype, offset) in layout.items()}
+    outputs = np.ndarray((len(pipeline.COLUMNS), total), dtype=float, buffer=output_memory.buf)
+
+    try:
+        results = []
+        for index, start, length, sample_class, meta, original_dtypes, original_columns, transformations in records:
+            result = {"index": index, "error": None, "columns": {}, "dtypes": {}}
+
+            try:
+
+                # Create the sample from the views of the shared memory
+                sample = sample_class._from_arrays(
+                    {column: values[start:start + length] for column, values in inputs.items()},
+                    meta, original_dtypes, original_columns, transformations)
+
+                # Transform the sample
+                sample = pipeline.apply_to_sample(sample)
+
+                # Store the variables (the variables of another length or type are sent back)
+                for row, column in enumerate(pipeline.COLUMNS):
+                    values = np.asarray(sample._columns[column])
+                    if len(values) == length and values.dtype.kind in "biuf":
+                        outputs[row, start:start + length] = values
+                        result["dtypes"][column] = values.dtype
+                    else:
+                        result["columns"][column] = np.array(values)
+
+                result["meta"] = sample.meta
+                result["original_columns"] = {column: np.array(values)
+                                              for column, values in sample._original_columns.items()
+                                              if column not in original_columns}
+                result["transformations"] = sample._transformations[len(transformations):]
+
+            except Exception as e:
+                result["error"] = f"{type(e).__name__}: {e}"
+
+            results.append(result)
+
+    finally:
+        inputs = outputs = sample = values = None
+
+    return results
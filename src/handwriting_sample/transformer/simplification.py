@@ -0,0 +1,213 @@
+import numpy as np
+from handwriting_sample.base import HandwritingDataBase
+from handwriting_sample.transformer.interface import HandwritingSampleTransformer
+
+
+class HandwritingSampleSimplifier(HandwritingDataBase):
+    """
+    Class implementing the simplification (decimation) of handwriting samples.
+
+    Every stroke is simplified independently (its first and last points are always kept),
+    and the simplified sample holds all handwriting variables at the retained indices.
+    """
+
+    # Simplification methods
+    DOUGLAS_PEUCKER = "douglas_peucker"
+    STRIDE = "stride"
+    MIN_MAX = "min_max"
+
+    METHODS = [DOUGLAS_PEUCKER, STRIDE, MIN_MAX]
+
+    @classmethod
+    def simplify(cls, sample, method=DOUGLAS_PEUCKER, tolerance=None, stride=None, bucket_size=None):
+        """
+        Simplifies the sample.
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param method: OPTIONAL ["douglas_peucker"|"stride"|"min_max"], DEFAULT="douglas_peucker"
+        :type method: str
+        :param tolerance: maximal distance of the removed points from the simplified trajectory (douglas_peucker)
+        :type tolerance: float
+        :param stride: every stride-th point of a stroke is kept (stride)
+        :type stride: int
+        :param bucket_size: the points with the min/max X and Y of each bucket of a stroke are kept (min_max)
+        :type bucket_size: int
+        :return: simplified object of HandwritingSample class
+        :rtype: handwriting_sample.HandwritingSample
+        """
+
+        # Get the strokes
+        starts, ends = HandwritingSampleTransformer.stroke_bounds(sample.pen_status)
+
+        # Get the retained indices
+        if method == cls.DOUGLAS_PEUCKER:
+            keep = cls.douglas_peucker_mask(sample.x, sample.y, starts, ends, tolerance)
+        elif method == cls.STRIDE:
+            keep = cls.stride_mask(starts, ends, stride)
+        elif method == cls.MIN_MAX:
+            keep = cls.min_max_mask([sample.x, sample.y], starts, ends, bucket_size)
+        else:
+            raise ValueError(f"Unknown simplification method {method}. Please select from {cls.METHODS}.")
+
+        # Return a new instance of HandwritingSample with the retained points only
+        return cls.select(sample, keep)
+
+    @classmethod
+    def select(cls, sample, keep):
+        """
+        Selects the points of the sample.
+
+        The kept original values are selected by the same mask. The original values of another length
+        (kept before a step changing the number of points, e.g. resampling) no longer map to the points,
+        so they are carried unchanged and the row mapping is lost.
+
+        :param sample: object of HandwritingSample class
+        :type sample: handwriting_sample.HandwritingSample
+        :param keep: boolean mask or indices of the retained points
+        :type keep: np.array
+        :return: new object of HandwritingSample class with the selected points
+        :rtype: handwriting_sample.HandwritingSample
+        """
+        return type(sample)._from_arrays(
+            {column: np.asarray(getattr(sample, column))[keep] for column in cls.COLUMNS},
+            meta_data=dict(sample.meta) if sample.meta else sample.meta,
+            original_dtypes=sample._original_dtypes,
+            original_columns=sample._get_original_rows(keep),
+            transformations=[dict(transformation) for transformation in sample._transformations])
+
+    # ------------------ #
+    # Retained points    #
+    # ------------------ #
+
+    @classmethod
+    def douglas_peucker_mask(cls, x, y, starts, ends, tolerance):
+        """
+        Gets the points retained by the Douglas-Peucker algorithm (iterative, one stack for all strokes).
+
+        :param x: X axis
+        :type x: np.array
+        :param y: Y axis
+        :type y: np.array
+        :param starts: start indices of the strokes
+        :type starts: np.array
+        :param ends: end indices (exclusive) of the strokes
+        :type ends: np.array
+        :param tolerance: maximal distance of the removed points from the simplified trajectory
+        :type tolerance: float
+        :return: retained points
+        :rtype: np.array[bool]
+        """
+
+        # Check input
+        if not HandwritingSampleTransformer._is_number(tolerance) or tolerance < 0:
+            raise ValueError(f"Tolerance must be a non-negative number!")
+
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+
+        # Keep the first and the last points of the strokes
+        keep = cls._stroke_ends_mask(x.size, starts, ends)
+
+        # Split the segments until all their points are within the tolerance
+        stack = [(start, end - 1) for start, end in zip(starts.tolist(), ends.tolist()) if end - start > 2]
+
+        while stack:
+            first, last = stack.pop()
+
+            # Get the distances of the inner points from the segment
+            dx, dy = x[last] - x[first], y[last] - y[first]
+            px, py = x[first + 1:last] - x[first], y[first + 1:last] - y[first]
+            norm = np.hypot(dx, dy)
+
+            if norm:
+                distances = np.abs(dy * px - dx * py) / norm
+            else:
+                distances = np.hypot(px, py)
+
+            # Keep the farthest point and split the segment
+            index = int(np.argmax(distances))
+            if distances[index] > tolerance:
+                index += first + 1
+                keep[index] = True
+                if index - first > 1:
+                    stack.append((first, index))
+                if last - index > 1:
+                    stack.append((index, last))
+
+        return keep
+
+    @classmethod
+    def stride_mask(cls, starts, ends, stride):
+        """
+        Gets every stride-th point of the strokes (and their last points).
+
+        :param starts: start indices of the strokes
+        :type starts: np.array
+        :param ends: end indices (exclusive) of the strokes
+        :type ends: np.array
+        :param stride: stride of the retained points
+        :type stride: int
+        :return: retained points
+        :rtype: np.array[bool]
+        """
+
+        # Check input
+        if not isinstance(stride, (int, np.integer)) or stride < 1:
+            raise ValueError(f"Stride must be a positive integer!")
+
+        # Keep every stride-th point of each stroke
+        size = int(ends[-1]) if ends.size else 0
+        positions = np.arange(size) - np.repeat(starts, ends - starts)
+        return (positions % stride == 0) | cls._stroke_ends_mask(size, starts, ends)
+
+    @classmethod
+    def min_max_mask(cls, variables, starts, ends, bucket_size):
+        """
+        Gets the points with the minimal and maximal values of the variables in the buckets of the strokes.
+
+        :param variables: variables to keep the extremes of (e.g. X and Y axis)
+        :type variables: list[np.array]
+        :param starts: start indices of the strokes
+        :type starts: np.array
+        :param ends: end indices (exclusive) of the strokes
+        :type ends: np.array
+        :param bucket_size: number of points of a bucket
+        :type bucket_size: int
+        :return: retained points
+        :rtype: np.array[bool]
+        """
+
+        # Check input
+        if not isinstance(bucket_size, (int, np.integer)) or bucket_size < 1:
+            raise ValueError(f"Bucket size must be a positive integer!")
+
+        # Get the bucket of each point (buckets do not cross the strokes)
+        size = int(ends[-1]) if ends.size else 0
+        lengths = ends - starts
+        bucket_counts = -(-lengths // bucket_size)
+        positions = np.arange(size) - np.repeat(starts, lengths)
+        buckets = np.repeat(np.cumsum(bucket_counts) - bucket_counts, lengths) + positions // bucket_size
+
+        # Keep the extremes of each bucket
+        keep = cls._stroke_ends_mask(size, starts, ends)
+        for values in variables:
+            order = np.lexsort((np.asarray(values), buckets))
+            group_starts = np.flatnonzero(np.diff(buckets[order], prepend=-1))
+            group_ends = np.append(group_starts[1:], size) - 1
+            keep[order[group_starts]] = True
+            keep[order[group_ends]] = True
+
+        return keep
+
+    # --------------- #
+    # Utility methods #
+    # --------------- #
+
+    @staticmethod
+    def _stroke_ends_mask(size, starts, ends):
+        """Returns the mask of the first and the last points of the strokes"""
+        keep = np.zeros(size, dtype=bool)
+        keep[starts] = True
+        keep[ends - 1] = True
+        return keep
@@ -1,18 +1,24 @@
 import os
 from datetime import datetime
-from handwriting_sample.base import LoggableObject
-from handwriting_sample.writer.writers import JSONFileWriter, SVCFileWriter
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from handwriting_sample.base import LoggableObject, HandwritingDataBase
+from handwriting_sample.writer.writers import JSONFileWriter, JSONLinesFileWriter, SVCFileWriter
 
 
 class HandwritingSampleWriter(LoggableObject):
     """Class implementing handwriting data writer"""
 
+    # Supported file formats
+    JSON = "json"
+    SVC = "svc"
+
     # --------------- #
     # Writing methods #
     # --------------- #
     # TODO: idea: there is some common functionality in store_... methods that may be taken out into a common method
 
-    def write_to_json(self, sample, save_path, file_name=None, store_original_data=False, verbose=False):
+    def write_to_json(self, sample, save_path, file_name=None, store_original_data=False, verbose=False,
+                      timestamp=None):
         """
         Stores HandwritingSample data to a JSON file.
 
@@ -26,6 +32,8 @@ class HandwritingSampleWriter(LoggableObject):
         :type store_original_data: bool, optional
         :param verbose: verbosity of the logging, defaults to False
         :type verbose: bool, optional
+        :param timestamp: writing time stored in the meta data, defaults to now
+        :type timestamp: str, optional
         :return: True if stored, False otherwise
         :rtype: bool
         """
@@ -36,7 +44,7 @@ class HandwritingSampleWriter(LoggableObject):
 
         # Prepare and validate the data and meta data
         data = sample.validator.validate_data(data, verbose=verbose)
-        meta = self._prepare_meta_data(sample, meta)
+        meta = self._prepare_meta_data(sample, meta, timestamp=timestamp)
 
         # If the filename is not set, create a default one
         if not file_name and meta:
@@ -45,13 +53,44 @@ class HandwritingSampleWriter(LoggableObject):
         # Update the save_path
         save_path = os.path.join(save_path, f"{file_name}.json")
 
-        # Prepare the data to be stored
-        data = data.to_dict("list")
+        # Prepare the data to be stored (the columns are streamed from the arrays)
+        data = {column: data[column].to_numpy() for column in data.columns}
+
+        # Write the data
+        return JSONFileWriter.write_stream(save_path, data, meta=meta, verbose=verbose)
+
+    def write_to_json_lines(self, sample, save_path, store_original_data=False, verbose=False):
+        """
+        Appends HandwritingSample data as a new line of a JSON Lines file.
+
+        :param sample: instance of handwriting sample
+        :type sample: HandwritingSample
+        :param save_path: path to the JSON Lines file
+        :type save_path: str
+        :param store_original_data: store original data, defaults to False
+        :type store_original_data: bool, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: True if stored, False otherwise
+        :rtype: bool
+        """
+
+        # Get the data and meta data from the handwriting sample
+        data = sample.original_data_pandas_dataframe if store_original_data else sample.data_pandas_dataframe
+        meta = sample.meta
+
+        # Prepare and validate the data and meta data
+        data = sample.validator.validate_data(data, verbose=verbose)
+        meta = self._prepare_meta_data(sample, meta)
+
+        # Prepare the data to be stored (the columns are streamed from the arrays)
+        data = {column: data[column].to_numpy() for column in data.columns}
 
         # Write the data
-        return JSONFileWriter.write(save_path, data, meta=meta, verbose=verbose)
+        return JSONLinesFileWriter.write(save_path, data, meta=meta, verbose=verbose)
 
-    def write_to_svc(self, sample, save_path, file_name=None, store_original_data=False, verbose=False):
+    def write_to_svc(self, sample, save_path, file_name=None, store_original_data=False, verbose=False,
+                    timestamp=None):
         """
         Stores HandwritingSample data to an SVC file.
 
@@ -65,6 +104,8 @@ class HandwritingSampleWriter(LoggableObject):
         :type store_original_data: bool, optional
         :param verbose: verbosity of the logging, defaults to False
         :type verbose: bool, optional
+        :param timestamp: writing time stored in the meta data, defaults to now
+        :type timestamp: str, optional
         :return: True if stored, False otherwise
         :rtype: bool
         """
@@ -75,7 +116,7 @@ class HandwritingSampleWriter(LoggableObject):
 
         # Prepare and validate the data and meta data
         data = sample.validator.validate_data(data)
-        meta = self._prepare_meta_data(sample, meta)
+        meta = self._prepare_meta_data(sample, meta, timestamp=timestamp)
 
         # If the filename is not set, create a default one
         if not file_name and meta:
@@ -96,20 +137,84 @@ class HandwritingSampleWriter(LoggableObject):
         # Write the data
         return SVCFileWriter.write(save_path, data, meta=meta, verbose=verbose)
 
+    def _get_file_path(self, sample, save_path, file_format, file_name=None):
+        """Gets the path of the file the sample is going to be stored to"""
+        if not file_name and sample.meta:
+            file_name = self._collect_file_name(sample.meta)
+        return os.path.join(save_path, f"{file_name}.{file_format}")
+
+    def write_batch(self, samples, save_path, file_format=JSON, file_names=None, store_original_data=False,
+                    n_jobs=4, use_processes=False, verbose=False):
+        """
+        Stores many HandwritingSample objects to JSON or SVC files on a worker pool.
+
+        Each file is written to a temporary name and renamed into place, so a failure
+        never leaves a partially written file. The writing timestamp is computed once
+        for the whole batch.
+
+        :param samples: instances of handwriting sample
+        :type samples: iterable[HandwritingSample]
+        :param save_path: save path
+        :type save_path: str
+        :param file_format: OPTIONAL ["json"|"svc"], DEFAULT="json"
+        :type file_format: str
+        :param file_names: file names (optional if meta data), defaults to None
+        :type file_names: list[str], optional
+        :param store_original_data: store original data, defaults to False
+        :type store_original_data: bool, optional
+        :param n_jobs: number of workers, defaults to 4
+        :type n_jobs: int, optional
+        :param use_processes: use worker processes instead of threads, defaults to False
+        :type use_processes: bool, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: per-sample report {"index", "path", "stored", "error"} (in the order of the samples)
+        :rtype: list[dict]
+        """
+
+        # Check input
+        if file_format not in (self.JSON, self.SVC):
+            raise ValueError(f"Unknown file format {file_format}, please select from {[self.JSON, self.SVC]}")
+
+        # Prepare the samples, file names and the common timestamp
+        samples = list(samples)
+        file_names = list(file_names) if file_names else [None] * len(samples)
+        timestamp = datetime.utcnow().strftime(HandwritingDataBase.DATE_FORMAT)
+
+        if len(file_names) != len(samples):
+            raise ValueError(f"Number of file names ({len(file_names)}) does not match "
+                             f"the number of samples ({len(samples)})")
+
+        # Prepare the tasks
+        tasks = [(self, index, sample, save_path, file_format, file_name, store_original_data, timestamp)
+                 for index, (sample, file_name) in enumerate(zip(samples, file_names))]
+
+        # Write the samples
+        executor = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor(max_workers=max(1, n_jobs)) as pool:
+            report = list(pool.map(_write_sample, tasks))
+
+        failed = sum(not record["stored"] for record in report)
+        self.log(f"Stored {len(report) - failed} samples to {save_path}, {failed} failed", be_verbose=verbose)
+
+        # Return the report
+        return report
+
     # --------------- #
     # Utility methods #
     # --------------- #
 
     @classmethod
-    def _prepare_meta_data(cls, sample, meta_data=None):
+    def _prepare_meta_data(cls, sample, meta_data=None, timestamp=None):
         """Prepares the meta data before writing"""
 
         # Handle no meta data
         meta_data = meta_data if meta_data else {}
 
         # Create or update the timestamps
-        meta_data["written_on"] = datetime.utcnow().strftime(sample.DATE_FORMAT)
-        meta_data["created_on"] = datetime.utcnow().strftime(sample.DATE_FORMAT) \
+        timestamp = timestamp or datetime.utcnow().strftime(sample.DATE_FORMAT)
+        meta_data["written_on"] = timestamp
+        meta_data["created_on"] = timestamp \
             if not meta_data.get("created_on", None) \
             else meta_data.get("created_on", None)
 
@@ -144,3 +249,24 @@ class HandwritingSampleWriter(LoggableObject):
 
         # Return the filename
         return file_name
+
+
+def _write_sample(task):
+    """Writes one sample of a batch and reports the result (module-level to be usable by worker processes)"""
+
+    # Unpack the task
+    writer, index, sample, save_path, file_format, file_name, store_original_data, timestamp = task
+
+    # Prepare the record
+    record = {"index": index, "path": None, "stored": False, "error": None}
+
+    try:
+        write = writer.write_to_json if file_format == writer.JSON else writer.write_to_svc
+        write(sample, save_path, file_name=file_name, store_original_data=store_original_data, timestamp=timestamp)
+        record["path"] = writer._get_file_path(sample, save_path, file_format, file_name)
+        record["stored"] = True
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+
+    # Return the record
+    return record
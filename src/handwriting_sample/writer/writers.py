@@ -1,7 +1,57 @@
+import os
 import json
+import secrets
+from contextlib import contextmanager
 from handwriting_sample.base import LoggableObject
 
 
+# Size of the output buffers (1 MiB)
+BUFFER_SIZE = 1 << 20
+
+# Number of values serialized at once by the streaming JSON writers
+CHUNK_SIZE = 1 << 16
+
+
+@contextmanager
+def atomic_open(path, buffering=BUFFER_SIZE):
+    """
+    Opens a temporary file next to the path and renames it into place once the writing succeeds.
+
+    The replaced file keeps its permissions; a new file is created with the default mode
+    (0o666 masked by the umask of the process, as by open).
+
+    :param path: path of the final file
+    :type path: str
+    :param buffering: size of the output buffer, defaults to BUFFER_SIZE
+    :type buffering: int, optional
+    :return: file object opened for writing
+    :rtype: file object
+    """
+
+    # Create the temporary file in the same directory (the rename must stay on the same file system)
+    while True:
+        temp_path = os.path.join(os.path.dirname(path) or ".",
+                                 f".{os.path.basename(path)}.{secrets.token_hex(4)}.tmp")
+        try:
+            descriptor = os.open(temp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with os.fdopen(descriptor, "w", buffering=buffering) as f:
+            yield f
+
+        # Keep the permissions of the replaced file
+        if os.path.exists(path):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o7777)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
 # ------------ #
 # File writers #
 # ------------ #
@@ -13,14 +63,79 @@ class JSONFileWriter(LoggableObject):
     def write(cls, path, data, meta=None, verbose=False):
         """Writes the handwriting data and meta data to a JSON file"""
         try:
-            with open(path, "w") as f:
+            with atomic_open(path) as f:
                 json.dump({"meta_data": meta, "data": data}, f)
-                cls.log(f"Data stored in a JSON file: {path}", be_verbose=verbose)
-                return True
+            cls.log(f"Data stored in a JSON file: {path}", be_verbose=verbose)
+            return True
         except Exception as e:
             cls.log(f"Unable to store to a JSON file: {path} due to {e}")
             raise
 
+    @classmethod
+    def write_stream(cls, path, columns, meta=None, chunk_size=CHUNK_SIZE, verbose=False):
+        """
+        Writes the handwriting data and meta data to a JSON file column by column.
+
+        The output is identical to ``write`` called with the dict-of-lists data, but the
+        columns are serialized from the arrays in chunks, so only ``chunk_size`` Python
+        objects exist at a time.
+
+        :param path: path to the JSON file
+        :type path: str
+        :param columns: handwriting data (column name -> 1D array)
+        :type columns: dict[str, np.ndarray]
+        :param meta: meta data, defaults to None
+        :type meta: dict, optional
+        :param chunk_size: number of values serialized at once, defaults to CHUNK_SIZE
+        :type chunk_size: int, optional
+        :param verbose: verbosity of the logging, defaults to False
+        :type verbose: bool, optional
+        :return: True if stored
+        :rtype: bool
+        """
+        try:
+            with atomic_open(path) as f:
+                f.write(f'{{"meta_data": {json.dumps(meta)}, "data": ')
+                cls._write_columns(f, columns, chunk_size)
+                f.write("}")
+            cls.log(f"Data stored in a JSON file: {path}", be_verbose=verbose)
+            return True
+        except Exception as e:
+            cls.log(f"Unable to store to a JSON file: {path} due to {e}")
+            raise
+
+    @classmethod
+    def _write_columns(cls, f, columns, chunk_size=CHUNK_SIZE):
+        """Writes the columns as a JSON object of lists (chunk by chunk)"""
+        f.write("{")
+        for i, (name, values) in enumerate(columns.items()):
+            f.write(f"{', ' if i else ''}{json.dumps(name)}: [")
+            for start in range(0, len(values), chunk_size):
+                chunk = json.dumps(values[start:start + chunk_size].tolist())[1:-1]
+                f.write(f"{', ' if start else ''}{chunk}")
+            f.write("]")
+        f.write("}")
+
+
+class JSONLinesFileWriter(LoggableObject):
+    """Class implementing JSON Lines file writer (one sample per line)"""
+
+    @classmethod
+    def write(cls, path, columns, meta=None, chunk_size=CHUNK_SIZE, verbose=False):
+        """Appends the handwriting data (column name -> 1D array) and meta data as a new line of a JSON Lines file"""
+        try:
+            with open(path, "a", buffering=BUFFER_SIZE) as f:
+
+                # Meta data go first, so that the readers can filter the records without decoding the data
+                f.write(f'{{"meta_data": {json.dumps(meta)}, "data": ')
+                JSONFileWriter._write_columns(f, columns, chunk_size)
+                f.write("}\n")
+                cls.log(f"Data appended to a JSON Lines file: {path}", be_verbose=verbose, is_verbose=True)
+                return True
+        except Exception as e:
+            cls.log(f"Unable to append to a JSON Lines file: {path} due to {e}")
+            raise
+
 
 class SVCFileWriter(LoggableObject):
     """Class implementing SVC file writer"""
@@ -29,10 +144,11 @@ class SVCFileWriter(LoggableObject):
     def write(cls, path, data, meta=None, verbose=False):
         """Writes the handwriting data and meta data to an SVC file"""
         try:
-            with open(path, "w") as f:
+            with atomic_open(path) as f:
                 f.writelines(f"{meta.get('samples_count')}\n")
                 f.writelines(data)
-                cls.log(f"Data stored in an SVC file: {path}", be_verbose=verbose)
+            cls.log(f"Data stored in an SVC file: {path}", be_verbose=verbose)
+            return True
         except Exception as e:
             cls.log(f"Unable to store to an SVC file: {path} due to {e}")
             raise